@@ -0,0 +1,36 @@
+from collections.abc import Iterable
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+from sqlmodel import SQLModel
+
+# =============================================================================
+# Relationship Loading Options.
+# =============================================================================
+
+
+def relationship_options(
+    model: type[SQLModel], include: Iterable[str] = ()
+) -> list[ExecutableOption]:
+    """
+    Build loader options that override the models' `lazy="selectin"` default.
+
+    Only the relationships named in `include` are loaded (via
+    `selectinload`). Every other relationship on `model` is set to
+    `raiseload`, so accidental access fails loudly instead of issuing
+    hidden queries.
+
+    Args:
+        model:
+            The mapped model at the root of the query.
+        include:
+            Relationship attribute names to load eagerly.
+
+    Returns:
+        Options to pass to `select(...).options(*options)`.
+    """
+    options: list[ExecutableOption] = [
+        selectinload(getattr(model, name)) for name in include
+    ]
+    options.append(raiseload("*"))
+    return options
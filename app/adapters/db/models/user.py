@@ -2,7 +2,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pydantic import EmailStr
-from sqlalchemy import Column, Enum, String
+from sqlalchemy import Column, Enum, Index, String
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.shared.datetime.utc_now import datetime, get_utc_now
@@ -10,6 +10,7 @@ from app.shared.enums._base import get_enum_values
 from app.shared.enums.permission import PermissionEnum
 from app.shared.enums.role import RoleEnum
 from app.shared.enums.user import UserStatusEnum
+from app.shared.rbac.index import rbac_index
 
 from ._mixins import TimestampMixin, UUIDv7Mixin
 
@@ -64,6 +65,10 @@ class UserBase(SQLModel, table=False):
 
 class User(TimestampMixin, UserBase, UUIDv7Mixin, table=True):
     __tablename__ = "users"  # type: ignore
+    __table_args__ = (
+        # Backs keyset pagination ordered by (created_at, id).
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     is_email_verified: bool = Field(default=False, nullable=False)
     email_verified_at: datetime | None = Field(default=None)
@@ -116,4 +121,7 @@ class User(TimestampMixin, UserBase, UUIDv7Mixin, table=True):
         if self.is_superadmin():
             return True
 
+        if rbac_index.is_loaded:
+            return rbac_index.allows(self.role_names, permission)
+
         return permission in self.permission_codes
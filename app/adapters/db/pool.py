@@ -0,0 +1,165 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+# =============================================================================
+# Pool Constants.
+# =============================================================================
+
+# Upper bounds (ms) of the checkout wait histogram buckets, last one is +inf.
+WAIT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+CHECKED_IN_AT = "checked_in_at"
+
+
+# =============================================================================
+# Db Pool Stats.
+# =============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class DbPoolStats:
+    size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    wait_histogram: dict[str, int]
+
+
+# =============================================================================
+# Checkout Wait Histogram.
+# =============================================================================
+
+
+class WaitHistogram:
+    """
+    Fixed-bucket histogram of pool checkout wait times.
+    """
+
+    __slots__ = ("_lock", "_counts", "_total", "_max")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._total = 0.0
+        self._max = 0.0
+
+    def observe(self, elapsed: float) -> None:
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            self._counts[bisect_left(WAIT_BUCKETS_MS, elapsed_ms)] += 1
+            self._total += elapsed_ms
+            self._max = max(self._max, elapsed_ms)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def snapshot(self) -> tuple[dict[str, int], float, float]:
+        with self._lock:
+            counts = list(self._counts)
+            total, peak = self._total, self._max
+
+        labels = [f"le_{bound:g}ms" for bound in WAIT_BUCKETS_MS] + ["le_inf"]
+        observed = sum(counts)
+        return dict(zip(labels, counts)), total / observed if observed else 0.0, peak
+
+
+# =============================================================================
+# Instrumented Async Queue Pool.
+# =============================================================================
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    `AsyncAdaptedQueuePool` that records how long each checkout waited
+    for a connection and how many checkouts timed out.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = WaitHistogram()
+        self.timeouts = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.wait_histogram.observe(perf_counter() - started_at)
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        pool = super().recreate()
+        # Keep counters across `engine.dispose()` / invalidation recreation.
+        pool.wait_histogram = self.wait_histogram  # type: ignore[attr-defined]
+        pool.timeouts = self.timeouts  # type: ignore[attr-defined]
+        return pool  # type: ignore[return-value]
+
+    def stats(self) -> DbPoolStats:
+        histogram, avg_wait_ms, max_wait_ms = self.wait_histogram.snapshot()
+        return DbPoolStats(
+            size=self.size(),
+            max_overflow=self._max_overflow,
+            checked_out=self.checkedout(),
+            checked_in=self.checkedin(),
+            # QueuePool counts overflow from -pool_size, only report extras.
+            overflow=max(self.overflow(), 0),
+            checkouts=self.wait_histogram.count,
+            timeouts=self.timeouts,
+            avg_wait_ms=avg_wait_ms,
+            max_wait_ms=max_wait_ms,
+            wait_histogram=histogram,
+        )
+
+
+# =============================================================================
+# Idle-aged Pre-ping.
+# =============================================================================
+
+
+def install_idle_pre_ping(engine: Engine, idle_seconds: float) -> None:
+    """
+    Ping a pooled connection on checkout only if it sat idle in the pool
+    for longer than `idle_seconds`.
+
+    Recently used connections skip the round-trip entirely. A failed ping
+    raises `DisconnectionError`, so the pool discards the connection and
+    transparently retries the checkout with a fresh one.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(  # pyright: ignore[reportUnusedFunction]
+        dbapi_connection: Any, connection_record: ConnectionPoolEntry
+    ) -> None:
+        connection_record.info[CHECKED_IN_AT] = monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(  # pyright: ignore[reportUnusedFunction]
+        dbapi_connection: Any,
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: Any,
+    ) -> None:
+        checked_in_at = connection_record.info.get(CHECKED_IN_AT)
+        if checked_in_at is None or monotonic() - checked_in_at < idle_seconds:
+            return
+
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            raise DisconnectionError("Idle connection failed pre-ping.") from exc
@@ -0,0 +1,118 @@
+import asyncio
+from itertools import count
+from logging import getLogger
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# Read Replica Router.
+# =============================================================================
+
+
+class ReplicaRouter:
+    """
+    Round-robin read routing across replica engines.
+
+    A background task pings every replica each `check_interval` seconds
+    and only healthy replicas take part in the rotation. With no replica
+    configured, or none healthy, reads fall back to the `primary` session
+    factory, so callers never have to care whether replicas exist.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: list[AsyncEngine],
+        *,
+        check_interval: float,
+        check_timeout: float,
+    ) -> None:
+        self.primary = primary
+        self.engines = replicas
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._factories = [
+            async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+            for engine in replicas
+        ]
+        # Optimistic until the first health check says otherwise.
+        self._healthy = [True] * len(replicas)
+        self._cursor = count()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def healthy_count(self) -> int:
+        return sum(self._healthy)
+
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        healthy = [
+            factory
+            for factory, is_healthy in zip(self._factories, self._healthy)
+            if is_healthy
+        ]
+        if not healthy:
+            return self.primary
+
+        return healthy[next(self._cursor) % len(healthy)]
+
+    async def start(self) -> None:
+        if not self.engines:
+            return
+
+        await self._check_all()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._monitor(), name="db-replica-health")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._task = None
+
+        for engine in self.engines:
+            await engine.dispose()
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self._check_all()
+
+    async def _check_all(self) -> None:
+        results = await asyncio.gather(*(self._check(e) for e in self.engines))
+
+        for index, is_healthy in enumerate(results):
+            if is_healthy != self._healthy[index]:
+                logger.warning(
+                    "Read replica %s is now %s.",
+                    self.engines[index].url.render_as_string(hide_password=True),
+                    "healthy" if is_healthy else "unhealthy",
+                )
+            self._healthy[index] = is_healthy
+
+    async def _check(self, engine: AsyncEngine) -> bool:
+        try:
+            async with asyncio.timeout(self.check_timeout):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception:
+            return False
+
+        return True
@@ -1,13 +1,16 @@
 from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import get_settings
 
+from .pool import DbPoolStats, InstrumentedAsyncPool, install_idle_pre_ping
+from .replicas import ReplicaRouter
+
 settings = get_settings()
 
 
@@ -16,18 +19,52 @@ settings = get_settings()
 # =============================================================================
 
 
-async_engine = create_async_engine(
-    url=settings.db.async_url,
-    echo=settings.app.DEBUG,
-    pool_pre_ping=True,
-)
+def _create_async_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url=url,
+        echo=settings.app.DEBUG,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db.POOL_SIZE,
+        max_overflow=settings.db.MAX_OVERFLOW,
+        pool_timeout=settings.db.POOL_TIMEOUT,
+        pool_recycle=settings.db.POOL_RECYCLE,
+        pool_pre_ping=settings.db.PRE_PING == "always",
+    )
+
+    if settings.db.PRE_PING == "idle":
+        install_idle_pre_ping(engine.sync_engine, settings.db.PRE_PING_IDLE_SECONDS)
+
+    return engine
+
+
+async_engine = _create_async_engine(settings.db.async_url)
+
+replica_engines = [_create_async_engine(url) for url in settings.db.REPLICA_URLS]
 
 sync_engine = create_engine(
     url=settings.db.sync_url,
     echo=settings.app.DEBUG,
-    pool_pre_ping=True,
+    pool_size=settings.db.POOL_SIZE,
+    max_overflow=settings.db.MAX_OVERFLOW,
+    pool_timeout=settings.db.POOL_TIMEOUT,
+    pool_recycle=settings.db.POOL_RECYCLE,
+    pool_pre_ping=settings.db.PRE_PING == "always",
 )
 
+if settings.db.PRE_PING == "idle":
+    install_idle_pre_ping(sync_engine, settings.db.PRE_PING_IDLE_SECONDS)
+
+
+# =============================================================================
+# Engine Pool Stats
+# =============================================================================
+
+
+def get_db_pool_stats() -> DbPoolStats:
+    pool = async_engine.pool
+    assert isinstance(pool, InstrumentedAsyncPool)
+    return pool.stats()
+
 
 # =============================================================================
 # Async and Sync Sessions
@@ -51,6 +88,19 @@ SyncSessionLocal = sessionmaker(
 )
 
 
+# =============================================================================
+# Read Replica Routing
+# =============================================================================
+
+
+replica_router = ReplicaRouter(
+    AsyncSessionLocal,
+    replica_engines,
+    check_interval=settings.db.REPLICA_CHECK_SECONDS,
+    check_timeout=settings.db.REPLICA_CHECK_TIMEOUT,
+)
+
+
 # =============================================================================
 # Database Initializer Functions
 # =============================================================================
@@ -76,6 +126,12 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    # Read-only work only: a healthy replica, or the primary when none is.
+    async with replica_router.session_factory()() as session:
+        yield session
+
+
 def get_sync_session() -> Generator[Session, None, None]:
     with SyncSessionLocal() as session:
         yield session
@@ -1,3 +1,5 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -44,3 +46,22 @@ class SmtpMessageAssembler:
         message.attach(MIMEText(html, "html"))
 
         return message
+
+    def assemble_many(
+        self, email_msgs: Iterable[EmailMessageDict]
+    ) -> Iterator[tuple[EmailMessageDict, MIMEMultipart | Exception]]:
+        """
+        Assemble messages grouped by template, so each template is loaded
+        once per batch. A message that fails to render is yielded with its
+        exception instead of aborting the rest of the batch.
+        """
+        groups: defaultdict[str, list[EmailMessageDict]] = defaultdict(list)
+        for email_msg in email_msgs:
+            groups[email_msg["content"]["html_template"]].append(email_msg)
+
+        for group in groups.values():
+            for email_msg in group:
+                try:
+                    yield email_msg, self.assemble(email_msg)
+                except Exception as exc:
+                    yield email_msg, exc
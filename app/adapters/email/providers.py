@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+from .renderer import JinjaRenderer
+
+# =============================================================================
+# Function that return process-wide JinjaRenderer instance.
+# =============================================================================
+
+
+@lru_cache
+def get_renderer() -> JinjaRenderer:
+    return JinjaRenderer()
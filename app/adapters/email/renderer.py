@@ -1,18 +1,124 @@
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+from functools import cache
+from logging import CRITICAL, getLogger
+from typing import Callable
 
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    select_autoescape,
+)
+from premailer import Premailer  # type: ignore
+
+from app.core.config import get_settings
+
+# =============================================================================
+# Renderer Constants.
+# =============================================================================
+
+TEMPLATES_DIR = "templates/email"
+BASE_LAYOUT = "base.html"
+BASE_STYLES = "styles/base.css"
+BASE_STYLES_INCLUDE = '{% include "styles/base.css" %}'
+
+# =============================================================================
+# Gatting Env Settings.
+# =============================================================================
+
+settings = get_settings()
+
+# =============================================================================
+# Getting Logger.
+# =============================================================================
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# CSS Inlined Base Layout Loader.
+# =============================================================================
+
+
+@cache
+def inline_layout_css(source: str, css: str) -> str:
+    """
+    Inline `css` into the layout `source` once per distinct pair.
+
+    The Jinja tags in the layout are plain text to premailer, so they come
+    out untouched. The `<style>` tag is kept for rules that target child
+    template markup, which only exists at render time.
+    """
+    html = source.replace(BASE_STYLES_INCLUDE, css)
+    try:
+        return Premailer(  # type: ignore
+            html,
+            keep_style_tags=True,
+            remove_classes=False,
+            disable_validation=True,
+            allow_network=False,
+            cssutils_logging_level=CRITICAL,
+        ).transform()
+    except Exception as exc:
+        logger.warning("CSS inlining of the email layout failed.", exc_info=exc)
+        return html
+
+
+class InlinedLayoutLoader(FileSystemLoader):
+    """
+    `FileSystemLoader` that serves the base layout with its stylesheet
+    already inlined, so inlining is paid at compile time, not per email.
+    """
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str, Callable[[], bool]]:
+        source, filename, uptodate = super().get_source(environment, template)
+
+        if template == BASE_LAYOUT:
+            css, _, _ = super().get_source(environment, BASE_STYLES)
+            source = inline_layout_css(source, css)
+
+        return source, filename, uptodate
+
+
+# =============================================================================
+# Email Renderer Classes.
+# =============================================================================
+
+
+def build_environment(loader: BaseLoader | None = None) -> Environment:
+    return Environment(
+        loader=loader or InlinedLayoutLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(["html", "xml"]),
+        undefined=StrictUndefined,
+        bytecode_cache=FileSystemBytecodeCache(settings.email.TEMPLATE_CACHE_DIR),
+        # Skip the per-render stat() of template files outside development.
+        auto_reload=settings.app.DEBUG,
+    )
 
 
 class BaseRenderer:
-    def __init__(self) -> None:
-        self._env = Environment(
-            loader=FileSystemLoader("templates/email"),
-            autoescape=select_autoescape(["html", "xml"]),
-            undefined=StrictUndefined,
-        )
+    def __init__(self, env: Environment | None = None) -> None:
+        self._env = env or build_environment()
 
     def render(self, template: str, context: dict[str, str]) -> str:
         raise NotImplementedError
 
+    def preload(self) -> None:
+        """
+        Compile every html template up front, so the first email of each
+        kind does not pay for parsing and compilation.
+        """
+        names = self._env.list_templates(
+            filter_func=lambda name: name.endswith(".html")
+        )
+        for name in names:
+            self._env.get_template(name)
+
+        logger.info("Preloaded %d email templates.", len(names))
+
 
 class JinjaRenderer(BaseRenderer):
     def render(self, template: str, context: dict[str, str]) -> str:
@@ -3,6 +3,8 @@ from email.mime.multipart import MIMEMultipart
 
 from app.core.config import get_settings
 
+from .smtp_pool import SmtpConnectionPool
+
 # =============================================================================
 # Gatting Env Settings.
 # =============================================================================
@@ -15,12 +17,36 @@ settings = get_settings()
 
 
 class SmtpEmailClient:
+    def __init__(self, pool: SmtpConnectionPool | None = None) -> None:
+        self._pool = pool or smtp_pool
+
     def send(self, message: MIMEMultipart) -> None:
-        with smtplib.SMTP(settings.email.HOST, settings.email.PORT) as server:
-            if settings.email.USE_TLS:
-                server.starttls()
+        try:
+            self._send(message)
+        except smtplib.SMTPServerDisconnected:
+            # A pooled connection may have been dropped by the server while
+            # idle; the broken one is discarded, so retry once on a fresh one.
+            self._send(message)
+
+    def _send(self, message: MIMEMultipart) -> None:
+        with self._pool.connection() as conn:
+            conn.server.send_message(message)
+            conn.sent += 1
 
-            if settings.email.USERNAME and settings.email.PASSWORD:
-                server.login(settings.email.USERNAME, settings.email.PASSWORD)
 
-            server.send_message(message)
+# =============================================================================
+# Shared Process-wide Instance.
+# =============================================================================
+
+smtp_pool = SmtpConnectionPool(
+    size=settings.email.POOL_SIZE,
+    host=settings.email.HOST,
+    port=settings.email.PORT,
+    username=settings.email.USERNAME,
+    password=settings.email.PASSWORD,
+    use_tls=settings.email.USE_TLS,
+    use_ssl=settings.email.USE_SSL,
+    timeout=settings.email.TIMEOUT,
+    max_idle=settings.email.POOL_MAX_IDLE_SECONDS,
+    max_messages=settings.email.POOL_MAX_MESSAGES,
+)
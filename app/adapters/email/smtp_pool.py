@@ -0,0 +1,173 @@
+import smtplib
+from collections.abc import Generator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from logging import getLogger
+from queue import Empty, LifoQueue
+from threading import BoundedSemaphore
+from time import monotonic
+
+# =============================================================================
+# Smtp Pool Constants.
+# =============================================================================
+
+# Refusals of a single message; the session itself is still usable.
+MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+# =============================================================================
+# Getting Logger.
+# =============================================================================
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# Pooled Smtp Connection.
+# =============================================================================
+
+
+@dataclass(slots=True)
+class PooledSmtpConnection:
+    server: smtplib.SMTP
+    sent: int = 0
+    released_at: float = field(default_factory=monotonic)
+
+
+# =============================================================================
+# Smtp Connection Pool.
+# =============================================================================
+
+
+class SmtpConnectionPool:
+    """
+    Keep up to `size` authenticated SMTP connections alive for reuse.
+
+    Connections are opened lazily, so TLS and LOGIN are paid once per
+    connection instead of once per message. A connection idle for longer
+    than `max_idle` is validated with NOOP before reuse, one that has sent
+    `max_messages` is retired, and one that raised while borrowed is never
+    returned to the pool unless the server merely refused that message.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        host: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        use_tls: bool,
+        use_ssl: bool,
+        timeout: float,
+        max_idle: float,
+        max_messages: int,
+    ) -> None:
+        self.size = size
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_messages = max_messages
+        self._idle: LifoQueue[PooledSmtpConnection] = LifoQueue()
+        self._slots = BoundedSemaphore(size)
+
+    @contextmanager
+    def connection(self) -> Generator[PooledSmtpConnection, None, None]:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise smtplib.SMTPException("Timed out waiting for an SMTP connection.")
+
+        conn: PooledSmtpConnection | None = None
+        try:
+            conn = self._checkout()
+            yield conn
+        except MESSAGE_ERRORS:
+            if conn is not None:
+                self._reset(conn)
+            raise
+        except BaseException:
+            if conn is not None:
+                self._discard(conn)
+            raise
+        else:
+            self._checkin(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except Empty:
+                return
+
+    def _checkout(self) -> PooledSmtpConnection:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                return PooledSmtpConnection(server=self._connect())
+
+            if monotonic() - conn.released_at < self.max_idle or self._is_alive(conn):
+                return conn
+
+            self._discard(conn)
+
+    def _checkin(self, conn: PooledSmtpConnection) -> None:
+        if conn.sent >= self.max_messages:
+            self._discard(conn)
+            return
+
+        conn.released_at = monotonic()
+        self._idle.put(conn)
+
+    def _connect(self) -> smtplib.SMTP:
+        server_class = smtplib.SMTP_SSL if self.use_ssl else smtplib.SMTP
+        server = server_class(self.host, self.port, timeout=self.timeout)
+
+        try:
+            if self.use_tls and not self.use_ssl:
+                server.starttls()
+
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except BaseException:
+            with suppress(Exception):
+                server.close()
+            raise
+
+        logger.debug("Opened SMTP connection to %s:%s", self.host, self.port)
+        return server
+
+    def _reset(self, conn: PooledSmtpConnection) -> None:
+        try:
+            conn.server.rset()
+        except (smtplib.SMTPException, OSError):
+            self._discard(conn)
+        else:
+            self._checkin(conn)
+
+    @staticmethod
+    def _is_alive(conn: PooledSmtpConnection) -> bool:
+        try:
+            status, _ = conn.server.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+
+        return status == 250
+
+    @staticmethod
+    def _discard(conn: PooledSmtpConnection) -> None:
+        with suppress(smtplib.SMTPException, OSError):
+            conn.server.quit()
+
+        with suppress(Exception):
+            conn.server.close()
@@ -25,6 +25,17 @@ class EmailMessageDict(TypedDict):
     context: dict[str, Any]
 
 
+# =============================================================================
+# Email Batch Report Model.
+# =============================================================================
+
+
+class EmailBatchReportDict(TypedDict):
+    sent: list[str]
+    failed: dict[str, str]
+    retrying: list[str]
+
+
 def send_email(message: EmailMessageDict) -> EmailMessageDict:
     return message
 
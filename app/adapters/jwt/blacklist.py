@@ -2,11 +2,13 @@ from redis.asyncio.client import Redis
 
 from app.shared.datetime.utc_now import get_utc_now
 
-# =============================================================================
-# Jwt Constants
-# =============================================================================
-
-BLACKLIST_PREFIX = "blacklist:"
+from .revocation import (
+    BLACKLIST_PREFIX,
+    REVOCATION_CHANNEL,
+    REVOCATION_INDEX,
+    RevocationSnapshot,
+    revocation_snapshot,
+)
 
 # =============================================================================
 # Blacklist Created Token Using Redis.
@@ -14,13 +16,31 @@ BLACKLIST_PREFIX = "blacklist:"
 
 
 class JwtBlacklist:
-    def __init__(self, redis: Redis) -> None:
+    def __init__(
+        self, redis: Redis, snapshot: RevocationSnapshot | None = revocation_snapshot
+    ) -> None:
         self.redis = redis
+        self.snapshot = snapshot
 
     async def revoke(self, jti: str, exp: int) -> None:
         ttl = max(exp - int(get_utc_now().timestamp()), 0)
         if ttl > 0:
-            await self.redis.set(f"{BLACKLIST_PREFIX}{jti}", "1", ex=ttl)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(f"{BLACKLIST_PREFIX}{jti}", "1", ex=ttl)
+                pipe.zadd(REVOCATION_INDEX, {jti: exp})
+                pipe.publish(  # pyright: ignore[reportUnknownMemberType]
+                    REVOCATION_CHANNEL, f"{jti}:{exp}"
+                )
+                await pipe.execute()
+
+            if self.snapshot is not None:
+                self.snapshot.add(jti, exp)
 
     async def is_revoked(self, jti: str) -> bool:
+        # A fresh snapshot is authoritative for misses; only possible hits
+        # (or a stale snapshot) cost a Redis round-trip.
+        if self.snapshot is not None and self.snapshot.is_fresh:
+            if jti not in self.snapshot:
+                return False
+
         return bool(await self.redis.get(f"{BLACKLIST_PREFIX}{jti}"))
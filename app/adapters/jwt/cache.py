@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from time import time
+from typing import Any
+
+from app.core.config import get_settings
+
+# =============================================================================
+# Creating Settings Instance.
+# =============================================================================
+
+settings = get_settings()
+
+
+# =============================================================================
+# Verified Token Cache Stats.
+# =============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class VerifiedTokenCacheStats:
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+
+# =============================================================================
+# Process-local Cache Of Verified Jwt Claims.
+# =============================================================================
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of decoded claims for tokens whose signature and
+    structure were already verified by this process.
+
+    Entries are keyed by a SHA-256 digest of the raw token, so raw bearer
+    tokens are never kept in memory, and each entry lives only until the
+    token's own `exp`. Revocation is NOT cached here; callers must still
+    consult the blacklist on every hit.
+    """
+
+    __slots__ = ("max_size", "hits", "misses", "_entries")
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[int, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        digest = self._digest(token)
+        entry = self._entries.get(digest)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        exp, claims = entry
+        if exp <= time():
+            del self._entries[digest]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return dict(claims)
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        if self.max_size <= 0:
+            return
+
+        digest = self._digest(token)
+        self._entries[digest] = (int(claims["exp"]), dict(claims))
+        self._entries.move_to_end(digest)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> VerifiedTokenCacheStats:
+        return VerifiedTokenCacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+# =============================================================================
+# Shared Process-wide Instance.
+# =============================================================================
+
+verified_token_cache = VerifiedTokenCache(settings.jwt.VERIFIED_CACHE_SIZE)
@@ -7,6 +7,7 @@ from redis.asyncio.client import Redis
 from app.core.config import get_settings
 
 from .blacklist import JwtBlacklist
+from .cache import verified_token_cache
 from .factory import JwtFactory
 from .verifier import JwtVerifier
 
@@ -35,7 +36,7 @@ settings = get_settings()
 class JwtTokenManager:
     def __init__(self, redis: Redis) -> None:
         self.blacklist = JwtBlacklist(redis)
-        self.verifier = JwtVerifier(self.blacklist)
+        self.verifier = JwtVerifier(self.blacklist, verified_token_cache)
         self.secret_key = settings.jwt.SECRET_KEY
         self.algorithm = settings.jwt.ALGORITHM
 
@@ -1,11 +1,15 @@
+from functools import lru_cache
+
 from redis.asyncio.client import Redis
 
 from .manager import JwtTokenManager
 
 # =============================================================================
-# Function that return JwtTokenManager instance.
+# Function that return process-wide JwtTokenManager instance.
 # =============================================================================
 
 
+@lru_cache
 def get_jwt_token_manager(redis: Redis) -> JwtTokenManager:
+    # One manager per Redis client, i.e. one per process for `async_redis`.
     return JwtTokenManager(redis)
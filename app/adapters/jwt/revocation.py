@@ -0,0 +1,203 @@
+import asyncio
+from collections.abc import AsyncIterator
+from logging import getLogger
+from time import monotonic, time
+from typing import Any, cast
+
+from redis.asyncio.client import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+# =============================================================================
+# Revocation Constants
+# =============================================================================
+
+BLACKLIST_PREFIX = "blacklist:"
+REVOCATION_CHANNEL = "blacklist:revoked"
+REVOCATION_INDEX = "blacklist:index"
+REVOCATION_INDEX_READY = "blacklist:index:ready"
+
+POLL_TIMEOUT = 1.0
+RECONNECT_DELAY = 1.0
+
+# =============================================================================
+# Creating Settings Instance.
+# =============================================================================
+
+settings = get_settings()
+
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# Worker-local Snapshot Of Revoked Jwt Ids.
+# =============================================================================
+
+
+class RevocationSnapshot:
+    """
+    In-memory set of revoked JTIs kept in sync with Redis.
+
+    The snapshot subscribes to `REVOCATION_CHANNEL`, then loads the full
+    `REVOCATION_INDEX` sorted set, so nothing published during the load
+    is lost. It re-subscribes and reloads after any connection error and
+    reloads periodically as a safety net.
+
+    The snapshot is only trusted while the listener has heard from Redis,
+    a revocation or the reply to its keepalive PING, within
+    `max_staleness` seconds. An empty poll proves nothing on a half-open
+    connection. Outside that window `is_fresh` is False and callers must
+    fall back to direct lookups.
+    """
+
+    def __init__(self, *, max_staleness: float, resync_interval: float) -> None:
+        self.max_staleness = max_staleness
+        self.resync_interval = resync_interval
+        self._revoked: dict[str, int] = {}
+        self._alive_at = 0.0
+        self._synced_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self._task is not None
+            and not self._task.done()
+            and monotonic() - self._alive_at <= self.max_staleness
+        )
+
+    def __contains__(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def add(self, jti: str, exp: int) -> None:
+        self._revoked[jti] = exp
+
+    async def start(self, redis: Redis) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._listen(redis), name="jwt-revocation-snapshot"
+            )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+            self._alive_at = 0.0
+
+    async def _listen(self, redis: Redis) -> None:
+        while True:
+            pubsub = redis.pubsub(  # pyright: ignore[reportUnknownMemberType]
+                ignore_subscribe_messages=True
+            )
+            try:
+                await pubsub.subscribe(  # pyright: ignore[reportUnknownMemberType]
+                    REVOCATION_CHANNEL
+                )
+                await self._resync(redis)
+
+                while True:
+                    message = cast(
+                        dict[str, Any] | None,
+                        await pubsub.get_message(timeout=POLL_TIMEOUT),
+                    )
+                    if message is None:
+                        # Silence is not liveness, ask for a reply.
+                        await pubsub.ping()  # pyright: ignore[reportUnknownMemberType]
+                    else:
+                        self._alive_at = monotonic()
+                        if message["type"] == "message" and isinstance(
+                            data := message["data"], (str, bytes)
+                        ):
+                            self._apply(data)
+
+                    if monotonic() - self._synced_at >= self.resync_interval:
+                        await self._resync(redis)
+            except RedisError as exc:
+                self._alive_at = 0.0
+                logger.warning(
+                    "Jwt revocation subscription lost, using direct lookups.",
+                    exc_info=exc,
+                )
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                await pubsub.aclose()
+
+    def _apply(self, data: str | bytes) -> None:
+        try:
+            if isinstance(data, bytes):
+                data = data.decode()
+
+            jti, _, exp = data.rpartition(":")
+            expires_at = int(exp)
+        except ValueError:
+            logger.warning("Skipping malformed jwt revocation message %r.", data)
+            return
+
+        if jti:
+            self._revoked[jti] = expires_at
+
+    async def _resync(self, redis: Redis) -> None:
+        now = int(time())
+
+        if not await redis.exists(REVOCATION_INDEX_READY):
+            await self._backfill_index(redis, now)
+
+        await redis.zremrangebyscore(REVOCATION_INDEX, "-inf", now)
+        entries = cast(
+            list[tuple[bytes, float]],
+            await redis.zrangebyscore(  # pyright: ignore[reportUnknownMemberType]
+                REVOCATION_INDEX, now, "+inf", withscores=True
+            ),
+        )
+
+        self._revoked = {jti.decode(): int(exp) for jti, exp in entries}
+        self._synced_at = monotonic()
+        logger.debug("Jwt revocation snapshot loaded %d entries.", len(self._revoked))
+
+    @staticmethod
+    async def _backfill_index(redis: Redis, now: int) -> None:
+        # One-off: index blacklist keys written before the index existed.
+        keys = cast(
+            AsyncIterator[bytes],
+            redis.scan_iter(  # pyright: ignore[reportUnknownMemberType]
+                match=f"{BLACKLIST_PREFIX}*", count=1000
+            ),
+        )
+        async for key in keys:
+            name = key.decode()
+            jti = name.removeprefix(BLACKLIST_PREFIX)
+
+            if ":" in jti:
+                continue
+
+            ttl = await redis.ttl(name)
+            if ttl > 0:
+                await redis.zadd(REVOCATION_INDEX, {jti: now + ttl})
+
+        await redis.set(REVOCATION_INDEX_READY, "1")
+
+
+# =============================================================================
+# Shared Process-wide Instance.
+# =============================================================================
+
+revocation_snapshot = RevocationSnapshot(
+    max_staleness=settings.jwt.REVOCATION_MAX_STALENESS_SECONDS,
+    resync_interval=settings.jwt.REVOCATION_RESYNC_SECONDS,
+)
@@ -5,6 +5,7 @@ from jose import ExpiredSignatureError, jwt
 from jose import JWTError as JoseJWTError
 
 from .blacklist import JwtBlacklist
+from .cache import VerifiedTokenCache
 from .exceptions import ExpiredTokenError, InvalidTokenError, RevokedTokenError
 
 # =============================================================================
@@ -21,14 +22,34 @@ logger = getLogger(__name__)
 
 
 class JwtVerifier:
-    def __init__(self, blacklist: JwtBlacklist) -> None:
+    def __init__(
+        self, blacklist: JwtBlacklist, cache: VerifiedTokenCache | None = None
+    ) -> None:
         self.blacklist = blacklist
+        self.cache = cache
 
     async def verify_token(
         self, *, token: str, expected_sub: str, secret_key: str, algorithm: str
     ) -> dict[str, Any]:
+        claims = self.cache.get(token) if self.cache is not None else None
+
+        if claims is None:
+            claims = self._decode(token, secret_key, algorithm)
+            self._validate_claims(claims)
+
+            if self.cache is not None:
+                self.cache.set(token, claims)
+
+        # Subject and revocation are checked on every call, cached or not.
+        self._validate_subject(claims, expected_sub)
+        await self._validate_not_revoked(claims)
+
+        return claims
+
+    @staticmethod
+    def _decode(token: str, secret_key: str, algorithm: str) -> dict[str, Any]:
         try:
-            claims = jwt.decode(
+            return jwt.decode(
                 token=token,
                 key=secret_key,
                 algorithms=[algorithm],
@@ -40,12 +61,6 @@ class JwtVerifier:
             logger.debug("Invalid Jwt", exc_info=exc)
             raise InvalidTokenError("Invalid jwt token.")
 
-        self._validate_claims(claims)
-        self._validate_subject(claims, expected_sub)
-        await self._validate_not_revoked(claims)
-
-        return claims
-
     @staticmethod
     def _validate_claims(claims: dict[str, Any]) -> None:
         required = {"sub", "exp", "iat", "jti"}
@@ -1,5 +1,11 @@
+from typing import Any
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+from kombu import Queue
 
+from app.adapters.email.providers import get_renderer
+from app.adapters.email.smtp_client import smtp_pool
 from app.core.config import get_settings
 
 # =============================================================================
@@ -20,9 +26,6 @@ celery_app = Celery(
     backend=celery_settings.RESULT_BACKEND,
 )
 
-celery_app.conf.task_always_eager = True
-celery_app.conf.task_eager_propagates = True
-
 # =============================================================================
 # Updating Celery Config With My Config.
 # =============================================================================
@@ -34,6 +37,24 @@ celery_app.conf.update(
     accept_content=celery_settings.ACCEPT_CONTENT,
     timezone=celery_settings.TIMEZONE,
     enable_utc=celery_settings.ENABLE_UTC,
+    # Eager mode runs tasks inline in the caller, meant for tests/dev only.
+    task_always_eager=celery_settings.TASK_ALWAYS_EAGER,
+    task_eager_propagates=celery_settings.TASK_EAGER_PROPAGATES,
+    task_acks_late=celery_settings.TASK_ACKS_LATE,
+    task_default_queue=celery_settings.DEFAULT_QUEUE,
+    # Each queue gets its own routing key, otherwise celery binds them all to
+    # the default key and an email task would land in both queues.
+    task_queues=(
+        Queue(celery_settings.DEFAULT_QUEUE, routing_key=celery_settings.DEFAULT_QUEUE),
+        Queue(celery_settings.EMAIL_QUEUE, routing_key=celery_settings.EMAIL_QUEUE),
+    ),
+    task_routes={
+        "app.adapters.messaging.tasks.email_tasks.*": {
+            "queue": celery_settings.EMAIL_QUEUE,
+        },
+    },
+    worker_prefetch_multiplier=celery_settings.WORKER_PREFETCH_MULTIPLIER,
+    worker_concurrency=celery_settings.WORKER_CONCURRENCY,
 )
 
 
@@ -43,5 +64,21 @@ celery_app.conf.update(
 
 
 celery_app.autodiscover_tasks(
-    packages=["app.infrastructure.messaging.tasks"],
+    packages=["app.adapters.messaging"],
 )
+
+
+# =============================================================================
+# Worker Process Startup And Shutdown.
+# =============================================================================
+
+
+@worker_process_init.connect
+def preload_email_templates(**_: Any) -> None:
+    # Compile templates once per worker process, before the first task.
+    get_renderer().preload()
+
+
+@worker_process_shutdown.connect
+def close_smtp_pool(**_: Any) -> None:
+    smtp_pool.close()
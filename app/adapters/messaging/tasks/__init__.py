@@ -1,3 +1,3 @@
-from .email_tasks import send_email_task
+from .email_tasks import send_email_batch_task, send_email_task
 
-__all__ = ["send_email_task"]
+__all__ = ["send_email_task", "send_email_batch_task"]
@@ -1,14 +1,18 @@
 # pyright: reportUnknownVariableType=false
 
+from email.mime.multipart import MIMEMultipart
 from logging import getLogger
-from smtplib import SMTPException
+from smtplib import SMTPException, SMTPRecipientsRefused, SMTPResponseException
 from typing import Any
 
 from celery import shared_task
+from celery.exceptions import MaxRetriesExceededError
 
 from app.adapters.email.assembler import EmailMessageDict, SmtpMessageAssembler
-from app.adapters.email.renderer import JinjaRenderer
-from app.adapters.email.smtp_client import SmtpEmailClient
+from app.adapters.email.providers import get_renderer
+from app.adapters.email.smtp_client import SmtpEmailClient, smtp_pool
+from app.adapters.email.smtp_pool import MESSAGE_ERRORS
+from app.adapters.email.types import EmailBatchReportDict
 
 # =============================================================================
 # Getting Logger.
@@ -31,7 +35,7 @@ logger = getLogger(__name__)
     ignore_result=True,
 )
 def send_email_task(self: Any, email_msg: EmailMessageDict) -> None:
-    assembler = SmtpMessageAssembler(JinjaRenderer())
+    assembler = SmtpMessageAssembler(get_renderer())
     message = assembler.assemble(email_msg)
     email_client = SmtpEmailClient()
 
@@ -57,3 +61,95 @@ def send_email_task(self: Any, email_msg: EmailMessageDict) -> None:
             extra={"to": email_msg["to"]},
             exc_info=exc,
         )
+
+
+# =============================================================================
+# Celery Send Email Batch Task.
+# =============================================================================
+
+
+def _is_permanent(exc: SMTPException) -> bool:
+    # 5xx replies will fail again on retry, 4xx ones are worth retrying.
+    if isinstance(exc, SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+
+    return isinstance(exc, SMTPResponseException) and exc.smtp_code >= 500
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+)
+def send_email_batch_task(
+    self: Any, email_msgs: list[EmailMessageDict]
+) -> EmailBatchReportDict:
+    report: EmailBatchReportDict = {"sent": [], "failed": {}, "retrying": []}
+    retry_msgs: list[EmailMessageDict] = []
+
+    assembler = SmtpMessageAssembler(get_renderer())
+    outbox: list[tuple[EmailMessageDict, MIMEMultipart]] = []
+
+    for email_msg, message in assembler.assemble_many(email_msgs):
+        if isinstance(message, Exception):
+            report["failed"][email_msg["to"]] = f"render: {message}"
+        else:
+            outbox.append((email_msg, message))
+
+    # Pooled SMTP sessions for the whole batch, a connection is only given
+    # up on connection-level errors or once it has sent `max_messages`.
+    # Single refusals keep the session going.
+    position = 0
+    in_flight = False
+    try:
+        while position < len(outbox):
+            with smtp_pool.connection() as conn:
+                while position < len(outbox) and conn.sent < smtp_pool.max_messages:
+                    email_msg, message = outbox[position]
+                    in_flight = True
+                    try:
+                        conn.server.send_message(message)
+                        conn.sent += 1
+                        report["sent"].append(email_msg["to"])
+                    except MESSAGE_ERRORS as exc:
+                        if _is_permanent(exc):
+                            report["failed"][email_msg["to"]] = str(exc)
+                        else:
+                            retry_msgs.append(email_msg)
+                    in_flight = False
+                    position += 1
+    except (SMTPException, OSError) as exc:
+        if in_flight:
+            # Lost during the send: the server may already have accepted
+            # it, so report it instead of risking a duplicate.
+            email_msg, _ = outbox[position]
+            report["failed"][email_msg["to"]] = f"delivery unknown: {exc}"
+            position += 1
+
+        logger.warning(
+            "SMTP session lost mid-batch, retrying unsent messages.",
+            extra={"unsent": len(outbox) - position},
+            exc_info=exc,
+        )
+        retry_msgs.extend(email_msg for email_msg, _ in outbox[position:])
+
+    report["retrying"] = [email_msg["to"] for email_msg in retry_msgs]
+    logger.info(
+        "Email batch processed",
+        extra={
+            "sent": len(report["sent"]),
+            "failed": len(report["failed"]),
+            "retrying": len(report["retrying"]),
+        },
+    )
+
+    if retry_msgs:
+        try:
+            # Only the messages that did not go out are sent again.
+            self.retry(args=(retry_msgs,), countdown=60 * 2**self.request.retries)
+        except MaxRetriesExceededError:
+            for email_msg in retry_msgs:
+                report["failed"][email_msg["to"]] = "max retries exceeded"
+            report["retrying"] = []
+
+    return report
@@ -0,0 +1,19 @@
+from app.core.exceptions.adapter import AdapterError
+
+from .gcra import RateLimitResult
+
+# =============================================================================
+# Rate Limit Errors
+# =============================================================================
+
+
+class RateLimitError(AdapterError):
+    """Base rate limit adapter exception"""
+
+    pass
+
+
+class RateLimitExceededError(RateLimitError):
+    def __init__(self, result: RateLimitResult) -> None:
+        super().__init__("Rate limit exceeded")
+        self.result = result
@@ -1,11 +1,14 @@
 from enum import StrEnum
 from typing import Callable
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
+from app.adapters.redis.client import async_redis
 from app.core.config import get_settings
 
+from .exceptions import RateLimitExceededError
+from .gcra import RateLimitResult, RedisRateLimiter
+from .policy import RateLimitPolicy, parse_rate_limit
+from .tiered import TieredRateLimiter
+
 # =============================================================================
 # Getting All Env Settings.
 # =============================================================================
@@ -21,36 +24,66 @@ settings = get_settings()
 class RateLimit(StrEnum):
     LOGIN = "5/minute"
     REGISTER = "3/minute"
+    REFRESH = "10/minute"
+    LOGOUT = "10/minute"
+    AUTH_IP = "30/minute"
     DEFAULT = "100/minute"
 
+    @property
+    def policy(self) -> RateLimitPolicy:
+        return parse_rate_limit(self.value)
+
 
 # =============================================================================
-# Creating Slowapi Limiter Instance.
+# Shared Process-wide Native Limiters.
 # =============================================================================
 
-limiter = Limiter(
-    key_func=get_remote_address,
-    storage_uri=settings.redis.url,
-    strategy="fixed-window",
-    default_limits=[RateLimit.DEFAULT.value],
-    headers_enabled=True,
+redis_rate_limiter = RedisRateLimiter(async_redis)
+
+rate_limiter = TieredRateLimiter(
+    redis_rate_limiter,
+    local_share=settings.rate_limit.LOCAL_SHARE,
+    sync_interval=settings.rate_limit.SYNC_SECONDS,
+    max_keys=settings.rate_limit.MAX_LOCAL_KEYS,
 )
 
 
+# =============================================================================
+# Enforce A Rate Limit For An Identity.
+# =============================================================================
+
+
+async def enforce_rate_limit(limit: RateLimit, identity: str) -> RateLimitResult:
+    result = await rate_limiter.hit(limit.policy, f"{limit.name.lower()}:{identity}")
+    if not result.allowed:
+        raise RateLimitExceededError(result)
+
+    return result
+
+
 # =============================================================================
 # Decorator Fun Return Type.
 # =============================================================================
 
 type FunType = Callable[..., object]
 
+RATE_LIMITS_ATTR = "__rate_limits__"
+
 
 # =============================================================================
 # Type-safe Decorator Function.
 # =============================================================================
 
 
-def rate_limit(limit: RateLimit) -> Callable[[FunType], FunType]:
+def rate_limit(*limits: RateLimit) -> Callable[[FunType], FunType]:
+    """
+    Mark an endpoint with per client IP limits. They are enforced by
+    `RateLimitedRoute` before the request body is read, so the decorator
+    must sit below the router decorator.
+    """
+
     def decorator(func: FunType) -> FunType:
-        return limiter.limit(limit.value)(func)  # type: ignore
+        setattr(func, RATE_LIMITS_ATTR, limits)
+        return func
 
     return decorator
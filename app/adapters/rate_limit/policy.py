@@ -0,0 +1,56 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+# =============================================================================
+# Rate Limit Policy Constants.
+# =============================================================================
+
+PERIOD_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 60 * 60 * 24,
+}
+
+POLICY_PATTERN = re.compile(
+    r"^\s*(?P<limit>\d+)\s*(?:/|per)\s*(?P<multiplier>\d+)?\s*"
+    r"(?P<unit>second|minute|hour|day)s?\s*$",
+    re.IGNORECASE,
+)
+
+
+# =============================================================================
+# Rate Limit Policy.
+# =============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitPolicy:
+    """
+    `limit` requests per `period` seconds, parsed from strings such as
+    "5/minute", "100 per hour" or "10/5 minutes".
+    """
+
+    name: str
+    limit: int
+    period: int
+
+    @property
+    def emission_interval_ms(self) -> int:
+        # Time one request "costs" in a GCRA bucket, at least 1ms.
+        return max(self.period * 1000 // self.limit, 1)
+
+
+@lru_cache
+def parse_rate_limit(value: str) -> RateLimitPolicy:
+    match = POLICY_PATTERN.match(value)
+    if match is None or int(match["limit"]) < 1:
+        raise ValueError(f"Invalid rate limit: {value!r}")
+
+    multiplier = int(match["multiplier"] or 1)
+    return RateLimitPolicy(
+        name=value,
+        limit=int(match["limit"]),
+        period=multiplier * PERIOD_SECONDS[match["unit"].lower()],
+    )
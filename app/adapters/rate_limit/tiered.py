@@ -0,0 +1,198 @@
+import asyncio
+from dataclasses import dataclass
+from logging import getLogger
+from math import floor
+from time import monotonic
+
+from redis.exceptions import RedisError
+
+from .gcra import RateLimitResult, RedisRateLimiter
+from .policy import RateLimitPolicy
+
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# Local Bucket State.
+# =============================================================================
+
+
+@dataclass(slots=True)
+class LocalBucket:
+    tokens: int = 0
+    pending: int = 0
+    # Global quota left and its reset time, as of the last Redis result.
+    remaining: int = 0
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+    touched_at: float = 0.0
+
+
+# =============================================================================
+# Two-tier Rate Limiter.
+# =============================================================================
+
+
+class TieredRateLimiter:
+    """
+    In-process tier in front of `RedisRateLimiter`.
+
+    Each key keeps a small local allowance granted from the last Redis
+    result (`local_share` of the remaining quota). Requests spend that
+    allowance without network I/O and their usage is reported to Redis in
+    one pipelined batch every `sync_interval` seconds. A key that Redis
+    rejected is blocked locally until its retry time, so an abusive client
+    costs nothing but a dict lookup.
+
+    With W workers the global limit may be exceeded by at most W times the
+    local allowance per reconcile interval; `local_share=0` disables the
+    local tier and sends every check to Redis.
+    """
+
+    def __init__(
+        self,
+        backend: RedisRateLimiter,
+        *,
+        local_share: float,
+        sync_interval: float,
+        max_keys: int,
+    ) -> None:
+        self.backend = backend
+        self.local_share = local_share
+        self.sync_interval = sync_interval
+        self.max_keys = max_keys
+        self._buckets: dict[tuple[RateLimitPolicy, str], LocalBucket] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def hit(self, policy: RateLimitPolicy, identity: str) -> RateLimitResult:
+        now = monotonic()
+        bucket = self._buckets.get((policy, identity))
+
+        if bucket is not None:
+            bucket.touched_at = now
+
+            if bucket.blocked_until > now:
+                return RateLimitResult(
+                    allowed=False,
+                    limit=policy.limit,
+                    remaining=0,
+                    retry_after=bucket.blocked_until - now,
+                    reset_after=bucket.blocked_until - now,
+                )
+
+            if bucket.tokens > 0:
+                bucket.tokens -= 1
+                bucket.pending += 1
+                return self._local_result(policy, bucket, now)
+
+        result = await self.backend.hit(policy, identity)
+
+        if bucket is None:
+            bucket = self._bucket(policy, identity, now)
+        self._apply(bucket, result, now)
+
+        return result
+
+    async def start(self) -> None:
+        if self.local_share <= 0:
+            return
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._reconcile_loop(), name="rate-limit")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._task = None
+
+        # Do not lose usage that was served but not yet reported.
+        try:
+            await self.reconcile()
+        except RedisError as exc:
+            logger.warning("Final rate limit reconcile failed.", exc_info=exc)
+
+    async def reconcile(self) -> None:
+        now = monotonic()
+        batch = [
+            (key, bucket.pending)
+            for key, bucket in self._buckets.items()
+            if bucket.pending > 0
+        ]
+
+        if batch:
+            results = await self.backend.consume_many(
+                [(policy, identity, pending) for (policy, identity), pending in batch]
+            )
+            for (key, pending), result in zip(batch, results):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    # Hits served while the batch was in flight stay pending.
+                    bucket.pending -= pending
+                    self._apply(bucket, result, monotonic())
+
+        self._evict(now)
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.reconcile()
+            except RedisError as exc:
+                logger.warning("Rate limit reconcile failed.", exc_info=exc)
+
+    def _bucket(
+        self, policy: RateLimitPolicy, identity: str, now: float
+    ) -> LocalBucket:
+        if len(self._buckets) >= self.max_keys:
+            self._evict(now)
+
+        bucket = LocalBucket(touched_at=now)
+        self._buckets[(policy, identity)] = bucket
+        return bucket
+
+    @staticmethod
+    def _local_result(
+        policy: RateLimitPolicy, bucket: LocalBucket, now: float
+    ) -> RateLimitResult:
+        # The last global result, less what this worker has spent since.
+        # Every unreported hit pushes the GCRA reset one interval further.
+        spent_for = bucket.pending * policy.emission_interval_ms / 1000
+        return RateLimitResult(
+            allowed=True,
+            limit=policy.limit,
+            remaining=max(bucket.remaining - bucket.pending, 0),
+            retry_after=0.0,
+            reset_after=min(max(bucket.reset_at - now, 0.0) + spent_for, policy.period),
+        )
+
+    def _apply(self, bucket: LocalBucket, result: RateLimitResult, now: float) -> None:
+        bucket.remaining = result.remaining
+        bucket.reset_at = now + result.reset_after
+
+        if result.allowed:
+            bucket.tokens = floor(result.remaining * self.local_share)
+            bucket.blocked_until = 0.0
+        else:
+            bucket.tokens = 0
+            bucket.blocked_until = now + result.retry_after
+
+    def _evict(self, now: float) -> None:
+        # Forget idle keys with nothing left to report.
+        stale = [
+            key
+            for key, bucket in self._buckets.items()
+            if bucket.pending == 0
+            and bucket.blocked_until <= now
+            and now - bucket.touched_at > self.sync_interval
+        ]
+        for key in stale:
+            del self._buckets[key]
@@ -1,15 +1,84 @@
+import asyncio
 from logging import getLogger
-from typing import Awaitable, Callable, cast
+from math import log
+from random import random
+from time import monotonic, perf_counter
+from typing import Any, Awaitable, Callable, Iterable, Mapping, cast
+from uuid import uuid4
 
 from pydantic import BaseModel
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 from sqlmodel import SQLModel
 
+from .codecs import JSON_CODEC, CacheCodec, schema_version
+from .local_cache import INVALIDATE_ALL, LocalCache, local_cache_invalidator
+
 # =============================================================================
 # Redis Default Constants
 # =============================================================================
 
 DEFAULT_CACHE_TTL = 300
+DEFAULT_LOCAL_MAX_SIZE = 10_000
+
+# Cross-process fill lock: held while one worker runs the factory.
+FILL_LOCK_TTL_MS = 5_000
+FILL_WAIT_SECONDS = 2.0
+FILL_POLL_SECONDS = 0.05
+
+# XFetch: >1 refreshes earlier, <1 later. Compute time is an EWMA per
+# namespace with this weight for the newest sample.
+XFETCH_BETA = 1.0
+COMPUTE_TIME_WEIGHT = 0.2
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+  return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Entries are stored as `<generation>:<payload>`. Bumping the namespace
+# generation makes every older entry unreadable at once, in O(1), and
+# they then expire on their own TTL.
+GENERATION_SEPARATOR = b":"
+# Generation of a namespace whose counter was never bumped.
+INITIAL_GENERATION = b"0"
+
+# Store an entry stamped with the current generation and record its key in
+# each tag set. A tag set's TTL is only ever raised, so it outlives all of
+# its members. With a non-empty expected generation the write is skipped
+# if the namespace was invalidated since the value was read.
+# KEYS: generation, entry, tag sets...  ARGV: expected generation, ttl, payload
+WRITE_SCRIPT = """
+local generation = redis.call("GET", KEYS[1]) or "0"
+if ARGV[1] ~= "" and ARGV[1] ~= generation then
+  return 0
+end
+
+redis.call("SET", KEYS[2], generation .. ":" .. ARGV[3], "EX", ARGV[2])
+for i = 3, #KEYS do
+  redis.call("SADD", KEYS[i], KEYS[2])
+  if redis.call("TTL", KEYS[i]) < tonumber(ARGV[2]) then
+    redis.call("EXPIRE", KEYS[i], ARGV[2])
+  end
+end
+return 1
+"""
+
+# Tag sets are consumed this many members per round-trip, so a large tag
+# never blocks Redis for long. Members are entry keys, so tags need a single
+# Redis (not a cluster), as do the other cross-key operations here.
+TAG_BATCH_SIZE = 1000
+
+# =============================================================================
+# Process-wide Fill State.
+# =============================================================================
+
+# Cache objects are cheap and usually built per request, so coalescing and
+# compute-time tracking live at module level, keyed by Redis key/namespace.
+_inflight: dict[str, asyncio.Future[Any]] = {}
+_compute_time: dict[str, float] = {}
 
 # =============================================================================
 # Get Logger.
@@ -32,15 +101,37 @@ class RedisModelCache[T: BaseModel | SQLModel]:
     inherit from either `pydantic.BaseModel` or `sqlmodel.SQLModel`.
 
     It assumes:
-    - JSON-based serialization (`model_dump_json`)
-    - JSON-based deserialization (`model_validate_json`)
+    - A `CacheCodec` for (de)serialization, validated JSON bytes by default
     - A single primary identifier (`id`) per cached object
 
+    Keys carry a version tag derived from the model's fields and the codec,
+    so a schema or codec change never reads entries in the old format.
+
+    Beyond exact ids, entries can be invalidated by dependency tag (see
+    `tags_for`, recorded in Redis sets on write) or all at once with
+    `invalidate_all`, which bumps a namespace generation counter instead
+    of scanning keys.
+
+    With `local_ttl` set, an in-process L1 (`LocalCache`) of validated
+    instances sits in front of Redis. It is shared by every cache object
+    of the namespace in this process, and invalidations reach the L1 of
+    all workers through Redis pub/sub.
+
     The class is intentionally minimal and designed to be extended or
     instantiated for specific domain models.
     """
 
-    __slots__ = ("redis", "namespace", "model", "ttl")
+    __slots__ = (
+        "redis",
+        "namespace",
+        "model",
+        "ttl",
+        "codec",
+        "version",
+        "local",
+        "_release_lock",
+        "_write",
+    )
 
     def __init__(
         self,
@@ -48,6 +139,9 @@ class RedisModelCache[T: BaseModel | SQLModel]:
         redis: Redis,
         namespace: str,
         ttl: int = DEFAULT_CACHE_TTL,
+        local_ttl: float = 0,
+        local_max_size: int = DEFAULT_LOCAL_MAX_SIZE,
+        codec: CacheCodec = JSON_CODEC,
     ) -> None:
         """
         Initialize the Redis cache.
@@ -64,11 +158,42 @@ class RedisModelCache[T: BaseModel | SQLModel]:
             ttl:
                 Time-to-live (in seconds) for cached entries.
                 Defaults to `BASE_REDIS_CACHE`.
+            local_ttl:
+                Time-to-live (in seconds) for in-process L1 entries.
+                Keep it short, `0` disables the L1 layer.
+            local_max_size:
+                Maximum number of L1 entries, least recently used go first.
+            codec:
+                Serialization format of the Redis values, see
+                `app.adapters.redis.codecs`.
         """
         self.model = model
         self.redis = redis
         self.namespace = namespace
         self.ttl = ttl
+        self.codec = codec
+        self.version = schema_version(model, codec)
+        self.local: LocalCache | None = (
+            local_cache_invalidator.cache(
+                namespace, max_size=local_max_size, ttl=local_ttl
+            )
+            if local_ttl > 0
+            else None
+        )
+        self._release_lock = redis.register_script(RELEASE_LOCK_SCRIPT)
+        self._write = redis.register_script(WRITE_SCRIPT)
+
+    def _l1(self) -> LocalCache | None:
+        """
+        Return the L1 cache, only while invalidations can reach it.
+
+        Returns:
+            The namespace's `LocalCache`, or `None` if L1 is disabled or
+            the invalidation listener is not connected.
+        """
+        if self.local is not None and local_cache_invalidator.is_active:
+            return self.local
+        return None
 
     def _key(self, identifier: int | str) -> str:
         """
@@ -78,7 +203,7 @@ class RedisModelCache[T: BaseModel | SQLModel]:
         across different cache domains.
 
         Example:
-            cache:users:42
+            cache:users:1f0c9a2e:42
 
         Args:
             id:
@@ -87,15 +212,43 @@ class RedisModelCache[T: BaseModel | SQLModel]:
         Returns:
             A Redis-compatible string key.
         """
-        return f"cache:{self.namespace}:{identifier}"
+        return f"cache:{self.namespace}:{self.version}:{identifier}"
+
+    def _generation_key(self) -> str:
+        """
+        Key of the namespace generation counter, shared by all versions.
+        """
+        return f"cache:{self.namespace}:generation"
+
+    def _tag_key(self, tag: str) -> str:
+        """
+        Key of the Redis set recording the entries that carry `tag`.
+        """
+        return f"cache:{self.namespace}:tag:{tag}"
+
+    def tags_for(self, instance: T) -> Iterable[str]:
+        """
+        Dependency tags of an instance, recorded whenever it is cached.
+
+        Override in subclasses, e.g. to tag users with `role:<id>` so that
+        `invalidate_tag("role:<id>")` drops every user with that role.
+
+        Args:
+            instance:
+                Model instance about to be cached.
+
+        Returns:
+            The tags of the instance, none by default.
+        """
+        return ()
 
     async def get(self, key: int | str) -> T | None:
         """
         Retrieve an object from the cache.
 
         The method:
-        - Fetches raw JSON data from Redis
-        - Validates and deserializes it into the configured model
+        - Fetches the raw value from Redis
+        - Decodes it into the configured model with the cache's codec
         - Silently fails and returns `None` if data is invalid or corrupted
 
         Args:
@@ -106,25 +259,122 @@ class RedisModelCache[T: BaseModel | SQLModel]:
             The deserialized model instance if found and valid,
             otherwise `None`.
         """
-        raw = await self.redis.get(self._key(key))
+        local = self._l1()
+        if local is not None:
+            hit = local.get(str(key))
+            if hit is not None:
+                return cast(T, hit)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._generation_key())
+            pipe.get(self._key(key))
+            generation, raw = await pipe.execute()
+
+        instance = self._load(raw, generation)
+        if local is not None and instance is not None:
+            local.set(str(key), instance)
+
+        return instance
 
+    def _load(self, raw: bytes | None, generation: bytes | None) -> T | None:
+        """
+        Deserialize a raw Redis value into the configured model.
+
+        Args:
+            raw:
+                The value returned by Redis, `None` for a missing key.
+            generation:
+                The current namespace generation, `None` if never bumped.
+
+        Returns:
+            The model instance, or `None` if missing, invalidated by a
+            generation bump or invalid.
+        """
         if raw is None:
             return None
 
+        stamp, _, payload = raw.partition(GENERATION_SEPARATOR)
+        if stamp != (generation or INITIAL_GENERATION):
+            return None
+
         try:
-            return cast(T, self.model.model_validate_json(raw))
+            return self.codec.decode(self.model, payload)
         except Exception as exc:
             # Cache corruption or schema mismatch should never
             # break application flow.
             logger.debug("Cache data validation error: ", exc_info=exc)
             return None
 
+    async def get_many[K: int | str](self, keys: Iterable[K]) -> dict[K, T]:
+        """
+        Retrieve many objects from the cache with one `MGET` round-trip.
+
+        Missing, corrupted or invalid entries are simply left out of the
+        result, exactly as `get` would return `None` for them.
+
+        Args:
+            keys:
+                Unique identifiers of the cached objects.
+
+        Returns:
+            A mapping of identifier to model instance for every hit.
+        """
+        found, _ = await self._get_many(keys)
+        return found
+
+    async def _get_many[K: int | str](
+        self, keys: Iterable[K]
+    ) -> tuple[dict[K, T], bytes | None]:
+        """
+        `get_many` that also returns the generation the hits were read at.
+
+        Args:
+            keys:
+                Unique identifiers of the cached objects.
+
+        Returns:
+            The hits, and the namespace generation or `None` if Redis was
+            not consulted.
+        """
+        found: dict[K, T] = {}
+        local = self._l1()
+
+        remote: list[K] = []
+        for key in dict.fromkeys(keys):
+            hit = local.get(str(key)) if local is not None else None
+            if hit is not None:
+                found[key] = cast(T, hit)
+            else:
+                remote.append(key)
+
+        if not remote:
+            return found, None
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._generation_key())
+            pipe.mget([self._key(key) for key in remote])
+            generation, raws = await pipe.execute()
+
+        # Pin the generation even if never bumped, so that writes of values
+        # loaded for these misses are skipped after an `invalidate_all`.
+        generation = generation or INITIAL_GENERATION
+
+        for key, raw in zip(remote, raws):
+            instance = self._load(raw, generation)
+            if instance is not None:
+                found[key] = instance
+                if local is not None:
+                    local.set(str(key), instance)
+
+        return found, generation
+
     async def set(self, key: int | str, instance: T) -> None:
         """
         Store an object in Redis with expiration.
 
-        The instance is serialized to JSON and stored using `SETEX`
-        to ensure automatic expiration.
+        The instance is encoded with the cache's codec, stamped with the
+        namespace generation and stored with the cache TTL, its key being
+        added to the sets of its `tags_for`.
 
         Args:
             key:
@@ -132,11 +382,57 @@ class RedisModelCache[T: BaseModel | SQLModel]:
             instance:
                 Model instance to be cached.
         """
-        await self.redis.setex(
-            self._key(key),
-            self.ttl,
-            instance.model_dump_json(),
-        )
+        await self._store({key: instance}, generation=None)
+
+    async def set_many(self, instances: Mapping[int | str, T]) -> None:
+        """
+        Store many objects with expiration in one pipelined round-trip.
+
+        Every entry is written like `set` does, so each key keeps the
+        regular TTL; the pipeline is not transactional as entries are
+        independent.
+
+        Args:
+            instances:
+                Mapping of identifier to the model instance to cache.
+        """
+        await self._store(instances, generation=None)
+
+    async def _store(
+        self, instances: Mapping[int | str, T], generation: bytes | None
+    ) -> None:
+        """
+        Write entries and their tags in one pipelined round-trip.
+
+        Args:
+            instances:
+                Mapping of identifier to the model instance to cache.
+            generation:
+                The generation the values were computed at. If the namespace
+                was invalidated since, they are not written. `None` writes
+                them at the current generation.
+        """
+        if not instances:
+            return
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, instance in instances.items():
+                await self._write(
+                    keys=[
+                        self._generation_key(),
+                        self._key(key),
+                        *map(self._tag_key, self.tags_for(instance)),
+                    ],
+                    args=[generation or b"", self.ttl, self.codec.encode(instance)],
+                    client=pipe,
+                )
+            written = await pipe.execute()
+
+        local = self._l1()
+        if local is not None:
+            for (key, instance), ok in zip(instances.items(), written):
+                if ok:
+                    local.set(str(key), instance)
 
     async def get_or_set(
         self, key: int | str, factory: Callable[[], Awaitable[T]]
@@ -144,11 +440,15 @@ class RedisModelCache[T: BaseModel | SQLModel]:
         """
         Retrieve an object from cache or populate it if missing.
 
-        This implements a classic *read-through cache* pattern:
-        - Try cache first
-        - If missing, call the async factory
-        - Store the result in cache
-        - Return the value
+        This implements a *read-through cache* pattern protected against
+        stampedes:
+        - Try the in-process L1, then Redis, reading the value and its
+          remaining TTL together
+        - Refresh a hit early, with a probability that grows as expiry gets
+          closer relative to the factory's cost (XFetch)
+        - On a miss, coalesce concurrent callers in this process onto one
+          factory call, and take a short Redis lock so only one process
+          runs the factory while the others wait for its value
 
         Args:
             key:
@@ -160,14 +460,257 @@ class RedisModelCache[T: BaseModel | SQLModel]:
         Returns:
             The cached or freshly created model instance.
         """
-        cached = await self.get(key=key)
-        if cached is not None:
+        local = self._l1()
+        if local is not None:
+            hit = local.get(str(key))
+            if hit is not None:
+                return cast(T, hit)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._generation_key())
+            pipe.get(self._key(key))
+            pipe.pttl(self._key(key))
+            generation, raw, pttl = await pipe.execute()
+
+        cached = self._load(raw, generation)
+        if cached is not None and not self._should_refresh_early(pttl):
+            if local is not None:
+                local.set(str(key), cached)
             return cached
 
+        return await self._coalesce(
+            key, factory, cached, generation or INITIAL_GENERATION
+        )
+
+    def _should_refresh_early(self, pttl: int) -> bool:
+        """
+        Decide whether a hit should be recomputed before it expires.
+
+        Args:
+            pttl:
+                Remaining time-to-live of the entry in milliseconds.
+
+        Returns:
+            `True` if this caller should refresh the entry now.
+        """
+        delta = _compute_time.get(self.namespace)
+        if not delta or pttl <= 0:
+            return False
+
+        return -delta * XFETCH_BETA * log(1.0 - random()) * 1000 >= pttl
+
+    async def _coalesce(
+        self,
+        key: int | str,
+        factory: Callable[[], Awaitable[T]],
+        stale: T | None,
+        generation: bytes | None,
+    ) -> T:
+        """
+        Run at most one fill per key in this process at a time.
+
+        Callers holding a stale value return it right away if a refresh is
+        already running; callers without one await the running fill. If
+        that fill's owner is cancelled, the waiters fill themselves.
+
+        Args:
+            key:
+                Unique identifier of the cached object.
+            factory:
+                Async callable that returns the model instance.
+            stale:
+                The still-valid cached instance on an early refresh.
+            generation:
+                The namespace generation the entry was read at.
+
+        Returns:
+            The freshly created, or stale, model instance.
+        """
+        redis_key = self._key(key)
+        pending = _inflight.get(redis_key)
+
+        if pending is not None:
+            if stale is not None:
+                return stale
+            try:
+                return cast(T, await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task and task.cancelling()):
+                    raise
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        _inflight[redis_key] = future
+        try:
+            instance = await self._fill(key, factory, stale, generation)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark as retrieved, there may be no waiter to consume it.
+            future.exception()
+            raise
+        else:
+            future.set_result(instance)
+            return instance
+        finally:
+            if _inflight.get(redis_key) is future:
+                del _inflight[redis_key]
+
+    async def _fill(
+        self,
+        key: int | str,
+        factory: Callable[[], Awaitable[T]],
+        stale: T | None,
+        generation: bytes | None,
+    ) -> T:
+        """
+        Run the factory under a cross-process lock and cache its result.
+
+        Args:
+            key:
+                Unique identifier of the cached object.
+            factory:
+                Async callable that returns the model instance.
+            stale:
+                The still-valid cached instance on an early refresh.
+            generation:
+                The namespace generation the entry was read at.
+
+        Returns:
+            The freshly created model instance, or `stale` / the value
+            another process just cached when this one did not get the lock.
+        """
+        lock_key = f"lock:{self._key(key)}"
+        token = uuid4().hex
+
+        if await self.redis.set(lock_key, token, nx=True, px=FILL_LOCK_TTL_MS):
+            return await self._compute_locked(key, factory, generation, lock_key, token)
+
+        if stale is not None:
+            return stale
+
+        deadline = monotonic() + FILL_WAIT_SECONDS
+        while monotonic() < deadline:
+            await asyncio.sleep(FILL_POLL_SECONDS)
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+
+            # The holder released the lock without caching a value, e.g.
+            # its factory raised: take over rather than wait out the deadline.
+            if await self.redis.set(lock_key, token, nx=True, px=FILL_LOCK_TTL_MS):
+                return await self._compute_locked(
+                    key, factory, generation, lock_key, token
+                )
+
+        # The lock holder is slow or gone, serve this caller regardless.
+        return await self._compute(key, factory, generation)
+
+    async def _compute_locked(
+        self,
+        key: int | str,
+        factory: Callable[[], Awaitable[T]],
+        generation: bytes | None,
+        lock_key: str,
+        token: str,
+    ) -> T:
+        """
+        `_compute` while holding the fill lock, released afterwards.
+
+        Args:
+            key:
+                Unique identifier of the cached object.
+            factory:
+                Async callable that returns the model instance.
+            generation:
+                The namespace generation the entry was read at.
+            lock_key:
+                The fill lock this caller acquired.
+            token:
+                The value the lock was set to, so that only this caller
+                releases it.
+
+        Returns:
+            The freshly created model instance.
+        """
+        try:
+            return await self._compute(key, factory, generation)
+        finally:
+            await self._release_lock(keys=[lock_key], args=[token])
+
+    async def _compute(
+        self,
+        key: int | str,
+        factory: Callable[[], Awaitable[T]],
+        generation: bytes | None,
+    ) -> T:
+        """
+        Call the factory, record how long it took and cache the result.
+
+        Args:
+            key:
+                Unique identifier of the cached object.
+            factory:
+                Async callable that returns the model instance.
+            generation:
+                The namespace generation the entry was read at, the result
+                is not cached if the namespace was invalidated since.
+
+        Returns:
+            The freshly created model instance.
+        """
+        started_at = perf_counter()
         instance = await factory()
-        await self.set(key=key, instance=instance)
+        elapsed = perf_counter() - started_at
+
+        previous = _compute_time.get(self.namespace, elapsed)
+        _compute_time[self.namespace] = (
+            previous * (1 - COMPUTE_TIME_WEIGHT) + elapsed * COMPUTE_TIME_WEIGHT
+        )
+
+        await self._store({key: instance}, generation)
         return instance
 
+    async def get_or_set_many[K: int | str](
+        self,
+        keys: Iterable[K],
+        factory: Callable[[list[K]], Awaitable[Mapping[K, T]]],
+    ) -> dict[K, T]:
+        """
+        Retrieve many objects, loading only the missing ones in one batch.
+
+        This is the batch form of `get_or_set`:
+        - `MGET` every key
+        - Call the async batch factory once with the missing identifiers
+        - Store what it returned with pipelined writes, unless the namespace
+          was invalidated meanwhile
+
+        Identifiers the factory does not return (e.g. deleted rows) are
+        left out of the result and are not cached.
+
+        Args:
+            keys:
+                Unique identifiers of the objects.
+            factory:
+                Async callable taking the missing identifiers and returning
+                a mapping of identifier to model instance.
+
+        Returns:
+            A mapping of identifier to model instance, in `keys` order.
+        """
+        keys = list(dict.fromkeys(keys))
+        found, generation = await self._get_many(keys)
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            loaded = await factory(missing)
+            await self._store(cast(Mapping[int | str, T], loaded), generation)
+            found.update(loaded)
+
+        return {key: found[key] for key in keys if key in found}
+
     async def invalidate(self, key: int | str) -> None:
         """
         Remove a single object from the cache.
@@ -180,6 +723,7 @@ class RedisModelCache[T: BaseModel | SQLModel]:
                 Unique identifier of the cached object.
         """
         await self.redis.delete(self._key(key))
+        await self._broadcast([str(key)])
 
     async def invalidate_many(self, keys: list[int | str]) -> None:
         """
@@ -194,14 +738,79 @@ class RedisModelCache[T: BaseModel | SQLModel]:
         """
         if keys:
             await self.redis.delete(*(self._key(key) for key in keys))
+            await self._broadcast([str(key) for key in keys])
+
+    async def invalidate_tag(self, tag: str) -> None:
+        """
+        Remove every object cached with `tag` among its `tags_for`.
+
+        The tag's Redis set is first renamed away in O(1), so entries
+        tagged from then on start a new set, then popped and its entries
+        unlinked `TAG_BATCH_SIZE` at a time.
+
+        Args:
+            tag:
+                Dependency tag, e.g. `role:<id>`.
+        """
+        tag_key = self._tag_key(tag)
+        detached = f"{tag_key}:invalidating:{uuid4().hex}"
+
+        try:
+            await self.redis.rename(tag_key, detached)
+        except ResponseError:
+            # No entry carries the tag, or a concurrent call took the set.
+            return
+
+        prefix = self._key("")
+        while True:
+            # SPOP deletes the set along with its last members.
+            members = await cast(
+                Awaitable[list[bytes]],
+                self.redis.spop(  # pyright: ignore[reportUnknownMemberType]
+                    detached, TAG_BATCH_SIZE
+                ),
+            )
+            if not members:
+                return
+
+            await self.redis.unlink(*members)
+            keys = [
+                name.removeprefix(prefix)
+                for name in (raw.decode() for raw in members)
+                if name.startswith(prefix)
+            ]
+            if keys:
+                await self._broadcast(keys)
+
+    async def invalidate_all(self) -> None:
+        """
+        Remove every object of the namespace in O(1).
+
+        Bumps the namespace generation: entries stamped with an older one
+        are treated as misses and expire on their own TTL, so no `SCAN` or
+        `KEYS` is needed.
+        """
+        await self.redis.incr(self._generation_key())
+        await self._broadcast([INVALIDATE_ALL])
+
+    async def _broadcast(self, keys: list[str]) -> None:
+        """
+        Drop entries from the L1 of every worker, this one included.
+
+        Args:
+            keys:
+                Identifiers to drop, or `["*"]` for the whole namespace.
+        """
+        if self.local is not None:
+            await local_cache_invalidator.publish(self.redis, self.namespace, keys)
 
     async def exists(self, key: int | str) -> bool:
         """
         Check whether a cache entry exists.
 
         Note:
-            This does NOT validate the cached data, it only checks
-            for key existence in Redis.
+            This does NOT validate the cached data nor its generation, it
+            only checks for key existence in Redis.
 
         Args:
             key:
@@ -1,4 +1,5 @@
 from collections.abc import AsyncGenerator, Generator
+from dataclasses import dataclass
 
 import redis
 import redis.asyncio as aioredis
@@ -13,38 +14,107 @@ redis_settings = get_settings().redis
 
 
 # =============================================================================
-# Async Redis Client.
+# Async Redis Connection Pool.
 # =============================================================================
 
-async_redis = aioredis.Redis(
+# The single async pool of this process. Every async consumer (dependencies,
+# jwt blacklist, model caches, pub/sub listeners) shares it through
+# `async_redis`. Blocking pool: callers wait up to POOL_TIMEOUT for a free
+# connection instead of opening unbounded new ones.
+# Replies are raw bytes: cache payloads may be binary (see `codecs`), and
+# the few text consumers decode what they read.
+async_pool = aioredis.BlockingConnectionPool(
+    connection_class=(
+        aioredis.SSLConnection if redis_settings.SSL else aioredis.Connection
+    ),
     host=redis_settings.HOST,
     port=redis_settings.PORT,
     db=redis_settings.DB,
     password=redis_settings.PASSWORD,
-    ssl=redis_settings.SSL,
     socket_timeout=redis_settings.SOCKET_TIMEOUT,
     socket_connect_timeout=redis_settings.SOCKET_CONNECT_TIMEOUT,
+    socket_keepalive=True,
+    health_check_interval=redis_settings.HEALTH_CHECK_INTERVAL,
     max_connections=redis_settings.MAX_CONNECTIONS,
-    decode_responses=True,
+    timeout=redis_settings.POOL_TIMEOUT,
+    decode_responses=False,
 )
 
 
 # =============================================================================
-# Sync Redis Client.
+# Sync Redis Connection Pool.
 # =============================================================================
 
-sync_redis = redis.Redis(
+# Shared by blocking callers only (CLI commands).
+sync_pool = redis.BlockingConnectionPool(
+    connection_class=redis.SSLConnection if redis_settings.SSL else redis.Connection,
     host=redis_settings.HOST,
     port=redis_settings.PORT,
     db=redis_settings.DB,
     password=redis_settings.PASSWORD,
-    ssl=redis_settings.SSL,
     socket_timeout=redis_settings.SOCKET_TIMEOUT,
     socket_connect_timeout=redis_settings.SOCKET_CONNECT_TIMEOUT,
-    max_connections=redis_settings.MAX_CONNECTIONS,
-    decode_responses=True,
+    socket_keepalive=True,
+    health_check_interval=redis_settings.HEALTH_CHECK_INTERVAL,
+    max_connections=redis_settings.SYNC_MAX_CONNECTIONS,
+    timeout=redis_settings.POOL_TIMEOUT,
+    decode_responses=False,
 )
 
+
+# =============================================================================
+# Async Redis Client.
+# =============================================================================
+
+async_redis = aioredis.Redis(connection_pool=async_pool)
+
+
+# =============================================================================
+# Sync Redis Client.
+# =============================================================================
+
+sync_redis = redis.Redis(connection_pool=sync_pool)
+
+
+# =============================================================================
+# Redis Pool Stats.
+# =============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class RedisPoolStats:
+    max_connections: int
+    created: int
+    in_use: int
+    idle: int
+
+
+def get_redis_pool_stats() -> RedisPoolStats:
+    in_use = len(getattr(async_pool, "_in_use_connections", ()))
+    idle = len(getattr(async_pool, "_available_connections", ()))
+
+    return RedisPoolStats(
+        max_connections=async_pool.max_connections,
+        created=in_use + idle,
+        in_use=in_use,
+        idle=idle,
+    )
+
+
+# =============================================================================
+# Redis Pool Lifecycle Functions.
+# =============================================================================
+
+
+async def check_redis() -> None:
+    await async_redis.ping()  # type: ignore
+
+
+async def close_redis() -> None:
+    await async_pool.disconnect()
+    sync_pool.disconnect()
+
+
 # =============================================================================
 # FastAPI Dependencies Functions
 # =============================================================================
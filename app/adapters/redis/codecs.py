@@ -0,0 +1,209 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from hashlib import sha1
+from typing import Any, Protocol, cast
+from uuid import UUID
+
+# msgpack ships no type information.
+from msgpack import packb, unpackb  # pyright: ignore[reportUnknownVariableType]
+from msgpack.ext import ExtType
+from pydantic import BaseModel
+
+# =============================================================================
+# Codec Constants.
+# =============================================================================
+
+# msgpack extension types of the trusted codec, for the python types of a
+# `model_dump()` that msgpack has no native type for. Nothing else decodes.
+EXT_UUID = 1
+EXT_SET = 2
+EXT_FROZENSET = 3
+EXT_DATETIME = 4
+EXT_DATE = 5
+EXT_TIME = 6
+EXT_TIMEDELTA = 7
+EXT_DECIMAL = 8
+
+
+# =============================================================================
+# Cache Codec Protocol.
+# =============================================================================
+
+
+class CacheCodec(Protocol):
+    """
+    Turns model instances into Redis values and back.
+
+    `name` is part of every cache key, so switching codecs never reads
+    entries written in another format.
+    """
+
+    name: str
+
+    def encode(self, instance: BaseModel) -> bytes: ...
+
+    def decode[T: BaseModel](self, model: type[T], raw: bytes) -> T: ...
+
+
+# =============================================================================
+# Json Codec.
+# =============================================================================
+
+
+class JsonCodec:
+    """
+    JSON bytes straight from pydantic-core, fully validated on decode.
+    """
+
+    name = "json"
+
+    def encode(self, instance: BaseModel) -> bytes:
+        return instance.__pydantic_serializer__.to_json(instance)
+
+    def decode[T: BaseModel](self, model: type[T], raw: bytes) -> T:
+        return model.model_validate_json(raw)
+
+
+# =============================================================================
+# Msgpack Codec.
+# =============================================================================
+
+
+class MsgpackCodec:
+    """
+    Compact msgpack payloads, fully validated on decode.
+    """
+
+    name = "msgpack"
+
+    def encode(self, instance: BaseModel) -> bytes:
+        return cast(bytes, packb(instance.model_dump(mode="json")))
+
+    def decode[T: BaseModel](self, model: type[T], raw: bytes) -> T:
+        return model.model_validate(cast(object, unpackb(raw)))
+
+
+# =============================================================================
+# Trusted Codec.
+# =============================================================================
+
+
+def _pack_trusted(value: object) -> Any:
+    if isinstance(value, UUID):
+        return ExtType(EXT_UUID, value.bytes)
+    if isinstance(value, frozenset):
+        return ExtType(EXT_FROZENSET, _packb_trusted(list(cast(frozenset[Any], value))))
+    if isinstance(value, set):
+        return ExtType(EXT_SET, _packb_trusted(list(cast(set[Any], value))))
+    # datetime is a date subclass, so it goes first.
+    if isinstance(value, datetime):
+        return ExtType(EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return ExtType(EXT_DATE, value.isoformat().encode())
+    if isinstance(value, time):
+        return ExtType(EXT_TIME, value.isoformat().encode())
+    if isinstance(value, timedelta):
+        return ExtType(
+            EXT_TIMEDELTA,
+            _packb_trusted([value.days, value.seconds, value.microseconds]),
+        )
+    if isinstance(value, Decimal):
+        return ExtType(EXT_DECIMAL, str(value).encode())
+    if isinstance(value, Enum):
+        # Rebuilt from the model's annotations on decode.
+        return value.value
+
+    raise TypeError(f"Cannot encode {type(value).__name__!r} in the trusted codec.")
+
+
+def _unpack_trusted(code: int, data: bytes) -> Any:
+    if code == EXT_UUID:
+        return UUID(bytes=data)
+    if code == EXT_SET:
+        return set(_unpackb_trusted(data))
+    if code == EXT_FROZENSET:
+        return frozenset(_unpackb_trusted(data))
+    if code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == EXT_TIME:
+        return time.fromisoformat(data.decode())
+    if code == EXT_TIMEDELTA:
+        days, seconds, microseconds = _unpackb_trusted(data)
+        return timedelta(days=days, seconds=seconds, microseconds=microseconds)
+    if code == EXT_DECIMAL:
+        return Decimal(data.decode())
+
+    raise ValueError(f"Unknown msgpack extension type {code}.")
+
+
+def _packb_trusted(value: object) -> bytes:
+    return cast(bytes, packb(value, default=_pack_trusted))
+
+
+def _unpackb_trusted(raw: bytes) -> Any:
+    return cast(Any, unpackb(raw, ext_hook=_unpack_trusted))
+
+
+@cache
+def _enum_fields(model: type[BaseModel]) -> tuple[tuple[str, type[Enum]], ...]:
+    return tuple(
+        (name, field.annotation)
+        for name, field in model.model_fields.items()
+        if isinstance(field.annotation, type) and issubclass(field.annotation, Enum)
+    )
+
+
+class TrustedCodec:
+    """
+    Skip validation for entries this application wrote itself.
+
+    Stores the python-mode `model_dump()` as msgpack, with extension types
+    for UUIDs, sets, datetimes and decimals, and rebuilds it with
+    `model_construct`. Enum fields are restored from the model's own
+    annotations, so decoding never imports anything by name. Nested models
+    come back as dicts, so only use it for flat models in a Redis that
+    nothing else writes to.
+    """
+
+    name = "trusted"
+
+    def encode(self, instance: BaseModel) -> bytes:
+        return _packb_trusted(instance.model_dump())
+
+    def decode[T: BaseModel](self, model: type[T], raw: bytes) -> T:
+        data = cast(dict[str, Any], _unpackb_trusted(raw))
+        for name, enum in _enum_fields(model):
+            if data.get(name) is not None:
+                data[name] = enum(data[name])
+
+        return model.model_construct(**data)
+
+
+# =============================================================================
+# Schema Version Tag.
+# =============================================================================
+
+
+def schema_version(model: type[BaseModel], codec: CacheCodec) -> str:
+    """
+    Short fingerprint of the model's fields and the codec.
+
+    Used in cache keys, so entries written before a schema or codec change
+    are simply never read again and expire on their own TTL.
+    """
+    fields = sorted(
+        (name, repr(field.annotation)) for name, field in model.model_fields.items()
+    )
+    return sha1(f"{codec.name}:{fields}".encode()).hexdigest()[:8]
+
+
+# =============================================================================
+# Shared Codec Instances.
+# =============================================================================
+
+JSON_CODEC = JsonCodec()
+TRUSTED_CODEC = TrustedCodec()
@@ -0,0 +1,230 @@
+import asyncio
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from time import monotonic
+from typing import Any, cast
+
+from redis.asyncio.client import Redis
+from redis.exceptions import RedisError
+
+# =============================================================================
+# Local Cache Constants.
+# =============================================================================
+
+INVALIDATION_CHANNEL_PREFIX = "cache:invalidate:"
+INVALIDATE_ALL = "*"
+
+POLL_TIMEOUT = 1.0
+RECONNECT_DELAY = 1.0
+
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# Local Cache Stats.
+# =============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class LocalCacheStats:
+    namespace: str
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+
+# =============================================================================
+# In-process LRU Cache With TTL.
+# =============================================================================
+
+
+class LocalCache:
+    """
+    Bounded, in-process LRU cache whose entries also expire after `ttl`.
+
+    It stores already-validated model instances, which are shared between
+    callers: treat them as read-only.
+    """
+
+    __slots__ = ("namespace", "max_size", "ttl", "hits", "misses", "_entries")
+
+    def __init__(self, namespace: str, *, max_size: int, ttl: float) -> None:
+        self.namespace = namespace
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete_many(self, keys: list[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> LocalCacheStats:
+        return LocalCacheStats(
+            namespace=self.namespace,
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+# =============================================================================
+# Cross-worker Local Cache Invalidation.
+# =============================================================================
+
+
+class LocalCacheInvalidator:
+    """
+    Registry of the process's `LocalCache`s, kept coherent via pub/sub.
+
+    Every invalidation is published on `cache:invalidate:<namespace>` and
+    each worker's listener drops the named keys from its own L1. Local
+    caches are only served while the listener is connected; whenever the
+    subscription drops, every L1 is cleared, as messages may have been
+    missed.
+    """
+
+    def __init__(self) -> None:
+        self._caches: dict[str, LocalCache] = {}
+        self._connected = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._connected and self._task is not None and not self._task.done()
+
+    def cache(self, namespace: str, *, max_size: int, ttl: float) -> LocalCache:
+        local = self._caches.get(namespace)
+        if local is None:
+            local = LocalCache(namespace, max_size=max_size, ttl=ttl)
+            self._caches[namespace] = local
+
+        return local
+
+    def stats(self) -> list[LocalCacheStats]:
+        return [local.stats() for local in self._caches.values()]
+
+    async def publish(self, redis: Redis, namespace: str, keys: list[str]) -> None:
+        self._apply(namespace, keys)
+        channel = f"{INVALIDATION_CHANNEL_PREFIX}{namespace}"
+        await redis.publish(  # pyright: ignore[reportUnknownMemberType]
+            channel, json.dumps(keys)
+        )
+
+    async def start(self, redis: Redis) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._listen(redis), name="local-cache-invalidation"
+            )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+            self._disconnect()
+
+    async def _listen(self, redis: Redis) -> None:
+        while True:
+            pubsub = redis.pubsub(  # pyright: ignore[reportUnknownMemberType]
+                ignore_subscribe_messages=True
+            )
+            try:
+                await pubsub.psubscribe(f"{INVALIDATION_CHANNEL_PREFIX}*")
+                self._connected = True
+
+                while True:
+                    message = cast(
+                        dict[str, Any] | None,
+                        await pubsub.get_message(timeout=POLL_TIMEOUT),
+                    )
+                    if (
+                        message is not None
+                        and isinstance(channel := message["channel"], (str, bytes))
+                        and isinstance(data := message["data"], (str, bytes))
+                    ):
+                        self._on_message(channel, data)
+            except RedisError as exc:
+                self._disconnect()
+                logger.warning(
+                    "Local cache invalidation subscription lost, bypassing L1.",
+                    exc_info=exc,
+                )
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                await pubsub.aclose()
+
+    def _on_message(self, channel: str | bytes, data: str | bytes) -> None:
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+
+        try:
+            keys = json.loads(data)
+        except ValueError:
+            keys = [INVALIDATE_ALL]
+
+        self._apply(channel.removeprefix(INVALIDATION_CHANNEL_PREFIX), keys)
+
+    def _apply(self, namespace: str, keys: list[str]) -> None:
+        local = self._caches.get(namespace)
+        if local is None:
+            return
+
+        if INVALIDATE_ALL in keys:
+            local.clear()
+        else:
+            local.delete_many(keys)
+
+    def _disconnect(self) -> None:
+        self._connected = False
+        for local in self._caches.values():
+            local.clear()
+
+
+# =============================================================================
+# Shared Process-wide Instance.
+# =============================================================================
+
+local_cache_invalidator = LocalCacheInvalidator()
@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable
+
+from .exceptions import HasherSaturatedError
+from .interfaces import Hasher
+
+# =============================================================================
+# Hashing Pool Stats.
+# =============================================================================
+
+
+@dataclass(slots=True, frozen=True)
+class HashingPoolStats:
+    workers: int
+    max_pending: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    avg_wait_ms: float
+    avg_run_ms: float
+    max_run_ms: float
+
+
+# =============================================================================
+# Async Hasher class.
+# =============================================================================
+
+
+class AsyncHasher:
+    """
+    Run a blocking `Hasher` on a dedicated, bounded thread pool.
+
+    Argon2 releases the GIL while hashing, so worker threads keep the
+    event loop free. At most `max_pending` calls may be admitted at once
+    (running plus queued); any call beyond that is rejected immediately
+    with `HasherSaturatedError` instead of growing the queue.
+    """
+
+    def __init__(
+        self,
+        hasher: Hasher[str],
+        *,
+        max_workers: int,
+        max_pending: int,
+    ) -> None:
+        self._hasher = hasher
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="hasher",
+        )
+        self._lock = Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    async def hash(self, value: str) -> str:
+        return await self._submit(self._hasher.hash, value)
+
+    async def verify(self, value: str, hashed: str) -> bool:
+        return await self._submit(self._hasher.verify, value, hashed)
+
+    def stats(self) -> HashingPoolStats:
+        with self._lock:
+            completed = self._completed
+            return HashingPoolStats(
+                workers=self._max_workers,
+                max_pending=self._max_pending,
+                running=self._running,
+                queued=self._pending - self._running,
+                completed=completed,
+                rejected=self._rejected,
+                avg_wait_ms=self._wait_total / completed * 1000 if completed else 0.0,
+                avg_run_ms=self._run_total / completed * 1000 if completed else 0.0,
+                max_run_ms=self._run_max * 1000,
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit[R](self, fn: Callable[..., R], *args: str) -> R:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                raise HasherSaturatedError(
+                    "Password hashing is saturated, please retry shortly."
+                )
+            self._pending += 1
+
+        future = self._executor.submit(self._run, fn, perf_counter(), *args)
+        # Release the admission slot only when the worker is actually done,
+        # so a cancelled caller can not free capacity still in use.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _run[R](self, fn: Callable[..., R], enqueued_at: float, *args: str) -> R:
+        started_at = perf_counter()
+        with self._lock:
+            self._running += 1
+            self._wait_total += started_at - enqueued_at
+
+        try:
+            return fn(*args)
+        finally:
+            elapsed = perf_counter() - started_at
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._run_total += elapsed
+                self._run_max = max(self._run_max, elapsed)
+
+    def _release(self, _: Future[Any]) -> None:
+        with self._lock:
+            self._pending -= 1
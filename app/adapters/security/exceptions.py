@@ -0,0 +1,15 @@
+from app.core.exceptions.adapter import AdapterError
+
+# =============================================================================
+# Security Errors
+# =============================================================================
+
+
+class SecurityError(AdapterError):
+    """Base security adapter exception"""
+
+    pass
+
+
+class HasherSaturatedError(SecurityError):
+    pass
@@ -1,5 +1,8 @@
+from functools import lru_cache
+
 from app.core.config import get_settings
 
+from .async_hashing import AsyncHasher
 from .encryption import FernetEncryptor
 from .hashing import Argon2Hasher
 
@@ -18,6 +21,20 @@ def get_hasher() -> Argon2Hasher:
     return Argon2Hasher()
 
 
+# =============================================================================
+# Function that return process-wide AsyncHasher instance.
+# =============================================================================
+
+
+@lru_cache
+def get_async_hasher() -> AsyncHasher:
+    return AsyncHasher(
+        get_hasher(),
+        max_workers=settings.hashing.WORKERS,
+        max_pending=settings.hashing.MAX_PENDING,
+    )
+
+
 # =============================================================================
 # Function that return FernetEncryptor instance.
 # =============================================================================
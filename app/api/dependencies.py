@@ -1,24 +1,7 @@
 from functools import lru_cache
-from typing import Annotated
 
-from fastapi import Depends
-from redis.asyncio.client import Redis
+from fastapi import Request
 
-from app.adapters.db.session import get_async_session
-from app.adapters.db.unit_of_work import AsyncSession, AsyncUnitOfWork
-from app.adapters.redis.client import get_async_redis
-from app.modules.auth.commands.login import LoginCommand
-from app.modules.auth.commands.logout import LogoutCommand
-from app.modules.auth.commands.refresh_token import RefreshTokenCommand
-from app.modules.auth.handlers.login import LoginHandler
-from app.modules.auth.handlers.logout import LogoutHandler
-from app.modules.auth.handlers.refresh_token import RefreshTokenHandler
-from app.modules.auth.policies.login import LoginPolicy
-from app.modules.auth.policies.logout import LogoutPolicy
-from app.modules.auth.policies.refresh_token import RefreshTokenPolicy
-from app.modules.user.handlers.list import ListUserHandler
-from app.modules.user.policies.list import ListUserPolicy
-from app.modules.user.queries.list import ListUserQuery
 from app.shared.buses.command_bus import CommandBus
 from app.shared.buses.event_bus import EventBus
 from app.shared.buses.query_bus import QueryBus
@@ -39,36 +22,9 @@ def get_event_bus() -> EventBus:
 # =============================================================================
 
 
-@lru_cache
-def get_command_bus(
-    redis: Annotated[Redis, Depends(get_async_redis)],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
-    event_bus: Annotated[EventBus, Depends(get_event_bus)],
-) -> CommandBus:
-    bus = CommandBus(
-        uow_factory=lambda: AsyncUnitOfWork(session),
-        event_bus=event_bus,
-    )
-
-    bus.register(
-        LoginCommand,
-        policy=LoginPolicy(),
-        handler=LoginHandler(redis, session),
-    )
-
-    bus.register(
-        LogoutCommand,
-        policy=LogoutPolicy(),
-        handler=LogoutHandler(redis, session),
-    )
-
-    bus.register(
-        RefreshTokenCommand,
-        policy=RefreshTokenPolicy(),
-        handler=RefreshTokenHandler(redis, session),
-    )
-
-    return bus
+def get_command_bus(request: Request) -> CommandBus:
+    # Built once in lifespan, see `app.api.registry`.
+    return request.app.state.command_bus
 
 
 # =============================================================================
@@ -76,16 +32,6 @@ def get_command_bus(
 # =============================================================================
 
 
-@lru_cache
-def get_query_bus(
-    redis: Annotated[Redis, Depends(get_async_redis)],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> QueryBus:
-    bus = QueryBus()
-
-    bus.register(
-        ListUserQuery,
-        policy=ListUserPolicy(),
-        handler=ListUserHandler(redis, session),
-    )
-    return bus
+def get_query_bus(request: Request) -> QueryBus:
+    # Built once in lifespan, see `app.api.registry`.
+    return request.app.state.query_bus
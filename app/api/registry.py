@@ -0,0 +1,73 @@
+from redis.asyncio.client import Redis
+
+from app.adapters.db.unit_of_work import AsyncUnitOfWork
+from app.modules.auth.commands.login import LoginCommand
+from app.modules.auth.commands.logout import LogoutCommand
+from app.modules.auth.commands.refresh_token import RefreshTokenCommand
+from app.modules.auth.handlers.login import LoginHandler
+from app.modules.auth.handlers.logout import LogoutHandler
+from app.modules.auth.handlers.refresh_token import RefreshTokenHandler
+from app.modules.auth.policies.login import LoginPolicy
+from app.modules.auth.policies.logout import LogoutPolicy
+from app.modules.auth.policies.refresh_token import RefreshTokenPolicy
+from app.modules.user.handlers.export import ExportUserHandler
+from app.modules.user.handlers.list import ListUserHandler
+from app.modules.user.policies.list import ListUserPolicy
+from app.modules.user.queries.export import ExportUserQuery
+from app.modules.user.queries.list import ListUserQuery
+from app.shared.buses.command_bus import CommandBus
+from app.shared.buses.event_bus import EventBus
+from app.shared.buses.query_bus import QueryBus
+
+# =============================================================================
+# Building command bus once per process.
+# =============================================================================
+
+
+def build_command_bus(redis: Redis, event_bus: EventBus) -> CommandBus:
+    bus = CommandBus(
+        uow_factory=AsyncUnitOfWork,
+        event_bus=event_bus,
+    )
+
+    bus.register(
+        LoginCommand,
+        policy=LoginPolicy(),
+        handler=LoginHandler(redis),
+    )
+
+    bus.register(
+        LogoutCommand,
+        policy=LogoutPolicy(),
+        handler=LogoutHandler(redis),
+    )
+
+    bus.register(
+        RefreshTokenCommand,
+        policy=RefreshTokenPolicy(),
+        handler=RefreshTokenHandler(redis),
+    )
+
+    return bus
+
+
+# =============================================================================
+# Building query bus once per process.
+# =============================================================================
+
+
+def build_query_bus(redis: Redis) -> QueryBus:
+    bus = QueryBus()
+
+    bus.register(
+        ListUserQuery,
+        policy=ListUserPolicy(),
+        handler=ListUserHandler(redis),
+    )
+
+    bus.register(
+        ExportUserQuery,
+        policy=ListUserPolicy(),
+        handler=ExportUserHandler(redis),
+    )
+    return bus
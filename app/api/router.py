@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from app.core.config import get_settings
 
 from .routers import auth
+from .routers import internal
 from .routers import user
 
 # =============================================================================
@@ -18,3 +19,4 @@ settings = get_settings()
 router = APIRouter(prefix=settings.app.API_VERSION_PREFIX)
 router.include_router(auth.router)
 router.include_router(user.router)
+router.include_router(internal.router)
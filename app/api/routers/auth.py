@@ -1,8 +1,11 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
+from app.adapters.db.session import AsyncSession, get_async_session
+from app.adapters.rate_limit.identity import remote_address, token_subject
+from app.adapters.rate_limit.limiter import RateLimit, enforce_rate_limit, rate_limit
 from app.modules.auth.commands.login import LoginCommand
 from app.modules.auth.commands.logout import LogoutCommand
 from app.modules.auth.commands.refresh_token import RefreshTokenCommand
@@ -10,11 +13,16 @@ from app.shared.buses.command_bus import CommandBus
 from app.shared.response.schemas import DetailResponse
 
 from ..dependencies import get_command_bus
+from ..routing import RateLimitedRoute
 from ..schemas.login import TokenRead
 from ..schemas.logout import Logout
 from ..schemas.refresh_token import RefreshToken
 
-router = APIRouter(prefix="/auth", tags=["Auth Endpoints"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["Auth Endpoints"],
+    route_class=RateLimitedRoute,
+)
 
 # =============================================================================
 # User login endpoint.
@@ -26,16 +34,25 @@ router = APIRouter(prefix="/auth", tags=["Auth Endpoints"])
     summary="Issue new jwt tokens",
     description="Issue new jwt tokens to make requests on protected routes.",
 )
+@rate_limit(RateLimit.AUTH_IP)
 async def login(
+    request: Request,
     form: Annotated[OAuth2PasswordRequestForm, Depends()],
     bus: Annotated[CommandBus, Depends(get_command_bus)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> TokenRead:
+    # Checked before the handler runs argon2 on the submitted password.
+    await enforce_rate_limit(
+        RateLimit.LOGIN,
+        f"{remote_address(request.scope)}:{form.username.lower()}",
+    )
     tokens = await bus.dispatch(
         actor=None,
         command=LoginCommand(
             email=form.username,
             password=form.password,
         ),
+        session=session,
     )
     return TokenRead(**tokens)
 
@@ -50,15 +67,23 @@ async def login(
     summary="Refresh access token",
     description="Refresh access token using a valid refresh token.",
 )
+@rate_limit(RateLimit.AUTH_IP)
 async def refresh_token(
+    request: Request,
     payload: RefreshToken,
     bus: Annotated[CommandBus, Depends(get_command_bus)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> TokenRead:
+    await enforce_rate_limit(
+        RateLimit.REFRESH,
+        f"{remote_address(request.scope)}:{token_subject(payload.refresh_token)}",
+    )
     tokens = await bus.dispatch(
         actor=None,
         command=RefreshTokenCommand(
             refresh_token=payload.refresh_token,
         ),
+        session=session,
     )
     return TokenRead(**tokens)
 
@@ -73,15 +98,23 @@ async def refresh_token(
     summary="Logout authenticated user",
     description="Blacklist access and refresh token.",
 )
+@rate_limit(RateLimit.AUTH_IP)
 async def logout(
+    request: Request,
     payload: Logout,
     bus: Annotated[CommandBus, Depends(get_command_bus)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> DetailResponse:
+    await enforce_rate_limit(
+        RateLimit.LOGOUT,
+        f"{remote_address(request.scope)}:{token_subject(payload.access_token)}",
+    )
     message = await bus.dispatch(
         actor=None,
         command=LogoutCommand(
             refresh_token=payload.refresh_token,
             access_token=payload.access_token,
         ),
+        session=session,
     )
     return DetailResponse(**message)
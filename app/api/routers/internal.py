@@ -0,0 +1,39 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.adapters.db.session import get_db_pool_stats
+from app.adapters.redis.client import get_redis_pool_stats
+from app.adapters.security.providers import get_async_hasher
+from app.core.exceptions.http import PermissionDeniedError
+from app.shared.dependencies.get_current_user import get_current_user
+from app.shared.principal.schemas import Principal
+
+from ..schemas.internal import DbPoolRead, HashingPoolRead, PoolsRead, RedisPoolRead
+
+router = APIRouter(prefix="/internal", tags=["Internal Endpoints"])
+
+# =============================================================================
+# Connection pools stats endpoint.
+# =============================================================================
+
+
+@router.get(
+    path="/pools",
+    summary="Connection pool stats",
+    description=(
+        "Utilisation of this worker's database, redis and password hashing "
+        "pools, only access by superadmin."
+    ),
+)
+async def pool_stats(
+    actor: Annotated[Principal, Depends(get_current_user)],
+) -> PoolsRead:
+    if not actor.is_superadmin():
+        raise PermissionDeniedError("Permission denied.")
+
+    return PoolsRead(
+        db=DbPoolRead.model_validate(get_db_pool_stats()),
+        redis=RedisPoolRead.model_validate(get_redis_pool_stats()),
+        hasher=HashingPoolRead.model_validate(get_async_hasher().stats()),
+    )
@@ -1,17 +1,25 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
 
-from app.adapters.db.models.user import User
+from app.adapters.db.session import AsyncSession, get_read_session
+from app.modules.user.queries.export import ExportFormatEnum, ExportUserQuery
 from app.modules.user.queries.list import ListUserQuery
 from app.shared.buses.query_bus import QueryBus
 from app.shared.dependencies.get_current_user import get_current_user
+from app.shared.principal.schemas import Principal
 
 from ..dependencies import get_query_bus
 from ..schemas.user import UserRead
 
 router = APIRouter(prefix="/users", tags=["User Endpoints"])
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
 # =============================================================================
 # User endpoint.
 # =============================================================================
@@ -20,18 +28,60 @@ router = APIRouter(prefix="/users", tags=["User Endpoints"])
 @router.get(
     path="",
     summary="List users",
-    description="List users only access by admin.",
+    description=(
+        "List users only access by admin. Pass the `X-Next-Cursor` response "
+        "header back as `after` to fetch the next page by keyset."
+    ),
 )
 async def list_user(
-    actor: Annotated[User, Depends(get_current_user)],
+    actor: Annotated[Principal, Depends(get_current_user)],
     bus: Annotated[QueryBus, Depends(get_query_bus)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    response: Response,
     limit: int = 20,
     offset: int = 0,
+    after: str | None = None,
 ) -> list[UserRead]:
-    return await bus.dispatch(
+    page = await bus.dispatch(
         actor=actor,
         query=ListUserQuery(
             limit=limit,
             offset=offset,
+            after=after,
         ),
+        session=session,
+    )
+
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+
+    return page.items
+
+
+# =============================================================================
+# User export endpoint.
+# =============================================================================
+
+
+@router.get(
+    path="/export",
+    summary="Export users",
+    description="Stream every user as NDJSON or CSV, only access by admin.",
+    response_class=StreamingResponse,
+)
+async def export_user(
+    actor: Annotated[Principal, Depends(get_current_user)],
+    bus: Annotated[QueryBus, Depends(get_query_bus)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+) -> StreamingResponse:
+    chunks = await bus.dispatch(
+        actor=actor,
+        query=ExportUserQuery(format=format),
+        session=session,
+    )
+    return StreamingResponse(
+        content=chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="users.{format}"'},
     )
@@ -0,0 +1,46 @@
+from typing import Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.adapters.rate_limit.identity import remote_address
+from app.adapters.rate_limit.limiter import (
+    RATE_LIMITS_ATTR,
+    RateLimit,
+    enforce_rate_limit,
+)
+
+# =============================================================================
+# Route Handler Type.
+# =============================================================================
+
+type RouteHandler = Callable[[Request], Coroutine[None, None, Response]]
+
+
+# =============================================================================
+# Rate Limited Api Route.
+# =============================================================================
+
+
+class RateLimitedRoute(APIRoute):
+    """
+    `APIRoute` that enforces the endpoint's `@rate_limit` policies per
+    client IP before FastAPI parses the body or resolves dependencies, so
+    a throttled client costs one limiter check and nothing else.
+    """
+
+    def get_route_handler(self) -> RouteHandler:
+        handler = super().get_route_handler()
+        limits: tuple[RateLimit, ...] = getattr(self.endpoint, RATE_LIMITS_ATTR, ())
+
+        if not limits:
+            return handler
+
+        async def rate_limited_handler(request: Request) -> Response:
+            identity = f"{self.path}:{remote_address(request.scope)}"
+            for limit in limits:
+                await enforce_rate_limit(limit, identity)
+
+            return await handler(request)
+
+        return rate_limited_handler
@@ -0,0 +1,64 @@
+from pydantic import BaseModel, ConfigDict
+
+# =============================================================================
+# Database Pool Stats Schema.
+# =============================================================================
+
+
+class DbPoolRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    wait_histogram: dict[str, int]
+
+
+# =============================================================================
+# Redis Pool Stats Schema.
+# =============================================================================
+
+
+class RedisPoolRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    max_connections: int
+    created: int
+    in_use: int
+    idle: int
+
+
+# =============================================================================
+# Hashing Pool Stats Schema.
+# =============================================================================
+
+
+class HashingPoolRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    workers: int
+    max_pending: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    avg_wait_ms: float
+    avg_run_ms: float
+    max_run_ms: float
+
+
+# =============================================================================
+# Pools Stats Schema.
+# =============================================================================
+
+
+class PoolsRead(BaseModel):
+    db: DbPoolRead
+    redis: RedisPoolRead
+    hasher: HashingPoolRead
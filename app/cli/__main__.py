@@ -3,6 +3,7 @@ from time import sleep
 from click import group
 
 from app.adapters.db.session import init_sync_db
+from app.shared.principal.invalidation import register_principal_invalidation
 
 from .seed.group import seed_group
 from .user.group import user_group
@@ -33,6 +34,7 @@ def cli_group() -> None:
     """Entry point for the FastAPI-Init command-line interface."""
 
     wait_for_db()
+    register_principal_invalidation()
 
 
 # =============================================================================
@@ -1,3 +1,5 @@
+import asyncio
+
 import questionary
 from click import command, echo, option
 from sqlmodel import select
@@ -6,7 +8,7 @@ from app.adapters.db.models.role import Role
 from app.adapters.db.models.user import User
 from app.adapters.db.models.user_role import UserRole
 from app.adapters.db.session import SyncSessionLocal
-from app.adapters.security.providers import get_hasher
+from app.adapters.security.providers import get_async_hasher
 from app.shared.enums.user import UserStatusEnum
 
 # =============================================================================
@@ -28,7 +30,8 @@ def create_user_command(email: str, password: str) -> None:
     Create a new user with the given role.
     """
 
-    hasher = get_hasher()
+    # Hash on the shared worker pool before any DB work is started.
+    password_hash = asyncio.run(get_async_hasher().hash(password))
 
     with SyncSessionLocal() as session:
         try:
@@ -52,7 +55,7 @@ def create_user_command(email: str, password: str) -> None:
             # Create the user with the selected role.
             user = User(
                 email=email,
-                password_hash=hasher.hash(password),
+                password_hash=password_hash,
                 status=UserStatusEnum.ACTIVE,
             )
 
@@ -68,6 +68,14 @@ class CORSSettings(BaseSettings):
     ALLOW_METHODS: list[str] = ["*"]
     ALLOW_HEADERS: list[str] = ["*"]
     ALLOW_CREDENTIALS: bool = True
+    EXPOSE_HEADERS: list[str] = [
+        "X-Next-Cursor",
+        "X-RateLimit-Limit",
+        "X-RateLimit-Remaining",
+        "X-RateLimit-Reset",
+        "Retry-After",
+    ]
+    MAX_AGE: int = Field(default=600, ge=0)
 
 
 # =============================================================================
@@ -90,6 +98,15 @@ class DatabaseSettings(BaseSettings):
     USER: str = "postgres"
     PASSWORD: str = "postgres"
     NAME: str = "app"
+    POOL_SIZE: int = Field(default=10, ge=1)
+    MAX_OVERFLOW: int = Field(default=10, ge=0)
+    POOL_TIMEOUT: float = Field(default=30.0, gt=0)
+    POOL_RECYCLE: int = Field(default=1800, ge=-1)
+    PRE_PING: Literal["always", "idle", "never"] = "idle"
+    PRE_PING_IDLE_SECONDS: float = Field(default=30.0, ge=0)
+    REPLICA_URLS: list[str] = []
+    REPLICA_CHECK_SECONDS: float = Field(default=5.0, gt=0)
+    REPLICA_CHECK_TIMEOUT: float = Field(default=2.0, gt=0)
 
     @property
     def async_url(self) -> str:
@@ -131,6 +148,10 @@ class EmailSettings(BaseSettings):
     FROM_EMAIL: EmailStr = "noreply@example.com"
     FROM_NAME: str = "FastAPI-Init"
     TIMEOUT: int = Field(default=10, ge=1)
+    POOL_SIZE: int = Field(default=4, ge=1)
+    POOL_MAX_IDLE_SECONDS: float = Field(default=30.0, ge=0)
+    POOL_MAX_MESSAGES: int = Field(default=100, ge=1)
+    TEMPLATE_CACHE_DIR: str | None = None
 
     @property
     def is_enabled(self) -> bool:
@@ -159,6 +180,25 @@ class EncryptionSettings(BaseSettings):
     KEY: str = Fernet.generate_key().decode()
 
 
+# =============================================================================
+# Password hashing configuration.
+# =============================================================================
+
+
+class HashingSettings(BaseSettings):
+    """
+    Password hashing worker pool configuration.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="HASHER_",
+        **common_config,
+    )
+
+    WORKERS: int = Field(default=4, ge=1)
+    MAX_PENDING: int = Field(default=64, ge=1)
+
+
 # =============================================================================
 # JWT configuration.
 # =============================================================================
@@ -178,6 +218,9 @@ class JWTSettings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 7
+    VERIFIED_CACHE_SIZE: int = Field(default=10_000, ge=0)
+    REVOCATION_MAX_STALENESS_SECONDS: float = Field(default=5.0, gt=1.0)
+    REVOCATION_RESYNC_SECONDS: float = Field(default=300.0, gt=0)
 
 
 # =============================================================================
@@ -202,7 +245,10 @@ class RedisSettings(BaseSettings):
     SSL: bool = False
     SOCKET_TIMEOUT: int = 5
     SOCKET_CONNECT_TIMEOUT: int = 5
-    MAX_CONNECTIONS: int = 10
+    MAX_CONNECTIONS: int = Field(default=50, ge=1)
+    SYNC_MAX_CONNECTIONS: int = Field(default=10, ge=1)
+    POOL_TIMEOUT: int = Field(default=5, gt=0)
+    HEALTH_CHECK_INTERVAL: int = Field(default=30, ge=0)
 
     @property
     def url(self) -> str:
@@ -210,6 +256,47 @@ class RedisSettings(BaseSettings):
         return f"{'redis'}://{auth}{self.HOST}:{self.PORT}/{self.DB}"
 
 
+# =============================================================================
+# Rate limit configuration.
+# =============================================================================
+
+
+class RateLimitSettings(BaseSettings):
+    """
+    Rate limiter configuration.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="RATE_LIMIT_",
+        **common_config,
+    )
+
+    LOCAL_SHARE: float = Field(default=0.1, ge=0, le=1)
+    SYNC_SECONDS: float = Field(default=0.5, gt=0)
+    MAX_LOCAL_KEYS: int = Field(default=100_000, ge=1)
+
+
+# =============================================================================
+# Cache configuration.
+# =============================================================================
+
+
+class CacheSettings(BaseSettings):
+    """
+    Application cache configuration.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        **common_config,
+    )
+
+    PRINCIPAL_TTL: int = Field(default=300, ge=1)
+    RBAC_POLL_SECONDS: float = Field(default=2.0, gt=0)
+    LOCAL_TTL: float = Field(default=5.0, ge=0)
+    LOCAL_MAX_SIZE: int = Field(default=10_000, ge=1)
+
+
 # =============================================================================
 # Celery configuration.
 # =============================================================================
@@ -232,6 +319,13 @@ class CelerySettings(BaseSettings):
     ACCEPT_CONTENT: list[str] = ["json"]
     TIMEZONE: str = "UTC"
     ENABLE_UTC: bool = True
+    TASK_ALWAYS_EAGER: bool = False
+    TASK_EAGER_PROPAGATES: bool = True
+    TASK_ACKS_LATE: bool = True
+    DEFAULT_QUEUE: str = "default"
+    EMAIL_QUEUE: str = "email"
+    WORKER_PREFETCH_MULTIPLIER: int = Field(default=1, ge=0)
+    WORKER_CONCURRENCY: int | None = Field(default=None, ge=1)
 
 
 # =============================================================================
@@ -249,7 +343,10 @@ class Settings:
         self.cors = CORSSettings()
         self.db = DatabaseSettings()
         self.redis = RedisSettings()
+        self.cache = CacheSettings()
+        self.rate_limit = RateLimitSettings()
         self.encryption = EncryptionSettings()
+        self.hashing = HashingSettings()
         self.jwt = JWTSettings()
         self.celery = CelerySettings()
         self.email = EmailSettings()
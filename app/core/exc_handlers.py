@@ -7,7 +7,6 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from jose import JWTError
 from redis.exceptions import RedisError
-from slowapi.errors import RateLimitExceeded
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
@@ -16,6 +15,9 @@ from starlette.status import (
     HTTP_503_SERVICE_UNAVAILABLE,
 )
 
+from app.adapters.rate_limit.exceptions import RateLimitExceededError
+from app.adapters.security.exceptions import HasherSaturatedError
+
 from .exceptions._base import AppError
 from .exceptions.http import HttpError
 
@@ -57,11 +59,30 @@ async def app_http_error_handler(request: Request, exc: HttpError) -> JSONRespon
 # =============================================================================
 
 
-def rate_limit_exceeded(request: Request, exc: RateLimitExceeded) -> JSONResponse:
+async def rate_limit_exceeded_error_handler(
+    request: Request, exc: RateLimitExceededError
+) -> JSONResponse:
     logger.debug(msg="Rate limit exceeded", exc_info=exc)
     return JSONResponse(
         status_code=HTTP_429_TOO_MANY_REQUESTS,
-        content={"detail": "Rate limit exceeded"},
+        content={"detail": exc.detail},
+        headers=exc.result.headers,
+    )
+
+
+# =============================================================================
+# Password Hashing Pool Saturated.
+# =============================================================================
+
+
+async def hasher_saturated_error_handler(
+    request: Request, exc: HasherSaturatedError
+) -> JSONResponse:
+    logger.warning(msg="Password hashing pool saturated", exc_info=exc)
+    return JSONResponse(
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.detail},
+        headers={"Retry-After": "1"},
     )
 
 
@@ -118,8 +139,9 @@ async def unhandled_error_handler(request: Request, exc: Exception) -> JSONRespo
 
 error_handlers: list[tuple[Any, Any]] = [
     (AppError, app_error_handler),
+    (HasherSaturatedError, hasher_saturated_error_handler),
+    (RateLimitExceededError, rate_limit_exceeded_error_handler),
     (HttpError, app_http_error_handler),
-    (RateLimitExceeded, rate_limit_exceeded),
     (JWTError, jose_jwt_error_handler),
     (RedisError, redis_error_handler),
     (Exception, unhandled_error_handler),
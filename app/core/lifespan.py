@@ -3,9 +3,21 @@ from contextlib import asynccontextmanager
 from logging import getLogger
 
 from fastapi import FastAPI
-from redis.asyncio import from_url  # type: ignore
 
-from app.adapters.db.session import async_engine, init_async_db
+from app.adapters.db.session import (
+    AsyncSessionLocal,
+    async_engine,
+    init_async_db,
+    replica_router,
+)
+from app.adapters.jwt.revocation import revocation_snapshot
+from app.adapters.rate_limit.limiter import rate_limiter
+from app.adapters.redis.client import async_redis, check_redis, close_redis
+from app.adapters.redis.local_cache import local_cache_invalidator
+from app.adapters.security.providers import get_async_hasher
+from app.api.dependencies import get_event_bus
+from app.api.registry import build_command_bus, build_query_bus
+from app.shared.rbac.refresher import rbac_refresher
 
 from .config import get_settings
 
@@ -34,23 +46,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # ---- Startup ----
     logger.info("Starting application...")
 
-    # Create Redis client using RedisSettings.dsn
-    redis = from_url(
-        url=settings.redis.url,
-        encoding="utf-8",
-        decode_responses=True,
-    )
-
     try:
-        # Verify Redis connection
-        await redis.ping()  # type: ignore
-        app.state.redis = redis
+        # Verify the shared Redis pool before anything depends on it.
+        await check_redis()
         logger.info("Redis connected successfully.")
 
+        # Keep a local snapshot of revoked jwt ids in sync via pub/sub.
+        await revocation_snapshot.start(async_redis)
+
+        # Keep in-process L1 caches coherent across workers via pub/sub.
+        await local_cache_invalidator.start(async_redis)
+
         # Initialize database (migrations, tables, etc.)
         await init_async_db()
         logger.info("Database initialized successfully.")
 
+        # Route read-only sessions to healthy replicas, if any configured.
+        await replica_router.start()
+
+        # Build buses and their stateless handlers once per process.
+        app.state.command_bus = build_command_bus(async_redis, get_event_bus())
+        app.state.query_bus = build_query_bus(async_redis)
+
+        # Compile the role -> permission matrix and keep it fresh.
+        await rbac_refresher.start(async_redis, AsyncSessionLocal)
+
+        # Report locally admitted rate limit hits to Redis in batches.
+        await rate_limiter.start()
+
         yield
 
     except Exception as exc:
@@ -61,13 +84,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # ---- Shutdown ----
         logger.info("Shutting down application...")
 
+        await revocation_snapshot.stop()
+        await local_cache_invalidator.stop()
+        await rbac_refresher.stop()
+        await replica_router.stop()
+        await rate_limiter.stop()
+
         try:
-            if hasattr(app.state, "redis"):
-                await app.state.redis.close() # type: ignore
-                logger.info("Redis connection closed.")
+            await close_redis()
+            logger.info("Redis connection pools closed.")
         except Exception as exc:
             logger.exception("Error closing Redis connection.", exc_info=exc)
 
+        get_async_hasher().shutdown()
+        # The next lifespan (reload, tests) must get a fresh pool.
+        get_async_hasher.cache_clear()
+        logger.info("Password hashing pool shut down.")
+
         try:
             await async_engine.dispose()
             logger.info("Database engine disposed.")
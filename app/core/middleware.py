@@ -1,6 +1,13 @@
+from logging import getLogger
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from slowapi.middleware import SlowAPIMiddleware
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.adapters.rate_limit.identity import remote_address
+from app.adapters.rate_limit.limiter import RateLimit, rate_limiter
+from app.adapters.rate_limit.policy import RateLimitPolicy
+from app.adapters.rate_limit.tiered import TieredRateLimiter
 
 from .config import get_settings
 
@@ -10,6 +17,236 @@ from .config import get_settings
 
 settings = get_settings()
 
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+logger = getLogger(__name__)
+
+# =============================================================================
+# Middleware Constants.
+# =============================================================================
+
+SAFELISTED_HEADERS = frozenset(
+    {"accept", "accept-language", "content-language", "content-type"}
+)
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+RATE_LIMITED_BODY = b'{"detail":"Rate limit exceeded"}'
+RATE_LIMIT_KEY_PREFIX = "global"
+
+
+# =============================================================================
+# Pure ASGI CORS And Rate Limit Middleware.
+# =============================================================================
+
+
+class CORSRateLimitMiddleware:
+    """
+    CORS and the global per-IP rate limit in a single pure ASGI layer.
+
+    Unlike `BaseHTTPMiddleware` it spawns no task per request and passes
+    the body straight through, so streaming responses keep streaming.
+    Everything derived from settings (origin set, header values) is
+    computed once here, per request work is set lookups and one limiter
+    check. CORS preflights are answered directly and are not rate limited.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        allow_origins: list[str],
+        allow_methods: list[str],
+        allow_headers: list[str],
+        allow_credentials: bool,
+        expose_headers: list[str],
+        max_age: int,
+        policy: RateLimitPolicy,
+        limiter: TieredRateLimiter,
+    ) -> None:
+        self.app = app
+        self.policy = policy
+        self.limiter = limiter
+
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode() for origin in allow_origins)
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = SAFELISTED_HEADERS | {h.lower() for h in allow_headers}
+        methods = ALL_METHODS if "*" in allow_methods else allow_methods
+        self.allow_methods = frozenset(method.encode() for method in methods)
+
+        # Browsers reject "*" together with credentials, so echo the origin.
+        self.echo_origin = allow_credentials or not self.allow_all_origins
+
+        credentials: list[tuple[bytes, bytes]] = (
+            [(b"access-control-allow-credentials", b"true")]
+            if allow_credentials
+            else []
+        )
+        expose: list[tuple[bytes, bytes]] = (
+            [(b"access-control-expose-headers", ", ".join(expose_headers).encode())]
+            if expose_headers
+            else []
+        )
+        self.simple_headers = [*credentials, *expose]
+        self.preflight_headers = [
+            *credentials,
+            (b"access-control-allow-methods", b", ".join(sorted(self.allow_methods))),
+            (b"access-control-max-age", str(max_age).encode()),
+        ]
+        self.preflight_allow_headers = ", ".join(sorted(self.allow_headers)).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: bytes | None = None
+        request_method: bytes | None = None
+        request_headers: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if scope["method"] == "OPTIONS" and origin and request_method:
+            await self._preflight(send, origin, request_method, request_headers)
+            return
+
+        cors_headers = self._cors_headers(origin)
+
+        try:
+            result = await self.limiter.hit(
+                self.policy,
+                f"{RATE_LIMIT_KEY_PREFIX}:{remote_address(scope)}",
+            )
+        except RedisError as exc:
+            # Fail open: losing the global limit beats failing every request.
+            logger.warning("Global rate limit check failed.", exc_info=exc)
+            await self._forward(scope, receive, send, cors_headers)
+            return
+
+        limit_headers = [
+            (name.lower().encode(), value.encode())
+            for name, value in result.headers.items()
+        ]
+
+        if not result.allowed:
+            await self._respond(
+                send,
+                429,
+                [
+                    (b"content-type", b"application/json"),
+                    *cors_headers,
+                    *limit_headers,
+                ],
+                RATE_LIMITED_BODY,
+            )
+            return
+
+        await self._forward(scope, receive, send, [*cors_headers, *limit_headers])
+
+    async def _forward(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        extra_headers: list[tuple[bytes, bytes]],
+    ) -> None:
+        if not extra_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _origin_allowed(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.allow_origins
+
+    def _cors_headers(self, origin: bytes | None) -> list[tuple[bytes, bytes]]:
+        if origin is None or not self._origin_allowed(origin):
+            return []
+
+        if self.echo_origin:
+            return [
+                (b"access-control-allow-origin", origin),
+                (b"vary", b"Origin"),
+                *self.simple_headers,
+            ]
+
+        return [(b"access-control-allow-origin", b"*"), *self.simple_headers]
+
+    async def _preflight(
+        self,
+        send: Send,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+    ) -> None:
+        requested = {
+            header.strip().lower()
+            for header in (request_headers or b"").decode().split(",")
+            if header.strip()
+        }
+
+        if not self._origin_allowed(origin):
+            await self._respond(send, 400, [], b"Disallowed CORS origin")
+            return
+
+        if request_method not in self.allow_methods:
+            await self._respond(send, 400, [], b"Disallowed CORS method")
+            return
+
+        if not self.allow_all_headers and not self.allow_headers.issuperset(requested):
+            await self._respond(send, 400, [], b"Disallowed CORS headers")
+            return
+
+        allow_headers = (
+            request_headers
+            if self.allow_all_headers and request_headers
+            else self.preflight_allow_headers
+        )
+        await self._respond(
+            send,
+            200,
+            [
+                (
+                    b"access-control-allow-origin",
+                    origin if self.echo_origin else b"*",
+                ),
+                (b"vary", b"Origin"),
+                (b"access-control-allow-headers", allow_headers),
+                *self.preflight_headers,
+            ],
+            b"OK",
+        )
+
+    @staticmethod
+    async def _respond(
+        send: Send,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        if not any(name == b"content-type" for name, _ in headers):
+            headers = [(b"content-type", b"text/plain; charset=utf-8"), *headers]
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [*headers, (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
 
 # =============================================================================
 # Function That Include All Middlewares.
@@ -18,10 +255,13 @@ settings = get_settings()
 
 def include_middlewares(app: FastAPI) -> None:
     app.add_middleware(
-        CORSMiddleware,
+        CORSRateLimitMiddleware,
         allow_origins=settings.cors.ALLOW_ORIGINS,
         allow_methods=settings.cors.ALLOW_METHODS,
         allow_headers=settings.cors.ALLOW_HEADERS,
         allow_credentials=settings.cors.ALLOW_CREDENTIALS,
+        expose_headers=settings.cors.EXPOSE_HEADERS,
+        max_age=settings.cors.MAX_AGE,
+        policy=RateLimit.DEFAULT.policy,
+        limiter=rate_limiter,
     )
-    app.add_middleware(SlowAPIMiddleware)
@@ -3,13 +3,13 @@ from logging.config import dictConfig
 from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse
 
-from .adapters.rate_limit.limiter import limiter
 from .core.config import get_settings
 from .core.exc_handlers import register_exception_handlers
 from .core.lifespan import lifespan
 from .core.logging import LOGGING_CONFIG
 from .core.middleware import include_middlewares
 from .api.router import router
+from .shared.principal.invalidation import register_principal_invalidation
 
 # =============================================================================
 # Creating Settings Instance.
@@ -23,6 +23,12 @@ settings = get_settings()
 
 dictConfig(LOGGING_CONFIG)
 
+# =============================================================================
+# Drop Cached Principals When Users, Roles Or Permissions Change.
+# =============================================================================
+
+register_principal_invalidation()
+
 # =============================================================================
 # Creating FastAPI App Instance.
 # =============================================================================
@@ -33,12 +39,6 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# =============================================================================
-# Adding Slowapi limiter to FastAPI State.
-# =============================================================================
-
-app.state.limiter = limiter
-
 # =============================================================================
 # Register Custom Exception Handlers.
 # =============================================================================
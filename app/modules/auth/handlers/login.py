@@ -5,7 +5,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.adapters.db.models.user import User
 from app.adapters.jwt.manager import TokenTypeEnum
 from app.adapters.jwt.providers import get_jwt_token_manager
-from app.adapters.security.providers import get_hasher
+from app.adapters.security.providers import get_async_hasher
 from app.core.exceptions.domain import DomainError
 from app.core.exceptions.http import PermissionDeniedError
 from app.shared.enums.user import UserStatusEnum
@@ -22,21 +22,22 @@ class UserNotFoundError(DomainError):
 
 
 class LoginHandler:
-    def __init__(self, redis: Redis, session: AsyncSession) -> None:
+    def __init__(self, redis: Redis) -> None:
         self.redis = redis
-        self.session = session
-        self.hasher = get_hasher()
+        self.hasher = get_async_hasher()
         self.jwt_manager = get_jwt_token_manager(redis)
 
-    async def __call__(self, command: LoginCommand) -> dict[str, str]:
+    async def __call__(
+        self, command: LoginCommand, session: AsyncSession
+    ) -> dict[str, str]:
         # Check if user exists.
         stmt = select(User).where(User.email == command.email)
-        user = (await self.session.exec(stmt)).one_or_none()
+        user = (await session.exec(stmt)).one_or_none()
         if user is None:
             raise UserNotFoundError("User not found.")
 
         # Check if password is correct.
-        if not self.hasher.verify(
+        if not await self.hasher.verify(
             value=command.password,
             hashed=user.password_hash,
         ):
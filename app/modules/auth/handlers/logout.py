@@ -13,9 +13,8 @@ type VerifyFn = Callable[..., Awaitable[Mapping[str, Any]]]
 
 
 class LogoutHandler:
-    def __init__(self, redis: Redis, session: AsyncSession) -> None:
+    def __init__(self, redis: Redis) -> None:
         self.redis = redis
-        self.session = session
         self.jwt_manager = get_jwt_token_manager(redis)
 
     async def _revoke_if_valid(self, token: str, type: TokenTypeEnum) -> None:
@@ -25,7 +24,9 @@ class LogoutHandler:
         except JwtError:
             pass
 
-    async def __call__(self, command: LogoutCommand) -> dict[str, str]:
+    async def __call__(
+        self, command: LogoutCommand, session: AsyncSession
+    ) -> dict[str, str]:
         # Revoke access token if valid.
         await self._revoke_if_valid(command.access_token, TokenTypeEnum.ACCESS)
 
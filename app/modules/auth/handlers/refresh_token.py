@@ -21,12 +21,13 @@ class UserNotFoundError(DomainError):
 
 
 class RefreshTokenHandler:
-    def __init__(self, redis: Redis, session: AsyncSession) -> None:
+    def __init__(self, redis: Redis) -> None:
         self.redis = redis
-        self.session = session
         self.jwt_manager = get_jwt_token_manager(redis)
 
-    async def __call__(self, command: RefreshTokenCommand) -> dict[str, str]:
+    async def __call__(
+        self, command: RefreshTokenCommand, session: AsyncSession
+    ) -> dict[str, str]:
         try:
             claims = await self.jwt_manager.verify_token(
                 command.refresh_token, TokenTypeEnum.REFRESH
@@ -1,7 +1,7 @@
-from app.adapters.db.models.user import User
+from app.shared.principal.schemas import Principal
 from ..commands.login import LoginCommand
 
 
 class LoginPolicy:
-    async def __call__(self, actor: User | None, command: LoginCommand) -> None:
+    async def __call__(self, actor: Principal | None, command: LoginCommand) -> None:
         pass
@@ -1,7 +1,7 @@
-from app.adapters.db.models.user import User
+from app.shared.principal.schemas import Principal
 from ..commands.logout import LogoutCommand
 
 
 class LogoutPolicy:
-    async def __call__(self, actor: User | None, command: LogoutCommand) -> None:
+    async def __call__(self, actor: Principal | None, command: LogoutCommand) -> None:
         pass
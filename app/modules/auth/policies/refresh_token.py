@@ -1,7 +1,9 @@
-from app.adapters.db.models.user import User
+from app.shared.principal.schemas import Principal
 from ..commands.refresh_token import RefreshTokenCommand
 
 
 class RefreshTokenPolicy:
-    async def __call__(self, actor: User | None, command: RefreshTokenCommand) -> None:
+    async def __call__(
+        self, actor: Principal | None, command: RefreshTokenCommand
+    ) -> None:
         pass
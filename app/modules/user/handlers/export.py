@@ -0,0 +1,89 @@
+import csv
+import json
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+from io import StringIO
+from typing import Any, cast
+from uuid import UUID
+
+from redis.asyncio.client import Redis
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.models.user import User
+
+from ..queries.export import ExportFormatEnum, ExportUserQuery
+from .list import USER_LIST_COLUMNS
+
+# =============================================================================
+# Export Constants
+# =============================================================================
+
+EXPORT_BATCH_SIZE = 1000
+
+# =============================================================================
+# Row Serializer Functions.
+# =============================================================================
+
+
+def _to_text(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _ndjson_chunk(rows: Iterable[RowMapping]) -> str:
+    return "".join(
+        json.dumps({key: _to_text(value) for key, value in row.items()}) + "\n"
+        for row in rows
+    )
+
+
+def _csv_chunk(rows: Iterable[Iterable[Any]]) -> str:
+    buffer = StringIO()
+    csv.writer(buffer).writerows([_to_text(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+# =============================================================================
+# Export user handler.
+# =============================================================================
+
+
+class ExportUserHandler:
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+
+    async def __call__(
+        self, query: ExportUserQuery, session: AsyncSession
+    ) -> AsyncIterator[str]:
+        # The session is request-scoped and stays open until the response
+        # has been fully streamed.
+        return self._stream(query, session)
+
+    async def _stream(
+        self, query: ExportUserQuery, session: AsyncSession
+    ) -> AsyncIterator[str]:
+        # Server-side cursor: rows are fetched and emitted one batch at a
+        # time, so memory stays flat regardless of table size.
+        result = cast(
+            AsyncResult[Any],
+            await session.stream(
+                select(*USER_LIST_COLUMNS)  # type: ignore
+                .order_by(User.created_at, User.id)  # type: ignore
+                .execution_options(yield_per=EXPORT_BATCH_SIZE)
+            ),
+        )
+
+        if query.format is ExportFormatEnum.CSV:
+            yield _csv_chunk([result.keys()])
+
+        async for partition in result.mappings().partitions():
+            if query.format is ExportFormatEnum.CSV:
+                yield _csv_chunk(row.values() for row in partition)
+            else:
+                yield _ndjson_chunk(partition)
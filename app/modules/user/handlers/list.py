@@ -1,26 +1,80 @@
-from typing import Sequence
+from collections.abc import Mapping
+from typing import Any
 
 from redis.asyncio.client import Redis
-from sqlmodel import select
+from sqlalchemy import literal, tuple_
+from sqlmodel import col, select
 
+from app.adapters.db.loading import relationship_options
 from app.adapters.db.models.user import User
+from app.shared.pagination.cursor import decode_cursor, encode_cursor
+from app.shared.pagination.page import CursorPage
 from ..queries.list import ListUserQuery
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+# =============================================================================
+# Columns Selected By The Projection Query.
+# =============================================================================
+
+USER_LIST_COLUMNS = (
+    User.id,
+    User.email,
+    User.status,
+    User.created_at,
+    User.updated_at,
+)
+
 
 class ListUserHandler:
-    def __init__(self, redis: Redis, session: AsyncSession) -> None:
+    def __init__(self, redis: Redis) -> None:
         self.redis = redis
-        self.session = session
-
-    async def __call__(self, query: ListUserQuery) -> Sequence[User]:
-        user = (
-            await self.session.exec(
-                select(User)
-                .limit(query.limit)
-                .offset(query.offset)
-                .order_by(User.created_at)  # type: ignore
-            )
-        ).all()
-
-        return user
+
+    async def __call__(
+        self, query: ListUserQuery, session: AsyncSession
+    ) -> CursorPage[Any]:
+        if query.include:
+            items = await self._select_users(query, session)
+            last = items[-1] if items else None
+            position = (last.created_at, last.id) if last else None
+        else:
+            items = await self._select_rows(query, session)
+            last = items[-1] if items else None
+            position = (last["created_at"], last["id"]) if last else None
+
+        next_cursor = None
+        if position is not None and len(items) == query.limit:
+            next_cursor = encode_cursor(*position)
+
+        return CursorPage(items=items, next_cursor=next_cursor)
+
+    async def _select_rows(
+        self, query: ListUserQuery, session: AsyncSession
+    ) -> list[Mapping[str, Any]]:
+        # A single narrow SELECT, no identity map and no relationship loads.
+        stmt = self._paginate(select(*USER_LIST_COLUMNS), query)  # type: ignore
+        return list((await session.exec(stmt)).mappings().all())  # type: ignore
+
+    async def _select_users(
+        self, query: ListUserQuery, session: AsyncSession
+    ) -> list[User]:
+        # Full entities with only the requested relationships loaded.
+        stmt = self._paginate(
+            select(User).options(*relationship_options(User, query.include)),
+            query,
+        )
+        return list((await session.exec(stmt)).all())
+
+    @staticmethod
+    def _paginate[S: Any](stmt: S, query: ListUserQuery) -> S:
+        # (created_at, id) is unique and time-ordered, so it gives a stable
+        # order for both offset and keyset pages.
+        stmt = stmt.order_by(User.created_at, User.id).limit(query.limit)
+
+        if query.after is None:
+            return stmt.offset(query.offset)
+
+        created_at, user_id = decode_cursor(query.after)
+        return stmt.where(
+            tuple_(col(User.created_at), col(User.id))
+            > tuple_(literal(created_at), literal(user_id))
+        )
@@ -1,11 +1,15 @@
-from app.adapters.db.models.user import User
 from app.core.exceptions.http import PermissionDeniedError
 from app.shared.enums.permission import PermissionEnum
+from app.shared.principal.schemas import Principal
 
+from ..queries.export import ExportUserQuery
 from ..queries.list import ListUserQuery
 
 
 class ListUserPolicy:
-    async def __call__(self, actor: User, query: ListUserQuery) -> None:
+    async def __call__(
+        self, actor: Principal, query: ListUserQuery | ExportUserQuery
+    ) -> None:
+        # Exporting exposes the same data as listing, so it needs the same right.
         if not actor.has_permission(PermissionEnum.USER_LIST):
             raise PermissionDeniedError("Permission denied.")
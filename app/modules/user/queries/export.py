@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class ExportFormatEnum(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+@dataclass(slots=True)
+class ExportUserQuery:
+    format: ExportFormatEnum
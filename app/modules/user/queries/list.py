@@ -4,4 +4,7 @@ from dataclasses import dataclass
 @dataclass(slots=True)
 class ListUserQuery:
     limit: int
-    offset: int
+    offset: int = 0
+    after: str | None = None
+    # Relationships to load; empty selects only the listed columns.
+    include: tuple[str, ...] = ()
@@ -1,6 +1,8 @@
 from typing import Any, Callable
 
-from app.adapters.db.models.user import User
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.shared.principal.schemas import Principal
 from app.shared.protocols.command import Command
 from app.shared.protocols.uow import UnitOfWork
 from app.shared.protocols.handlers import CommandHandler, CommandPolicy
@@ -10,7 +12,7 @@ from .event_bus import EventBus
 class CommandBus:
     def __init__(
         self,
-        uow_factory: Callable[[], UnitOfWork],
+        uow_factory: Callable[[AsyncSession], UnitOfWork],
         event_bus: EventBus,
     ) -> None:
         self._policies: dict[type, Any] = {}
@@ -28,7 +30,9 @@ class CommandBus:
         self._policies[command] = policy
         self._handlers[command] = handler
 
-    async def dispatch(self, actor: User | None, command: Command) -> Any:
+    async def dispatch(
+        self, actor: Principal | None, command: Command, session: AsyncSession
+    ) -> Any:
         policy = self._policies.get(type(command))
         handler = self._handlers.get(type(command))
 
@@ -37,8 +41,8 @@ class CommandBus:
 
         await policy(actor, command)
 
-        async with self._uow_factory() as uow:
-            result = await handler(command)
+        async with self._uow_factory(session) as uow:
+            result = await handler(command, uow.session)
             await uow.session.flush()
 
             # Publish domain events AFTER commit
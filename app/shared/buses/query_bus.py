@@ -1,6 +1,8 @@
 from typing import Any
 
-from app.adapters.db.models.user import User
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.shared.principal.schemas import Principal
 from app.shared.protocols.query import Query
 from app.shared.protocols.handlers import QueryHandler, QueryPolicy
 
@@ -20,7 +22,9 @@ class QueryBus:
         self._policies[query] = policy
         self._handlers[query] = handler
 
-    async def dispatch(self, actor: User | None, query: Query) -> Any:
+    async def dispatch(
+        self, actor: Principal | None, query: Query, session: AsyncSession
+    ) -> Any:
         policy = self._policies.get(type(query))
         handler = self._handlers.get(type(query))
 
@@ -29,4 +33,4 @@ class QueryBus:
 
         await policy(actor, query)
 
-        return await handler(query)
+        return await handler(query, session)
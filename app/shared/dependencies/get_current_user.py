@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from redis.asyncio import Redis
@@ -7,7 +9,10 @@ from app.adapters.db.models.user import User
 from app.adapters.db.session import AsyncSession, get_async_session
 from app.adapters.redis.client import get_async_redis
 from app.adapters.jwt.exceptions import JwtError
-from app.adapters.jwt.manager import JwtTokenManager, TokenTypeEnum
+from app.adapters.jwt.manager import TokenTypeEnum
+from app.adapters.jwt.providers import get_jwt_token_manager
+from app.shared.principal.cache import get_principal_cache
+from app.shared.principal.schemas import Principal
 
 # =============================================================================
 # Get current user function.
@@ -22,9 +27,10 @@ async def get_current_user(
         )
     ),
     redis: Redis = Depends(get_async_redis),
+    # The primary: a replica may lag behind role or status changes.
     session: AsyncSession = Depends(get_async_session),
-) -> User:
-    jwt_token_manager = JwtTokenManager(redis)
+) -> Principal:
+    jwt_token_manager = get_jwt_token_manager(redis)
 
     try:
         claims = await jwt_token_manager.verify_token(
@@ -37,18 +43,21 @@ async def get_current_user(
             detail="Invalid or expired access token.",
         )
 
-    user = (
-        await session.exec(
-            select(User).where(
-                User.id == claims["id"],
+    async def load_principal() -> Principal:
+        user = (
+            await session.exec(
+                select(User).where(
+                    User.id == UUID(claims["id"]),
+                )
             )
-        )
-    ).one_or_none()
+        ).one_or_none()
 
-    if user is None:
-        raise HTTPException(
-            status_code=404,
-            detail="User not found.",
-        )
+        if user is None:
+            raise HTTPException(
+                status_code=404,
+                detail="User not found.",
+            )
+
+        return Principal.from_user(user)
 
-    return user
+    return await get_principal_cache(redis).get_or_set(claims["id"], load_principal)
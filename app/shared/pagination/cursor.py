@@ -0,0 +1,47 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from uuid import UUID
+
+from app.core.exceptions.domain import DomainError
+
+# =============================================================================
+# Invalid cursor error.
+# =============================================================================
+
+
+class InvalidCursorError(DomainError):
+    pass
+
+
+# =============================================================================
+# Keyset Cursor Encode/Decode Functions.
+# =============================================================================
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode a `(created_at, id)` keyset position as a URL-safe token.
+
+    The token is plain base64 JSON, not signed: clients can read and craft
+    it, which only moves them to another position in the same ordering.
+    """
+    raw = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode and validate a token produced by `encode_cursor`.
+
+    Raises:
+        InvalidCursorError: If the token does not decode to a timestamp and
+            a UUID.
+    """
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (BinasciiError, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid pagination cursor.") from exc
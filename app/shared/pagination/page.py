@@ -0,0 +1,12 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+# =============================================================================
+# Cursor Page Model.
+# =============================================================================
+
+
+@dataclass(slots=True)
+class CursorPage[T]:
+    items: Sequence[T]
+    next_cursor: str | None
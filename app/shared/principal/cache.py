@@ -0,0 +1,70 @@
+from collections.abc import Iterable
+from functools import lru_cache
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.adapters.redis.cache import RedisModelCache
+from app.core.config import get_settings
+
+from .schemas import Principal
+
+# =============================================================================
+# Principal Cache Constants
+# =============================================================================
+
+PRINCIPAL_CACHE_NAMESPACE = "principals"
+
+# =============================================================================
+# Creating Settings Instance.
+# =============================================================================
+
+settings = get_settings()
+
+
+# =============================================================================
+# Principal Cache Tags.
+# =============================================================================
+
+
+def role_tag(role_id: UUID) -> str:
+    """
+    Tag of every cached principal holding the role.
+    """
+    return f"role:{role_id}"
+
+
+# =============================================================================
+# Principal Cache Class.
+# =============================================================================
+
+
+class PrincipalCache(RedisModelCache[Principal]):
+    """
+    Redis cache of authenticated principals keyed by user id, tagged with
+    `role:<id>` for each of their roles.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        super().__init__(
+            model=Principal,
+            redis=redis,
+            namespace=PRINCIPAL_CACHE_NAMESPACE,
+            ttl=settings.cache.PRINCIPAL_TTL,
+            local_ttl=settings.cache.LOCAL_TTL,
+            local_max_size=settings.cache.LOCAL_MAX_SIZE,
+        )
+
+    def tags_for(self, instance: Principal) -> Iterable[str]:
+        return map(role_tag, instance.role_ids)
+
+
+# =============================================================================
+# Function that return process-wide PrincipalCache instance.
+# =============================================================================
+
+
+@lru_cache
+def get_principal_cache(redis: Redis) -> PrincipalCache:
+    # One cache per Redis client, i.e. one per process for `async_redis`.
+    return PrincipalCache(redis)
@@ -0,0 +1,139 @@
+import asyncio
+from logging import getLogger
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.adapters.db.models import Permission, Role, RolePermission, User, UserRole
+from app.adapters.redis.client import async_redis
+from app.shared.rbac.refresher import bump_rbac_version, rbac_refresher
+
+from .cache import get_principal_cache, role_tag
+
+# =============================================================================
+# Invalidation Constants
+# =============================================================================
+
+SESSION_INFO_KEY = "principal_invalidation"
+
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+
+logger = getLogger(__name__)
+
+# Keep strong references so scheduled invalidations are not garbage collected.
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+# =============================================================================
+# Pending Invalidation Record.
+# =============================================================================
+
+
+class PendingInvalidation:
+    __slots__ = ("user_ids", "role_ids", "rbac_changed", "permissions_changed")
+
+    def __init__(self) -> None:
+        self.user_ids: set[UUID] = set()
+        self.role_ids: set[UUID] = set()
+        self.rbac_changed = False
+        self.permissions_changed = False
+
+
+# =============================================================================
+# Invalidation Functions.
+# =============================================================================
+
+
+async def invalidate_principals(pending: PendingInvalidation) -> None:
+    cache = get_principal_cache(async_redis)
+
+    try:
+        if pending.rbac_changed:
+            rbac_refresher.mark_stale()
+            await bump_rbac_version(async_redis)
+
+        if pending.permissions_changed:
+            # A permission row may belong to any role.
+            await cache.invalidate_all()
+            return
+
+        for role_id in pending.role_ids:
+            await cache.invalidate_tag(role_tag(role_id))
+        await cache.invalidate_many(list(map(str, pending.user_ids)))
+    except RedisError as exc:
+        # Cached principals still expire on their own TTL.
+        logger.warning("Principal cache invalidation failed.", exc_info=exc)
+
+
+async def _invalidate_and_disconnect(pending: PendingInvalidation) -> None:
+    try:
+        await invalidate_principals(pending)
+    finally:
+        # Connections are bound to this short-lived loop, drop them.
+        await async_redis.connection_pool.disconnect()
+
+
+# =============================================================================
+# SQLAlchemy Session Event Listeners.
+# =============================================================================
+
+
+def _collect(session: Session, _: Any) -> None:
+    pending: PendingInvalidation = session.info.setdefault(
+        SESSION_INFO_KEY, PendingInvalidation()
+    )
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            pending.user_ids.add(obj.id)
+        elif isinstance(obj, UserRole):
+            pending.user_ids.add(obj.user_id)
+        elif isinstance(obj, Role):
+            pending.role_ids.add(obj.id)
+            pending.rbac_changed = True
+        elif isinstance(obj, RolePermission):
+            pending.role_ids.add(obj.role_id)
+            pending.rbac_changed = True
+        elif isinstance(obj, Permission):
+            pending.permissions_changed = True
+            pending.rbac_changed = True
+
+
+def _dispatch(session: Session) -> None:
+    pending: PendingInvalidation | None = session.info.pop(SESSION_INFO_KEY, None)
+    if pending is None or not (pending.user_ids or pending.rbac_changed):
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Sync sessions (CLI, seeders) run outside any event loop.
+        asyncio.run(_invalidate_and_disconnect(pending))
+        return
+
+    task = loop.create_task(invalidate_principals(pending))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _discard(session: Session) -> None:
+    session.info.pop(SESSION_INFO_KEY, None)
+
+
+def register_principal_invalidation() -> None:
+    """
+    Invalidate cached principals whenever user, role or permission rows
+    are committed, for both sync and async sessions.
+    """
+    if event.contains(Session, "after_flush", _collect):
+        return
+
+    event.listen(Session, "after_flush", _collect)
+    event.listen(Session, "after_commit", _dispatch)
+    event.listen(Session, "after_rollback", _discard)
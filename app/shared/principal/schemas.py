@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.adapters.db.models.user import User
+from app.shared.enums.permission import PermissionEnum
+from app.shared.enums.role import RoleEnum
+from app.shared.enums.user import UserStatusEnum
+from app.shared.rbac.index import rbac_index
+
+# =============================================================================
+# Principal Schema.
+# =============================================================================
+
+
+class Principal(BaseModel):
+    """
+    Slim, serializable identity of the authenticated user.
+
+    Holds only what authorization needs, so it can be cached and used by
+    policies without loading the `User` ORM graph.
+    """
+
+    id: UUID
+    status: UserStatusEnum
+    role_ids: set[UUID]
+    role_names: set[str]
+    permission_codes: set[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            status=user.status,
+            role_ids={user_role.role_id for user_role in user.user_roles},
+            role_names=set(user.role_names),
+            permission_codes={code.value for code in user.permission_codes},
+        )
+
+    def is_superadmin(self) -> bool:
+        return RoleEnum.SUPERADMIN.value in self.role_names
+
+    def has_role(self, role_name: RoleEnum) -> bool:
+        if self.is_superadmin():
+            return True
+
+        return role_name.value in self.role_names
+
+    def has_permission(self, permission: PermissionEnum) -> bool:
+        if self.is_superadmin():
+            return True
+
+        if rbac_index.is_loaded:
+            return rbac_index.allows(self.role_names, permission)
+
+        return permission.value in self.permission_codes
@@ -1,5 +1,4 @@
 from typing import Any, Protocol
-from redis.asyncio import Redis
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
@@ -9,10 +8,9 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class CommandHandler(Protocol):
-    redis: Redis
-    session: AsyncSession
+    """Stateless, process-wide handler; the session is passed per dispatch."""
 
-    async def __call__(self, command: Any) -> Any: ...
+    async def __call__(self, command: Any, session: AsyncSession) -> Any: ...
 
 
 # =============================================================================
@@ -21,10 +19,9 @@ class CommandHandler(Protocol):
 
 
 class QueryHandler(Protocol):
-    redis: Redis
-    session: AsyncSession
+    """Stateless, process-wide handler; the session is passed per dispatch."""
 
-    async def __call__(self, query: Any) -> Any: ...
+    async def __call__(self, query: Any, session: AsyncSession) -> Any: ...
 
 
 # =============================================================================
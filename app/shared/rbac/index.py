@@ -0,0 +1,75 @@
+from collections.abc import Iterable, Mapping
+
+from app.shared.enums.permission import PermissionEnum
+
+# =============================================================================
+# Permission Bit Positions.
+# =============================================================================
+
+PERMISSION_BITS: dict[PermissionEnum, int] = {
+    permission: 1 << position for position, permission in enumerate(PermissionEnum)
+}
+
+
+# =============================================================================
+# Process-wide RBAC Index.
+# =============================================================================
+
+
+class RbacIndex:
+    """
+    Compiled role -> permission matrix.
+
+    Every `PermissionEnum` member owns one bit and every role is stored
+    as the OR of its permission bits, so a permission check is a single
+    AND against the combined mask of the actor's roles. Combined masks
+    are memoised per distinct role set until the next `replace`.
+    """
+
+    __slots__ = ("version", "_role_masks", "_combined")
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._role_masks: dict[str, int] = {}
+        self._combined: dict[frozenset[str], int] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version > 0
+
+    def replace(self, role_permissions: Mapping[str, Iterable[PermissionEnum]]) -> None:
+        role_masks: dict[str, int] = {}
+        for role_name, permissions in role_permissions.items():
+            mask = 0
+            for permission in permissions:
+                mask |= PERMISSION_BITS[permission]
+            role_masks[role_name] = mask
+
+        self._role_masks = role_masks
+        self._combined = {}
+        self.version += 1
+
+    def role_mask(self, role_name: str) -> int:
+        return self._role_masks.get(role_name, 0)
+
+    def mask_for(self, role_names: Iterable[str]) -> int:
+        key = frozenset(role_names)
+        mask = self._combined.get(key)
+
+        if mask is None:
+            mask = 0
+            for role_name in key:
+                mask |= self.role_mask(role_name)
+            self._combined[key] = mask
+
+        return mask
+
+    def allows(self, role_names: Iterable[str], permission: PermissionEnum) -> bool:
+        return bool(self.mask_for(role_names) & PERMISSION_BITS[permission])
+
+
+# =============================================================================
+# Shared Process-wide Instance.
+# =============================================================================
+
+rbac_index = RbacIndex()
@@ -0,0 +1,176 @@
+import asyncio
+from collections.abc import Callable, Sequence
+from logging import getLogger
+from typing import cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.models import Permission, Role, RolePermission
+from app.core.config import get_settings
+from app.shared.enums.permission import PermissionEnum
+
+from .index import RbacIndex, rbac_index
+
+# =============================================================================
+# Rbac Index Constants
+# =============================================================================
+
+RBAC_VERSION_KEY = "rbac:version"
+
+# Failed refreshes are retried after the poll interval, doubled on each
+# further failure up to this many seconds.
+MAX_RETRY_DELAY = 60.0
+
+# =============================================================================
+# Creating Settings Instance.
+# =============================================================================
+
+settings = get_settings()
+
+# =============================================================================
+# Get Logger.
+# =============================================================================
+
+
+logger = getLogger(__name__)
+
+
+# =============================================================================
+# Rbac Index Loader Functions.
+# =============================================================================
+
+
+async def load_rbac_index(session: AsyncSession, index: RbacIndex = rbac_index) -> None:
+    rows = await session.exec(
+        select(col(Role.name), col(Permission.code))
+        .select_from(Role)
+        .outerjoin(RolePermission, col(RolePermission.role_id) == col(Role.id))
+        .outerjoin(Permission, col(Permission.id) == col(RolePermission.permission_id))
+    )
+
+    # Outer join: a role without permissions comes back with a NULL code.
+    pairs = cast(Sequence[tuple[str, PermissionEnum | None]], rows.all())
+
+    role_permissions: dict[str, set[PermissionEnum]] = {}
+    for role_name, code in pairs:
+        permissions = role_permissions.setdefault(role_name, set())
+        if code is not None:
+            permissions.add(code)
+
+    index.replace(role_permissions)
+
+
+async def bump_rbac_version(redis: Redis) -> None:
+    await redis.incr(RBAC_VERSION_KEY)
+
+
+# =============================================================================
+# Background Rbac Index Refresher.
+# =============================================================================
+
+
+class RbacIndexRefresher:
+    """
+    Keep `rbac_index` in sync with the `roles`/`role_permissions` tables.
+
+    Writers bump `RBAC_VERSION_KEY` after committing RBAC changes. Each
+    worker polls that counter every `poll_interval` seconds and reloads
+    the index only when it moved, or immediately after `mark_stale`.
+    A failed refresh is retried with exponential backoff, and forces a
+    reload once Redis and the database are back.
+    """
+
+    def __init__(self, *, poll_interval: float, index: RbacIndex = rbac_index) -> None:
+        self.poll_interval = poll_interval
+        self.index = index
+        self._seen_version: str | None = None
+        self._stale = asyncio.Event()
+        self._force = False
+        self._task: asyncio.Task[None] | None = None
+
+    def mark_stale(self) -> None:
+        self._stale.set()
+
+    async def start(
+        self, redis: Redis, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        if self._task is not None and not self._task.done():
+            return
+
+        try:
+            await self._refresh(redis, session_factory)
+        except (RedisError, SQLAlchemyError) as exc:
+            # Policies fall back to the principal's permission codes.
+            logger.warning("Rbac index initial load failed.", exc_info=exc)
+
+        self._task = asyncio.create_task(
+            self._run(redis, session_factory), name="rbac-index-refresher"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    async def _run(
+        self, redis: Redis, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        delay = self.poll_interval
+
+        while True:
+            try:
+                await asyncio.wait_for(self._stale.wait(), delay)
+            except TimeoutError:
+                pass
+
+            try:
+                await self._refresh(redis, session_factory)
+            except Exception as exc:
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                logger.warning(
+                    "Rbac index refresh failed, retrying in %.1fs.",
+                    delay,
+                    exc_info=exc,
+                )
+            else:
+                delay = self.poll_interval
+
+    async def _refresh(
+        self, redis: Redis, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        # Consume the stale mark before touching Redis, so a failure does
+        # not leave it set for `_run` to spin on; `_force` keeps it until
+        # a reload succeeds.
+        self._force = self._force or self._stale.is_set()
+        self._stale.clear()
+
+        version = await redis.get(RBAC_VERSION_KEY)
+        version = version.decode() if isinstance(version, bytes) else version
+
+        if self.index.is_loaded and not self._force and version == self._seen_version:
+            return
+
+        async with session_factory() as session:
+            await load_rbac_index(session, self.index)
+
+        self._seen_version = version
+        self._force = False
+        logger.debug("Rbac index reloaded (version %s).", version)
+
+
+# =============================================================================
+# Shared Process-wide Instance.
+# =============================================================================
+
+rbac_refresher = RbacIndexRefresher(poll_interval=settings.cache.RBAC_POLL_SECONDS)
@@ -0,0 +1,135 @@
+"""
+Encode/decode cost and payload size of the `RedisModelCache` codecs.
+
+Compares the previous format (`model_dump_json()` text read back through
+`decode_responses=True`, i.e. UTF-8 decode then `model_validate_json`)
+with the codecs in `app.adapters.redis.codecs`, for the two models the
+application caches: `UserRead` and `Principal`.
+
+Everything runs in-process on a sample instance, no Redis round-trip is
+included, so the numbers isolate serialization. `User` itself is a table
+model whose ORM state does not survive `model_construct`, which is why
+its read schema is measured instead.
+
+Usage:
+
+    uv run python -m benchmarks.cache_codecs --iterations 100000
+"""
+
+import argparse
+from collections.abc import Callable
+from time import perf_counter
+
+from pydantic import BaseModel
+from uuid6 import uuid7
+
+from app.adapters.redis.codecs import (
+    JSON_CODEC,
+    TRUSTED_CODEC,
+    CacheCodec,
+    MsgpackCodec,
+)
+from app.api.schemas.user import UserRead
+from app.shared.datetime.utc_now import get_utc_now
+from app.shared.enums.user import UserStatusEnum
+from app.shared.principal.schemas import Principal
+
+# =============================================================================
+# Legacy Text Codec.
+# =============================================================================
+
+
+class LegacyTextCodec:
+    """
+    What the cache did before codecs: JSON text, decoded by redis-py.
+    """
+
+    name = "text (before)"
+
+    def encode(self, instance: BaseModel) -> bytes:
+        return instance.model_dump_json().encode()
+
+    def decode[T: BaseModel](self, model: type[T], raw: bytes) -> T:
+        return model.model_validate_json(raw.decode())
+
+
+# =============================================================================
+# Sample Instances.
+# =============================================================================
+
+
+def sample_user() -> UserRead:
+    now = get_utc_now()
+    return UserRead(
+        id=uuid7(),
+        email="jane.doe@example.com",
+        status=UserStatusEnum.ACTIVE,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def sample_principal() -> Principal:
+    return Principal(
+        id=uuid7(),
+        status=UserStatusEnum.ACTIVE,
+        role_ids={uuid7(), uuid7()},
+        role_names={"user", "editor"},
+        permission_codes={f"resource_{i}:read" for i in range(20)},
+    )
+
+
+SAMPLES: dict[str, Callable[[], BaseModel]] = {
+    "UserRead": sample_user,
+    "Principal": sample_principal,
+}
+
+
+# =============================================================================
+# Runner.
+# =============================================================================
+
+
+CODECS: list[CacheCodec] = [
+    LegacyTextCodec(),
+    JSON_CODEC,
+    MsgpackCodec(),
+    TRUSTED_CODEC,
+]
+
+
+def time_per_call(func: Callable[[], object], iterations: int) -> float:
+    for _ in range(min(iterations, 1000)):
+        func()
+
+    started_at = perf_counter()
+    for _ in range(iterations):
+        func()
+    return (perf_counter() - started_at) / iterations * 1_000_000
+
+
+def main(iterations: int) -> None:
+    for name, factory in SAMPLES.items():
+        instance = factory()
+        model = type(instance)
+
+        print(name)
+        print(f"{'codec':<16}{'bytes':>8}{'encode us':>12}{'decode us':>12}")
+        for codec in CODECS:
+            raw = codec.encode(instance)
+            assert codec.decode(model, raw) == instance, codec.name
+
+            encode_us = time_per_call(lambda: codec.encode(instance), iterations)
+            decode_us = time_per_call(lambda: codec.decode(model, raw), iterations)
+            print(f"{codec.name:<16}{len(raw):>8}{encode_us:>12.2f}{decode_us:>12.2f}")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    main(args.iterations)
@@ -0,0 +1,185 @@
+"""
+Requests/sec of the HTTP middleware stack, before and after the switch
+from `CORSMiddleware` + slowapi's `SlowAPIMiddleware` to the pure ASGI
+`CORSRateLimitMiddleware`.
+
+Both stacks wrap the real API router and are driven in-process through
+httpx's ASGI transport, so the numbers isolate framework and middleware
+overhead. The routes exercised touch no database:
+
+* `GET /` redirect,
+* `GET /api/v1/users` without a token (401 from the auth dependency),
+* a CORS preflight for `POST /api/v1/auth/login`.
+
+Both rate limiters store their counters in the Redis from `.env`, with a
+limit high enough that nothing is throttled.
+
+Usage:
+
+    uv run python -m benchmarks.middleware --requests 5000 --concurrency 50
+
+Results with those arguments on Python 3.13 and a local Redis 6.2. This
+is the first of three runs; across all three the change ranged from +67%
+to +91% for `GET /`, +111% to +119% for the 401, and +36% to +137% for
+the preflight:
+
+    scenario                        before rps   after rps    change
+    GET /                                  696        1332     91.4%
+    GET /api/v1/users (401)                968        2047    111.4%
+    OPTIONS /api/v1/auth/login            2055        2790     35.8%
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from time import perf_counter
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import RedirectResponse
+from httpx import ASGITransport, AsyncClient
+from slowapi import Limiter
+from slowapi.middleware import SlowAPIMiddleware
+from slowapi.util import get_remote_address
+
+from app.adapters.rate_limit.limiter import rate_limiter
+from app.adapters.rate_limit.policy import parse_rate_limit
+from app.adapters.redis.client import close_redis
+from app.api.router import router
+from app.core.config import get_settings
+from app.core.middleware import CORSRateLimitMiddleware
+
+# =============================================================================
+# Benchmark Constants.
+# =============================================================================
+
+UNTHROTTLED = "1000000/minute"
+ORIGIN = "http://localhost:3000"
+
+settings = get_settings()
+
+
+# =============================================================================
+# App Builders.
+# =============================================================================
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get(path="/", include_in_schema=False)
+    def root(request: Request) -> RedirectResponse:  # pyright: ignore
+        return RedirectResponse(url="/docs", status_code=307)
+
+    app.include_router(router)
+    return app
+
+
+def build_legacy_app() -> FastAPI:
+    app = build_app()
+    app.state.limiter = Limiter(
+        key_func=get_remote_address,
+        storage_uri=settings.redis.url,
+        strategy="fixed-window",
+        default_limits=[UNTHROTTLED],
+        headers_enabled=True,
+    )
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[ORIGIN],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        allow_credentials=True,
+    )
+    app.add_middleware(SlowAPIMiddleware)
+    return app
+
+
+def build_asgi_app() -> FastAPI:
+    app = build_app()
+    app.add_middleware(
+        CORSRateLimitMiddleware,
+        allow_origins=[ORIGIN],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        allow_credentials=True,
+        expose_headers=settings.cors.EXPOSE_HEADERS,
+        max_age=600,
+        policy=parse_rate_limit(UNTHROTTLED),
+        limiter=rate_limiter,
+    )
+    return app
+
+
+# =============================================================================
+# Scenarios.
+# =============================================================================
+
+
+type Scenario = Callable[[AsyncClient], object]
+
+SCENARIOS: dict[str, Scenario] = {
+    "GET /": lambda client: client.get("/", headers={"Origin": ORIGIN}),
+    "GET /api/v1/users (401)": lambda client: client.get(
+        "/api/v1/users", headers={"Origin": ORIGIN}
+    ),
+    "OPTIONS /api/v1/auth/login": lambda client: client.options(
+        "/api/v1/auth/login",
+        headers={
+            "Origin": ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    ),
+}
+
+
+# =============================================================================
+# Runner.
+# =============================================================================
+
+
+async def run(app: FastAPI, scenario: Scenario, requests: int, workers: int) -> float:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(requests, 100)):
+            await scenario(client)  # type: ignore
+
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                await scenario(client)  # type: ignore
+
+        started_at = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return requests / (perf_counter() - started_at)
+
+
+async def main(requests: int, workers: int) -> None:
+    stacks = {"before": build_legacy_app(), "after": build_asgi_app()}
+
+    print(f"{'scenario':<30}{'before rps':>12}{'after rps':>12}{'change':>10}")
+    for name, scenario in SCENARIOS.items():
+        rps = {
+            stack: await run(app, scenario, requests, workers)
+            for stack, app in stacks.items()
+        }
+        change = (rps["after"] / rps["before"] - 1) * 100
+        print(f"{name:<30}{rps['before']:>12.0f}{rps['after']:>12.0f}{change:>9.1f}%")
+
+    await rate_limiter.stop()
+    await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
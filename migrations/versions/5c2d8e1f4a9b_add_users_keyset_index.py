@@ -0,0 +1,32 @@
+"""add users keyset index
+
+Revision ID: 5c2d8e1f4a9b
+Revises: efbbaa612776
+Create Date: 2026-10-18 10:12:31.204118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2d8e1f4a9b"
+down_revision: Union[str, Sequence[str], None] = "efbbaa612776"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_created_at_id",
+        "users",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_created_at_id", table_name="users")
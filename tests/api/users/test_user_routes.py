@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+from uuid6 import uuid7
+
+from app.adapters.db.models.user import User
+from app.main import app
+from app.shared.datetime.utc_now import get_utc_now
+from app.shared.dependencies.get_current_user import get_current_user
+from app.shared.enums.role import RoleEnum
+from app.shared.enums.user import UserStatusEnum
+from app.shared.principal.schemas import Principal
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+USERS_URL = "/api/v1/users"
+
+
+def as_superadmin() -> Principal:
+    return Principal(
+        id=uuid7(),
+        status=UserStatusEnum.ACTIVE,
+        role_ids=set(),
+        role_names={RoleEnum.SUPERADMIN.value},
+        permission_codes=set(),
+    )
+
+
+async def seed_users(session: AsyncSession, count: int) -> list[User]:
+    start = get_utc_now()
+    users = [
+        User(
+            email=f"user{i}@example.com",
+            password_hash="hashed",
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+# =============================================================================
+# LIST USERS TESTS
+# =============================================================================
+
+
+async def test_list_users_follows_the_next_cursor(
+    async_client: AsyncClient, async_session: AsyncSession
+) -> None:
+    app.dependency_overrides[get_current_user] = as_superadmin
+    users = await seed_users(async_session, 3)
+
+    first = await async_client.get(USERS_URL, params={"limit": 2})
+    cursor = first.headers["X-Next-Cursor"]
+    second = await async_client.get(USERS_URL, params={"limit": 2, "after": cursor})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert [user["id"] for user in first.json() + second.json()] == [
+        str(user.id) for user in users
+    ]
+    assert "X-Next-Cursor" not in second.headers
+
+
+async def test_list_users_rejects_a_bad_cursor(async_client: AsyncClient) -> None:
+    app.dependency_overrides[get_current_user] = as_superadmin
+
+    response = await async_client.get(USERS_URL, params={"after": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination cursor."}
@@ -2,12 +2,15 @@ from typing import Any, AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from fakeredis import FakeAsyncRedis
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.adapters.db.session import get_async_session
+from app.adapters.db.session import get_async_session, get_read_session
+from app.api.dependencies import get_event_bus
+from app.api.registry import build_command_bus, build_query_bus
 from app.main import app
 
 # =============================================================================
@@ -60,11 +63,18 @@ async def async_session(
 
 
 @pytest.fixture
-async def async_client(async_session: AsyncSession) -> AsyncGenerator[AsyncClient, Any]:
+async def async_client(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> AsyncGenerator[AsyncClient, Any]:
     async def get_async_test_session() -> AsyncGenerator[AsyncSession, Any]:
         yield async_session
 
     app.dependency_overrides[get_async_session] = get_async_test_session
+    app.dependency_overrides[get_read_session] = get_async_test_session
+
+    # Lifespan does not run under ASGITransport, so build the buses here.
+    app.state.command_bus = build_command_bus(fake_redis, get_event_bus())
+    app.state.query_bus = build_query_bus(fake_redis)
 
     transport = ASGITransport(app=app)
 
@@ -72,3 +82,17 @@ async def async_client(async_session: AsyncSession) -> AsyncGenerator[AsyncClien
         yield async_client
 
     app.dependency_overrides.clear()
+    del app.state.command_bus
+    del app.state.query_bus
+
+
+# =============================================================================
+# Fake Redis Fixture.
+# =============================================================================
+
+
+@pytest_asyncio.fixture(scope="function")
+async def fake_redis() -> AsyncGenerator[FakeAsyncRedis, None]:
+    redis = FakeAsyncRedis()
+    yield redis
+    await redis.aclose()
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+from typing import cast
+from uuid import UUID
+
+import pytest
+from msgpack import packb  # pyright: ignore[reportUnknownVariableType]
+from msgpack.ext import ExtType
+from pydantic import BaseModel, ValidationError
+from uuid6 import uuid7
+
+from app.adapters.redis.codecs import (
+    JSON_CODEC,
+    TRUSTED_CODEC,
+    CacheCodec,
+    MsgpackCodec,
+    schema_version,
+)
+from app.shared.enums.user import UserStatusEnum
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class Account(BaseModel):
+    id: UUID
+    status: UserStatusEnum
+    tags: set[str]
+    created_at: datetime
+
+
+class Renamed(BaseModel):
+    id: UUID
+    state: UserStatusEnum
+    tags: set[str]
+    created_at: datetime
+
+
+def sample() -> Account:
+    return Account(
+        id=uuid7(),
+        status=UserStatusEnum.ACTIVE,
+        tags={"a", "b"},
+        created_at=datetime(2026, 10, 18, 10, 12, 31, tzinfo=timezone.utc),
+    )
+
+
+CODECS = [JSON_CODEC, MsgpackCodec(), TRUSTED_CODEC]
+
+
+# =============================================================================
+# CACHE CODEC TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_codec_round_trips_the_instance(codec: CacheCodec) -> None:
+    instance = sample()
+
+    assert codec.decode(Account, codec.encode(instance)) == instance
+
+
+@pytest.mark.parametrize("codec", [JSON_CODEC, MsgpackCodec()], ids=["json", "msgpack"])
+def test_validating_codecs_reject_other_schemas(codec: CacheCodec) -> None:
+    with pytest.raises(ValidationError):
+        codec.decode(Renamed, codec.encode(sample()))
+
+
+def test_trusted_codec_restores_python_types() -> None:
+    decoded = TRUSTED_CODEC.decode(Account, TRUSTED_CODEC.encode(sample()))
+
+    assert decoded.status is UserStatusEnum.ACTIVE
+    assert isinstance(decoded.id, UUID)
+    assert isinstance(decoded.tags, set)
+    assert decoded.created_at.tzinfo is timezone.utc
+
+
+def test_trusted_codec_refuses_unknown_extension_types() -> None:
+    raw = cast(bytes, packb({"id": ExtType(99, b"os.system")}))
+
+    with pytest.raises(ValueError):
+        TRUSTED_CODEC.decode(Account, raw)
+
+
+def test_trusted_codec_refuses_to_encode_unknown_types() -> None:
+    class Holder(BaseModel):
+        value: object
+
+    with pytest.raises(TypeError):
+        TRUSTED_CODEC.encode(Holder(value=object()))
+
+
+def test_schema_version_tracks_fields_and_codec() -> None:
+    version = schema_version(Account, JSON_CODEC)
+
+    assert version == schema_version(Account, JSON_CODEC)
+    assert version != schema_version(Renamed, JSON_CODEC)
+    assert version != schema_version(Account, MsgpackCodec())
@@ -0,0 +1,193 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.adapters.redis import local_cache
+from app.adapters.redis.local_cache import (
+    INVALIDATE_ALL,
+    INVALIDATION_CHANNEL_PREFIX,
+    LocalCache,
+    LocalCacheInvalidator,
+)
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(local_cache, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def invalidator() -> LocalCacheInvalidator:
+    return LocalCacheInvalidator()
+
+
+@pytest.fixture
+async def listening(
+    invalidator: LocalCacheInvalidator, fake_redis: FakeAsyncRedis
+) -> AsyncGenerator[LocalCacheInvalidator, None]:
+    await invalidator.start(fake_redis)
+    await wait_until(lambda: invalidator.is_active)
+    yield invalidator
+    await invalidator.stop()
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was not met in time.")
+
+
+def filled(invalidator: LocalCacheInvalidator, namespace: str) -> LocalCache:
+    local = invalidator.cache(namespace, max_size=10, ttl=60.0)
+    for key in ("a", "b", "c"):
+        local.set(key, key.upper())
+    return local
+
+
+# =============================================================================
+# LOCAL CACHE TESTS
+# =============================================================================
+
+
+def test_least_recently_used_entry_is_evicted(clock: Clock) -> None:
+    local = LocalCache("items", max_size=2, ttl=60.0)
+    local.set("a", 1)
+    local.set("b", 2)
+    assert local.get("a") == 1
+
+    local.set("c", 3)
+
+    assert local.get("b") is None
+    assert local.get("a") == 1
+    assert local.get("c") == 3
+    assert local.stats().size == 2
+
+
+def test_overwrite_refreshes_recency(clock: Clock) -> None:
+    local = LocalCache("items", max_size=2, ttl=60.0)
+    local.set("a", 1)
+    local.set("b", 2)
+
+    local.set("a", 10)
+    local.set("c", 3)
+
+    assert local.get("a") == 10
+    assert local.get("b") is None
+
+
+def test_entries_expire_after_ttl(clock: Clock) -> None:
+    local = LocalCache("items", max_size=10, ttl=5.0)
+    local.set("a", 1)
+
+    clock.now += 4.9
+    assert local.get("a") == 1
+
+    clock.now += 0.1
+    assert local.get("a") is None
+    assert local.stats().size == 0
+
+
+def test_stats_count_hits_and_misses(clock: Clock) -> None:
+    local = LocalCache("items", max_size=10, ttl=60.0)
+    local.set("a", 1)
+
+    local.get("a")
+    local.get("a")
+    local.get("missing")
+
+    stats = local.stats()
+    assert (stats.hits, stats.misses, stats.max_size) == (2, 1, 10)
+
+
+# =============================================================================
+# LOCAL CACHE INVALIDATOR TESTS
+# =============================================================================
+
+
+def test_cache_is_shared_per_namespace(invalidator: LocalCacheInvalidator) -> None:
+    first = invalidator.cache("items", max_size=10, ttl=60.0)
+
+    assert invalidator.cache("items", max_size=1, ttl=1.0) is first
+    assert invalidator.cache("other", max_size=10, ttl=60.0) is not first
+
+
+@pytest.mark.parametrize("channel", ["items", b"items"])
+def test_message_drops_the_named_keys(
+    invalidator: LocalCacheInvalidator, channel: str | bytes
+) -> None:
+    local = filled(invalidator, "items")
+    prefix = INVALIDATION_CHANNEL_PREFIX
+    full = prefix + channel if isinstance(channel, str) else prefix.encode() + channel
+
+    invalidator._on_message(full, b'["a", "b"]')  # pyright: ignore[reportPrivateUsage]
+
+    assert local.get("a") is None
+    assert local.get("b") is None
+    assert local.get("c") == "C"
+
+
+def test_invalidate_all_message_clears_the_namespace(
+    invalidator: LocalCacheInvalidator,
+) -> None:
+    local = filled(invalidator, "items")
+    other = filled(invalidator, "other")
+
+    invalidator._on_message(  # pyright: ignore[reportPrivateUsage]
+        f"{INVALIDATION_CHANNEL_PREFIX}items", f'["{INVALIDATE_ALL}"]'
+    )
+
+    assert local.stats().size == 0
+    assert other.stats().size == 3
+
+
+def test_unreadable_message_clears_the_namespace(
+    invalidator: LocalCacheInvalidator,
+) -> None:
+    local = filled(invalidator, "items")
+
+    invalidator._on_message(  # pyright: ignore[reportPrivateUsage]
+        f"{INVALIDATION_CHANNEL_PREFIX}items", b"not json"
+    )
+
+    assert local.stats().size == 0
+
+
+async def test_published_invalidation_reaches_the_listener(
+    listening: LocalCacheInvalidator, fake_redis: FakeAsyncRedis
+) -> None:
+    local = filled(listening, "items")
+
+    # Another worker's invalidator publishes; this one only listens.
+    await LocalCacheInvalidator().publish(fake_redis, "items", ["a"])
+
+    await wait_until(lambda: local.get("a") is None)
+    assert local.get("b") == "B"
+
+
+async def test_stop_clears_every_local_cache(
+    listening: LocalCacheInvalidator,
+) -> None:
+    local = filled(listening, "items")
+
+    await listening.stop()
+
+    assert not listening.is_active
+    assert local.stats().size == 0
@@ -0,0 +1,148 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from pydantic import BaseModel
+
+from app.adapters.redis.cache import RedisModelCache
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def item(id: int) -> Item:
+    return Item(id=id, name=f"item-{id}")
+
+
+class BatchLoader:
+    """
+    Batch factory that records the identifiers it was asked for.
+    """
+
+    def __init__(self, *absent: int) -> None:
+        self.absent = set(absent)
+        self.calls: list[list[int]] = []
+
+    async def __call__(self, keys: list[int]) -> dict[int, Item]:
+        self.calls.append(keys)
+        return {key: item(key) for key in keys if key not in self.absent}
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+def items(fake_redis: FakeAsyncRedis) -> RedisModelCache[Item]:
+    return RedisModelCache(Item, fake_redis, namespace=f"items-{uuid4().hex}", ttl=60)
+
+
+@pytest.fixture
+def pipelines(monkeypatch: pytest.MonkeyPatch, fake_redis: FakeAsyncRedis) -> list[Any]:
+    """
+    Count the pipelines, i.e. the round-trips, the cache sends.
+    """
+    sent: list[Any] = []
+    pipeline = fake_redis.pipeline
+
+    def counting_pipeline(*args: Any, **kwargs: Any) -> Any:
+        pipe = pipeline(*args, **kwargs)
+        sent.append(pipe)
+        return pipe
+
+    monkeypatch.setattr(fake_redis, "pipeline", counting_pipeline)
+    return sent
+
+
+# =============================================================================
+# GET MANY / SET MANY TESTS
+# =============================================================================
+
+
+async def test_set_many_then_get_many_round_trips(
+    items: RedisModelCache[Item], fake_redis: FakeAsyncRedis
+) -> None:
+    await items.set_many({1: item(1), 2: item(2)})
+
+    assert await items.get_many([2, 1, 3]) == {2: item(2), 1: item(1)}
+    ttl = await fake_redis.ttl(items._key(1))  # pyright: ignore[reportPrivateUsage]
+    assert 0 < ttl <= 60
+
+
+async def test_get_many_is_one_round_trip(
+    items: RedisModelCache[Item], pipelines: list[Any]
+) -> None:
+    await items.set_many({key: item(key) for key in range(50)})
+    pipelines.clear()
+
+    found = await items.get_many(range(50))
+
+    assert len(found) == 50
+    assert len(pipelines) == 1
+
+
+async def test_get_many_skips_corrupted_entries(
+    items: RedisModelCache[Item], fake_redis: FakeAsyncRedis
+) -> None:
+    await items.set_many({1: item(1), 2: item(2)})
+    key = items._key(2)  # pyright: ignore[reportPrivateUsage]
+    await fake_redis.set(key, b"garbage")
+
+    assert await items.get_many([1, 2]) == {1: item(1)}
+
+
+async def test_empty_batches_touch_nothing(
+    items: RedisModelCache[Item], pipelines: list[Any]
+) -> None:
+    await items.set_many({})
+
+    assert await items.get_many([]) == {}
+    assert pipelines == []
+
+
+# =============================================================================
+# GET OR SET MANY TESTS
+# =============================================================================
+
+
+async def test_get_or_set_many_loads_only_missing_keys(
+    items: RedisModelCache[Item],
+) -> None:
+    await items.set_many({1: item(1), 3: item(3)})
+    load = BatchLoader()
+
+    found = await items.get_or_set_many([4, 3, 2, 1, 2], load)
+
+    assert list(found) == [4, 3, 2, 1]
+    assert found == {key: item(key) for key in (1, 2, 3, 4)}
+    assert load.calls == [[4, 2]]
+    assert await items.get_many([2, 4]) == {2: item(2), 4: item(4)}
+
+
+async def test_get_or_set_many_skips_factory_on_full_hit(
+    items: RedisModelCache[Item],
+) -> None:
+    load = BatchLoader()
+    await items.get_or_set_many([1, 2], load)
+
+    assert await items.get_or_set_many([1, 2], load) == {1: item(1), 2: item(2)}
+    assert load.calls == [[1, 2]]
+
+
+async def test_get_or_set_many_leaves_out_unknown_keys(
+    items: RedisModelCache[Item],
+) -> None:
+    load = BatchLoader(2)
+
+    assert await items.get_or_set_many([1, 2], load) == {1: item(1)}
+    assert await items.get_or_set_many([1, 2], load) == {1: item(1)}
+    # The absent key is not cached, so it is asked for again.
+    assert load.calls == [[1, 2], [2]]
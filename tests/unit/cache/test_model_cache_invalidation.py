@@ -0,0 +1,191 @@
+import asyncio
+from collections.abc import AsyncGenerator, Iterable
+from typing import cast
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from pydantic import BaseModel
+
+from app.adapters.redis import cache
+from app.adapters.redis.cache import RedisModelCache
+from app.adapters.redis.local_cache import local_cache_invalidator
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class Item(BaseModel):
+    id: int
+    groups: list[str]
+
+
+class ItemCache(RedisModelCache[Item]):
+    def tags_for(self, instance: Item) -> Iterable[str]:
+        return (f"group:{group}" for group in instance.groups)
+
+
+def item(id: int, *groups: str) -> Item:
+    return Item(id=id, groups=list(groups))
+
+
+@pytest.fixture
+def items(fake_redis: FakeAsyncRedis) -> ItemCache:
+    return ItemCache(Item, fake_redis, namespace=f"items-{uuid4().hex}")
+
+
+@pytest.fixture
+async def local_items(fake_redis: FakeAsyncRedis) -> AsyncGenerator[ItemCache, None]:
+    await local_cache_invalidator.start(fake_redis)
+    for _ in range(200):
+        if local_cache_invalidator.is_active:
+            break
+        await asyncio.sleep(0.01)
+
+    yield ItemCache(Item, fake_redis, namespace=f"items-{uuid4().hex}", local_ttl=60.0)
+    await local_cache_invalidator.stop()
+
+
+# =============================================================================
+# INVALIDATE TAG TESTS
+# =============================================================================
+
+
+async def test_invalidate_tag_drops_every_tagged_entry(items: ItemCache) -> None:
+    await items.set_many(
+        {1: item(1, "red"), 2: item(2, "red", "blue"), 3: item(3, "blue")}
+    )
+
+    await items.invalidate_tag("group:red")
+
+    assert await items.get_many([1, 2, 3]) == {3: item(3, "blue")}
+
+
+async def test_invalidate_tag_consumes_the_tag_set(
+    items: ItemCache, fake_redis: FakeAsyncRedis
+) -> None:
+    await items.set(1, item(1, "red"))
+    tag_key = items._tag_key("group:red")  # pyright: ignore[reportPrivateUsage]
+    assert await fake_redis.exists(tag_key)
+
+    await items.invalidate_tag("group:red")
+
+    assert not await fake_redis.exists(tag_key)
+
+
+async def test_invalidate_unknown_tag_is_a_no_op(items: ItemCache) -> None:
+    await items.set(1, item(1, "red"))
+
+    await items.invalidate_tag("group:green")
+
+    assert await items.get(1) == item(1, "red")
+
+
+async def test_invalidate_tag_reaches_the_local_cache(
+    local_items: ItemCache,
+) -> None:
+    await local_items.set_many({1: item(1, "red"), 2: item(2, "blue")})
+    assert local_items.local is not None
+    assert local_items.local.get("1") == item(1, "red")
+
+    await local_items.invalidate_tag("group:red")
+
+    assert local_items.local.get("1") is None
+    assert local_items.local.get("2") == item(2, "blue")
+
+
+async def test_invalidate_tag_consumes_large_sets_in_batches(
+    items: ItemCache, fake_redis: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cache, "TAG_BATCH_SIZE", 2)
+    await items.set_many({id: item(id, "red") for id in range(5)})
+    await items.set(9, item(9, "blue"))
+
+    await items.invalidate_tag("group:red")
+
+    assert await items.get_many(range(10)) == {9: item(9, "blue")}
+    tag_keys = cast(
+        list[bytes],
+        await fake_redis.keys(  # pyright: ignore[reportUnknownMemberType]
+            "cache:*:tag:*"
+        ),
+    )
+    blue = items._tag_key("group:blue")  # pyright: ignore[reportPrivateUsage]
+    assert tag_keys == [blue.encode()]
+
+
+async def test_tag_set_outlives_its_longest_lived_member(
+    items: ItemCache, fake_redis: FakeAsyncRedis
+) -> None:
+    short_lived = ItemCache(Item, fake_redis, namespace=items.namespace, ttl=10)
+    tag_key = items._tag_key("group:red")  # pyright: ignore[reportPrivateUsage]
+
+    await items.set(1, item(1, "red"))
+    await short_lived.set(2, item(2, "red"))
+
+    assert await fake_redis.ttl(tag_key) > 10
+
+
+# =============================================================================
+# INVALIDATE ALL TESTS
+# =============================================================================
+
+
+async def test_invalidate_all_turns_every_entry_into_a_miss(
+    items: ItemCache,
+) -> None:
+    await items.set_many({1: item(1, "red"), 2: item(2)})
+
+    await items.invalidate_all()
+
+    assert await items.get(1) is None
+    assert await items.get_many([1, 2]) == {}
+
+
+async def test_entries_written_after_invalidate_all_are_served(
+    items: ItemCache,
+) -> None:
+    await items.set(1, item(1, "red"))
+    await items.invalidate_all()
+
+    await items.set(1, item(1, "blue"))
+
+    assert await items.get(1) == item(1, "blue")
+
+
+async def test_values_loaded_before_invalidate_all_are_not_cached(
+    items: ItemCache,
+) -> None:
+    async def load(keys: list[int]) -> dict[int, Item]:
+        # The namespace is invalidated while the batch is being loaded.
+        await items.invalidate_all()
+        return {key: item(key, "stale") for key in keys}
+
+    loaded = await items.get_or_set_many([1, 2], load)
+
+    assert loaded == {1: item(1, "stale"), 2: item(2, "stale")}
+    assert await items.get_many([1, 2]) == {}
+
+
+async def test_value_filled_across_invalidate_all_is_not_cached(
+    items: ItemCache,
+) -> None:
+    async def load() -> Item:
+        await items.invalidate_all()
+        return item(1, "stale")
+
+    assert await items.get_or_set(1, load) == item(1, "stale")
+    assert await items.get(1) is None
+
+
+async def test_invalidate_all_clears_the_local_cache(
+    local_items: ItemCache,
+) -> None:
+    await local_items.set(1, item(1, "red"))
+    assert local_items.local is not None
+
+    await local_items.invalidate_all()
+
+    assert local_items.local.stats().size == 0
+    assert await local_items.get(1) is None
@@ -0,0 +1,209 @@
+import asyncio
+from time import monotonic
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from pydantic import BaseModel
+
+from app.adapters.redis import cache
+from app.adapters.redis.cache import RedisModelCache
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class CountingFactory:
+    """
+    Async factory that records its calls and can be held open by the test.
+    """
+
+    def __init__(self, name: str = "fresh") -> None:
+        self.name = name
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self) -> Item:
+        self.calls += 1
+        await self.gate.wait()
+        return Item(id=1, name=self.name)
+
+
+@pytest.fixture
+def items(fake_redis: FakeAsyncRedis) -> RedisModelCache[Item]:
+    # Fill state is process-wide per namespace, so keep tests apart.
+    return RedisModelCache(Item, fake_redis, namespace=f"items-{uuid4().hex}")
+
+
+def lock_key(items: RedisModelCache[Item]) -> str:
+    return f"lock:{items._key(1)}"  # pyright: ignore[reportPrivateUsage]
+
+
+def set_compute_time(
+    monkeypatch: pytest.MonkeyPatch, items: RedisModelCache[Item], seconds: float
+) -> None:
+    compute_time = cache._compute_time  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setitem(compute_time, items.namespace, seconds)
+
+
+# =============================================================================
+# GET OR SET COALESCING TESTS
+# =============================================================================
+
+
+async def test_concurrent_misses_call_the_factory_once(
+    items: RedisModelCache[Item],
+) -> None:
+    factory = CountingFactory()
+    factory.gate.clear()
+
+    callers = [asyncio.create_task(items.get_or_set(1, factory)) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    factory.gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert factory.calls == 1
+    assert all(result == Item(id=1, name="fresh") for result in results)
+    assert await items.get(1) == Item(id=1, name="fresh")
+
+
+async def test_hit_does_not_call_the_factory(items: RedisModelCache[Item]) -> None:
+    await items.set(1, Item(id=1, name="cached"))
+    factory = CountingFactory()
+
+    assert await items.get_or_set(1, factory) == Item(id=1, name="cached")
+    assert factory.calls == 0
+
+
+async def test_fill_lock_is_released(
+    items: RedisModelCache[Item], fake_redis: FakeAsyncRedis
+) -> None:
+    await items.get_or_set(1, CountingFactory())
+
+    assert not await fake_redis.exists(lock_key(items))
+
+
+async def test_factory_error_reaches_every_waiter_and_frees_the_key(
+    items: RedisModelCache[Item], fake_redis: FakeAsyncRedis
+) -> None:
+    gate = asyncio.Event()
+
+    async def failing() -> Item:
+        await gate.wait()
+        raise RuntimeError("database is down")
+
+    callers = [asyncio.create_task(items.get_or_set(1, failing)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    gate.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not await fake_redis.exists(lock_key(items))
+    assert await items.get_or_set(1, CountingFactory()) == Item(id=1, name="fresh")
+
+
+async def test_waits_for_the_value_of_another_process(
+    items: RedisModelCache[Item], fake_redis: FakeAsyncRedis
+) -> None:
+    # Another process holds the fill lock and caches the value shortly.
+    await fake_redis.set(lock_key(items), "other")
+    factory = CountingFactory()
+
+    async def other_process() -> None:
+        await asyncio.sleep(0.1)
+        await items.set(1, Item(id=1, name="other"))
+
+    result, _ = await asyncio.gather(items.get_or_set(1, factory), other_process())
+
+    assert result == Item(id=1, name="other")
+    assert factory.calls == 0
+
+
+async def test_waiter_takes_over_when_the_other_process_fails(
+    items: RedisModelCache[Item], fake_redis: FakeAsyncRedis
+) -> None:
+    # Another process holds the fill lock, then its factory raises and it
+    # releases the lock without caching anything.
+    await fake_redis.set(lock_key(items), "other")
+    factory = CountingFactory()
+
+    async def other_process() -> None:
+        await asyncio.sleep(0.1)
+        await fake_redis.delete(lock_key(items))
+
+    started = monotonic()
+    result, _ = await asyncio.gather(items.get_or_set(1, factory), other_process())
+
+    assert result == Item(id=1, name="fresh")
+    assert factory.calls == 1
+    assert monotonic() - started < cache.FILL_WAIT_SECONDS / 2
+    assert await items.get(1) == Item(id=1, name="fresh")
+    assert not await fake_redis.exists(lock_key(items))
+
+
+# =============================================================================
+# XFETCH EARLY REFRESH TESTS
+# =============================================================================
+
+
+def test_no_early_refresh_before_a_compute_time_is_known(
+    items: RedisModelCache[Item],
+) -> None:
+    assert not items._should_refresh_early(1)  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.parametrize(
+    ("pttl", "refresh"),
+    [(500, True), (690, True), (700, False), (60_000, False), (0, False)],
+)
+def test_early_refresh_depends_on_ttl_left_and_compute_time(
+    items: RedisModelCache[Item],
+    monkeypatch: pytest.MonkeyPatch,
+    pttl: int,
+    refresh: bool,
+) -> None:
+    # With random() = 0.5 and a 1 s fill the threshold is ln(2) s ~ 693 ms.
+    set_compute_time(monkeypatch, items, 1.0)
+    monkeypatch.setattr(cache, "random", lambda: 0.5)
+
+    should_refresh = items._should_refresh_early  # pyright: ignore[reportPrivateUsage]
+    assert should_refresh(pttl) is refresh
+
+
+async def test_hit_near_expiry_is_refreshed_early(
+    items: RedisModelCache[Item], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await items.set(1, Item(id=1, name="stale"))
+    # A fill cost of an hour makes every remaining TTL "near expiry".
+    set_compute_time(monkeypatch, items, 3600.0)
+    monkeypatch.setattr(cache, "random", lambda: 0.5)
+    factory = CountingFactory()
+
+    assert await items.get_or_set(1, factory) == Item(id=1, name="fresh")
+    assert factory.calls == 1
+
+
+async def test_concurrent_early_refresh_serves_the_stale_value(
+    items: RedisModelCache[Item], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await items.set(1, Item(id=1, name="stale"))
+    set_compute_time(monkeypatch, items, 3600.0)
+    monkeypatch.setattr(cache, "random", lambda: 0.5)
+    factory = CountingFactory()
+    factory.gate.clear()
+
+    refresh = asyncio.create_task(items.get_or_set(1, factory))
+    await asyncio.sleep(0.01)
+    served = await items.get_or_set(1, factory)
+    factory.gate.set()
+
+    assert served == Item(id=1, name="stale")
+    assert await refresh == Item(id=1, name="fresh")
+    assert factory.calls == 1
@@ -0,0 +1,148 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient, Response
+
+from app.adapters.rate_limit.gcra import RedisRateLimiter
+from app.adapters.rate_limit.policy import parse_rate_limit
+from app.adapters.rate_limit.tiered import TieredRateLimiter
+from app.core.middleware import RATE_LIMIT_KEY_PREFIX, CORSRateLimitMiddleware
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+ORIGIN = "http://localhost:3000"
+TWO_PER_MINUTE = parse_rate_limit("2/minute")
+
+
+@pytest.fixture
+def backend(fake_redis: FakeAsyncRedis) -> RedisRateLimiter:
+    return RedisRateLimiter(fake_redis)
+
+
+@pytest.fixture
+def calls() -> list[str]:
+    return []
+
+
+@pytest.fixture
+async def client(
+    backend: RedisRateLimiter, calls: list[str]
+) -> AsyncGenerator[AsyncClient, None]:
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login() -> dict[str, str]:  # pyright: ignore[reportUnusedFunction]
+        calls.append("login")
+        return {"status": "ok"}
+
+    app.add_middleware(
+        CORSRateLimitMiddleware,
+        allow_origins=[ORIGIN],
+        allow_methods=["GET", "POST"],
+        allow_headers=["authorization"],
+        allow_credentials=True,
+        expose_headers=["X-Next-Cursor"],
+        max_age=600,
+        policy=TWO_PER_MINUTE,
+        limiter=TieredRateLimiter(
+            backend, local_share=0.0, sync_interval=60.0, max_keys=100
+        ),
+    )
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def preflight(
+    client: AsyncClient, origin: str = ORIGIN, method: str = "POST"
+) -> Response:
+    return await client.options(
+        "/login",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": method,
+            "Access-Control-Request-Headers": "content-type, authorization",
+        },
+    )
+
+
+# =============================================================================
+# CORS PREFLIGHT TESTS
+# =============================================================================
+
+
+async def test_preflight_is_answered_without_reaching_the_app(
+    client: AsyncClient, backend: RedisRateLimiter, calls: list[str]
+) -> None:
+    for _ in range(3):
+        response = await preflight(client)
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["access-control-allow-methods"] == "GET, POST"
+        assert response.headers["access-control-max-age"] == "600"
+
+    assert calls == []
+    peek = await backend.peek(TWO_PER_MINUTE, f"{RATE_LIMIT_KEY_PREFIX}:127.0.0.1")
+    assert peek.remaining == TWO_PER_MINUTE.limit
+
+
+@pytest.mark.parametrize(
+    ("origin", "method"),
+    [("http://evil.test", "POST"), (ORIGIN, "DELETE")],
+)
+async def test_disallowed_preflight_is_rejected(
+    client: AsyncClient, origin: str, method: str
+) -> None:
+    response = await preflight(client, origin, method)
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+
+# =============================================================================
+# CORS RATE LIMIT TESTS
+# =============================================================================
+
+
+async def test_allowed_request_carries_cors_and_rate_limit_headers(
+    client: AsyncClient, calls: list[str]
+) -> None:
+    response = await client.post("/login", headers={"Origin": ORIGIN})
+
+    assert response.status_code == 200
+    assert calls == ["login"]
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-expose-headers"] == "X-Next-Cursor"
+    assert response.headers["x-ratelimit-limit"] == "2"
+    assert response.headers["x-ratelimit-remaining"] == "1"
+
+
+async def test_rate_limited_request_is_rejected_with_cors_headers(
+    client: AsyncClient, calls: list[str]
+) -> None:
+    for _ in range(2):
+        await client.post("/login", headers={"Origin": ORIGIN})
+
+    response = await client.post("/login", headers={"Origin": ORIGIN})
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Rate limit exceeded"}
+    assert calls == ["login", "login"]
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["x-ratelimit-remaining"] == "0"
+    assert int(response.headers["retry-after"]) == 30
+
+
+async def test_other_origins_get_no_cors_headers(client: AsyncClient) -> None:
+    response = await client.post("/login", headers={"Origin": "http://evil.test"})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
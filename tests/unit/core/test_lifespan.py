@@ -0,0 +1,62 @@
+from collections.abc import Callable
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.security.providers import get_async_hasher
+from app.core import lifespan as lifespan_module
+from app.core.lifespan import lifespan
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+class StubEngine:
+    async def dispose(self) -> None:
+        pass
+
+
+async def noop() -> None:
+    pass
+
+
+@pytest.fixture
+def isolated_lifespan(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_redis: FakeAsyncRedis,
+    async_engine: AsyncEngine,
+) -> Callable[[], FastAPI]:
+    # Keep the real startup order, but against fakeredis and the test DB.
+    monkeypatch.setattr(lifespan_module, "async_redis", fake_redis)
+    monkeypatch.setattr(lifespan_module, "check_redis", noop)
+    monkeypatch.setattr(lifespan_module, "close_redis", noop)
+    monkeypatch.setattr(lifespan_module, "init_async_db", noop)
+    monkeypatch.setattr(lifespan_module, "async_engine", StubEngine())
+    monkeypatch.setattr(
+        lifespan_module,
+        "AsyncSessionLocal",
+        async_sessionmaker(bind=async_engine, class_=AsyncSession),
+    )
+    return FastAPI
+
+
+# =============================================================================
+# LIFESPAN TESTS
+# =============================================================================
+
+
+async def test_hasher_is_usable_across_consecutive_lifespans(
+    isolated_lifespan: Callable[[], FastAPI],
+) -> None:
+    app = isolated_lifespan()
+
+    for _ in range(2):
+        async with lifespan(app):
+            hasher = get_async_hasher()
+            assert await hasher.verify("secret", await hasher.hash("secret"))
+
+        assert get_async_hasher() is not hasher
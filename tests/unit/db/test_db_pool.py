@@ -0,0 +1,150 @@
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from app.adapters.db.pool import (
+    InstrumentedAsyncPool,
+    WaitHistogram,
+    install_idle_pre_ping,
+)
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+async def single_connection_engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=InstrumentedAsyncPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def sync_engine() -> Generator[Engine, None, None]:
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+    yield engine
+    engine.dispose()
+
+
+def count_pings(monkeypatch: pytest.MonkeyPatch, engine: Engine) -> list[Any]:
+    pinged: list[Any] = []
+    monkeypatch.setattr(engine.dialect, "do_ping", pinged.append)
+    return pinged
+
+
+# =============================================================================
+# WAIT HISTOGRAM TESTS
+# =============================================================================
+
+
+def test_histogram_buckets_waits_by_upper_bound() -> None:
+    histogram = WaitHistogram()
+
+    for elapsed in (0.0005, 0.02, 10.0):
+        histogram.observe(elapsed)
+
+    counts, avg_wait_ms, max_wait_ms = histogram.snapshot()
+    assert {label: count for label, count in counts.items() if count} == {
+        "le_1ms": 1,
+        "le_25ms": 1,
+        "le_inf": 1,
+    }
+    assert histogram.count == 3
+    assert max_wait_ms == 10_000
+    assert 3340 < avg_wait_ms < 3341
+
+
+# =============================================================================
+# INSTRUMENTED POOL TESTS
+# =============================================================================
+
+
+async def test_pool_stats_count_checkouts_and_timeouts(
+    single_connection_engine: AsyncEngine,
+) -> None:
+    pool = single_connection_engine.pool
+    assert isinstance(pool, InstrumentedAsyncPool)
+
+    async with single_connection_engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            async with single_connection_engine.connect():
+                pass
+
+        stats = pool.stats()
+
+    assert (stats.size, stats.max_overflow) == (1, 0)
+    assert (stats.checked_out, stats.overflow) == (1, 0)
+    assert (stats.checkouts, stats.timeouts) == (2, 1)
+
+
+async def test_pool_stats_survive_dispose(
+    single_connection_engine: AsyncEngine,
+) -> None:
+    async with single_connection_engine.connect():
+        pass
+
+    await single_connection_engine.dispose()
+
+    pool = single_connection_engine.pool
+    assert isinstance(pool, InstrumentedAsyncPool)
+    assert pool.stats().checkouts == 1
+
+
+# =============================================================================
+# IDLE PRE-PING TESTS
+# =============================================================================
+
+
+def test_recently_used_connections_are_not_pinged(
+    monkeypatch: pytest.MonkeyPatch, sync_engine: Engine
+) -> None:
+    install_idle_pre_ping(sync_engine, idle_seconds=60.0)
+    pinged = count_pings(monkeypatch, sync_engine)
+
+    for _ in range(3):
+        with sync_engine.connect():
+            pass
+
+    assert pinged == []
+
+
+def test_idle_connections_are_pinged_on_checkout(
+    monkeypatch: pytest.MonkeyPatch, sync_engine: Engine
+) -> None:
+    install_idle_pre_ping(sync_engine, idle_seconds=0.0)
+    pinged = count_pings(monkeypatch, sync_engine)
+
+    for _ in range(3):
+        with sync_engine.connect():
+            pass
+
+    # The first checkout opens a new connection, there is nothing to ping.
+    assert len(pinged) == 2
+
+
+def test_connection_failing_its_ping_is_replaced(
+    monkeypatch: pytest.MonkeyPatch, sync_engine: Engine
+) -> None:
+    install_idle_pre_ping(sync_engine, idle_seconds=0.0)
+    with sync_engine.connect() as connection:
+        stale = connection.connection.dbapi_connection
+
+    def failing_ping(dbapi_connection: Any) -> None:
+        raise OSError("server closed the connection")
+
+    monkeypatch.setattr(sync_engine.dialect, "do_ping", failing_ping)
+
+    with sync_engine.connect() as connection:
+        assert connection.connection.dbapi_connection is not stale
@@ -0,0 +1,176 @@
+import smtplib
+from email.message import Message
+from typing import Any
+
+import pytest
+
+from app.adapters.email import smtp_pool
+from app.adapters.email.renderer import BaseRenderer
+from app.adapters.email.smtp_pool import SmtpConnectionPool
+from app.adapters.email.types import EmailMessageDict
+from app.adapters.messaging.tasks import email_tasks
+from app.adapters.messaging.tasks.email_tasks import send_email_batch_task
+
+# =============================================================================
+# Stub Smtp Server And Renderer.
+# =============================================================================
+
+
+class StubSmtp:
+    """
+    Stands in for `smtplib.SMTP`, delivering to `outbox` unless told to fail.
+    """
+
+    opened: list["StubSmtp"] = []
+    # Recipients refused with an error, or whose connection drops right
+    # after the message was delivered.
+    refuse: dict[str, Exception] = {}
+    drop_after_delivery: set[str] = set()
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.delivered: list[str] = []
+        StubSmtp.opened.append(self)
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, username: str, password: str) -> None:
+        pass
+
+    def send_message(self, message: Message) -> None:
+        to = str(message["To"])
+        if to in StubSmtp.refuse:
+            raise StubSmtp.refuse[to]
+
+        self.delivered.append(to)
+        if to in StubSmtp.drop_after_delivery:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    def rset(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class StubRenderer(BaseRenderer):
+    def __init__(self) -> None:
+        pass
+
+    def render(self, template: str, context: dict[str, str]) -> str:
+        return "<p>Hello.</p>"
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+def retries(monkeypatch: pytest.MonkeyPatch) -> list[list[EmailMessageDict]]:
+    calls: list[list[EmailMessageDict]] = []
+
+    def retry(args: tuple[list[EmailMessageDict]], **_: Any) -> None:
+        calls.append(args[0])
+
+    monkeypatch.setattr(StubSmtp, "opened", [])
+    monkeypatch.setattr(StubSmtp, "refuse", {})
+    monkeypatch.setattr(StubSmtp, "drop_after_delivery", set[str]())
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", StubSmtp)
+    monkeypatch.setattr(email_tasks, "get_renderer", StubRenderer)
+    monkeypatch.setattr(email_tasks, "smtp_pool", build_pool(max_messages=2))
+    monkeypatch.setattr(send_email_batch_task, "retry", retry)
+    return calls
+
+
+def build_pool(*, max_messages: int) -> SmtpConnectionPool:
+    return SmtpConnectionPool(
+        size=1,
+        host="smtp.test",
+        port=587,
+        username=None,
+        password=None,
+        use_tls=False,
+        use_ssl=False,
+        timeout=1.0,
+        max_idle=60.0,
+        max_messages=max_messages,
+    )
+
+
+def email(to: str) -> EmailMessageDict:
+    return {
+        "subject": "Subject.",
+        "to": to,
+        "content": {"html_template": "welcome.html"},
+        "context": {},
+    }
+
+
+def delivered() -> list[str]:
+    return [to for server in StubSmtp.opened for to in server.delivered]
+
+
+# =============================================================================
+# EMAIL BATCH TASK TESTS
+# =============================================================================
+
+
+def test_batch_rotates_connections_at_max_messages(
+    retries: list[list[EmailMessageDict]],
+) -> None:
+    recipients = [f"user{i}@example.com" for i in range(5)]
+
+    report = send_email_batch_task.run([email(to) for to in recipients])
+
+    assert report["sent"] == recipients
+    assert [len(server.delivered) for server in StubSmtp.opened] == [2, 2, 1]
+    assert retries == []
+
+
+def test_batch_retries_only_transient_refusals(
+    retries: list[list[EmailMessageDict]],
+) -> None:
+    StubSmtp.refuse = {
+        "busy@example.com": smtplib.SMTPDataError(451, b"Try again later"),
+        "gone@example.com": smtplib.SMTPDataError(550, b"No such user"),
+    }
+    recipients = ["a@example.com", "busy@example.com", "gone@example.com"]
+
+    report = send_email_batch_task.run([email(to) for to in recipients])
+
+    assert report["sent"] == ["a@example.com"]
+    assert list(report["failed"]) == ["gone@example.com"]
+    assert [[msg["to"] for msg in args] for args in retries] == [["busy@example.com"]]
+
+
+def test_batch_does_not_resend_a_message_lost_during_its_send(
+    retries: list[list[EmailMessageDict]],
+) -> None:
+    StubSmtp.drop_after_delivery = {"b@example.com"}
+    recipients = ["a@example.com", "b@example.com", "c@example.com"]
+
+    report = send_email_batch_task.run([email(to) for to in recipients])
+
+    assert delivered() == ["a@example.com", "b@example.com"]
+    assert report["failed"]["b@example.com"].startswith("delivery unknown")
+    assert [[msg["to"] for msg in args] for args in retries] == [["c@example.com"]]
+
+
+def test_batch_retries_everything_when_no_connection_can_be_opened(
+    monkeypatch: pytest.MonkeyPatch, retries: list[list[EmailMessageDict]]
+) -> None:
+    def refuse_connection(*_: Any, **__: Any) -> StubSmtp:
+        raise ConnectionRefusedError("Connection refused")
+
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", refuse_connection)
+    recipients = ["a@example.com", "b@example.com"]
+
+    report = send_email_batch_task.run([email(to) for to in recipients])
+
+    assert report["sent"] == []
+    assert report["failed"] == {}
+    assert [[msg["to"] for msg in args] for args in retries] == [recipients]
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache
+
+from app.adapters.email.renderer import (
+    BASE_LAYOUT,
+    BASE_STYLES_INCLUDE,
+    TEMPLATES_DIR,
+    InlinedLayoutLoader,
+    JinjaRenderer,
+    build_environment,
+    inline_layout_css,
+)
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class CountingLoader(InlinedLayoutLoader):
+    """
+    `InlinedLayoutLoader` that records every template source it reads.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(TEMPLATES_DIR)
+        self.loaded: list[str] = []
+
+    def get_source(self, environment: Environment, template: str):
+        self.loaded.append(template)
+        return super().get_source(environment, template)
+
+
+# =============================================================================
+# LAYOUT LOADER TESTS
+# =============================================================================
+
+
+def test_layout_is_served_with_inlined_css():
+    env = build_environment()
+
+    source, _, _ = InlinedLayoutLoader(TEMPLATES_DIR).get_source(env, BASE_LAYOUT)
+
+    assert BASE_STYLES_INCLUDE not in source
+    assert 'style="' in source
+    # Jinja tags are plain text to premailer and come out untouched.
+    assert "{% block body %}" in source
+
+
+def test_layout_css_is_inlined_once_per_source():
+    inline_layout_css.cache_clear()
+    env = build_environment()
+    loader = InlinedLayoutLoader(TEMPLATES_DIR)
+
+    first, _, _ = loader.get_source(env, BASE_LAYOUT)
+    second, _, _ = loader.get_source(env, BASE_LAYOUT)
+
+    assert first is second
+    assert inline_layout_css.cache_info().misses == 1
+
+
+# =============================================================================
+# RENDERER TESTS
+# =============================================================================
+
+
+def test_render_extends_inlined_layout():
+    renderer = JinjaRenderer()
+
+    html = renderer.render("welcome.html", {"subject": "Hi", "name": "Ada"})
+
+    assert "Welcome, Ada!" in html
+    assert BASE_STYLES_INCLUDE not in html
+    assert 'style="' in html
+
+
+def test_render_escapes_context():
+    renderer = JinjaRenderer()
+
+    html = renderer.render("welcome.html", {"subject": "Hi", "name": "<script>"})
+
+    assert "&lt;script&gt;" in html
+    assert "<script>" not in html
+
+
+def test_templates_are_compiled_once():
+    loader = CountingLoader()
+    renderer = JinjaRenderer(build_environment(loader))
+
+    renderer.render("verify_email.html", {"subject": "Hi", "otp": "123456"})
+    renderer.render("verify_email.html", {"subject": "Hi", "otp": "654321"})
+
+    assert loader.loaded.count("verify_email.html") == 1
+    assert loader.loaded.count(BASE_LAYOUT) == 1
+
+
+def test_preload_compiles_every_html_template():
+    loader = CountingLoader()
+    renderer = JinjaRenderer(build_environment(loader))
+
+    renderer.preload()
+    loaded = list(loader.loaded)
+    renderer.render("welcome.html", {"subject": "Hi", "name": "Ada"})
+
+    assert {"base.html", "welcome.html", "verify_email.html"} <= set(loaded)
+    assert not any(name.endswith(".css") for name in loaded)
+    # Rendering after the preload reads no template from disk again.
+    assert loader.loaded == loaded
+
+
+def test_bytecode_cache_is_written(tmp_path: Path):
+    env = build_environment(CountingLoader())
+    env.bytecode_cache = FileSystemBytecodeCache(str(tmp_path))
+
+    JinjaRenderer(env).render("welcome.html", {"subject": "Hi", "name": "Ada"})
+
+    assert any(tmp_path.iterdir())
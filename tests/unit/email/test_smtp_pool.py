@@ -0,0 +1,194 @@
+import smtplib
+
+import pytest
+
+from app.adapters.email import smtp_pool
+from app.adapters.email.smtp_pool import SmtpConnectionPool
+
+# =============================================================================
+# Stub Smtp Server.
+# =============================================================================
+
+
+class StubSmtp:
+    """
+    Stands in for `smtplib.SMTP` and records what the pool does with it.
+    """
+
+    opened: list["StubSmtp"] = []
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.host = host
+        self.port = port
+        self.alive = True
+        self.logins = 0
+        self.resets = 0
+        self.noops = 0
+        self.closed = False
+        StubSmtp.opened.append(self)
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, username: str, password: str) -> None:
+        self.logins += 1
+
+    def noop(self) -> tuple[int, bytes]:
+        self.noops += 1
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return 250, b"OK"
+
+    def rset(self) -> None:
+        self.resets += 1
+
+    def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def stub_smtp(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(StubSmtp, "opened", [])
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", StubSmtp)
+
+
+def build_pool(
+    *, max_idle: float = 60.0, max_messages: int = 100
+) -> SmtpConnectionPool:
+    return SmtpConnectionPool(
+        size=2,
+        host="smtp.test",
+        port=587,
+        username="user",
+        password="secret",
+        use_tls=True,
+        use_ssl=False,
+        timeout=1.0,
+        max_idle=max_idle,
+        max_messages=max_messages,
+    )
+
+
+# =============================================================================
+# SMTP POOL REUSE TESTS
+# =============================================================================
+
+
+def test_connection_is_reused_across_borrows() -> None:
+    pool = build_pool()
+
+    for _ in range(3):
+        with pool.connection() as conn:
+            conn.sent += 1
+
+    assert len(StubSmtp.opened) == 1
+    assert StubSmtp.opened[0].logins == 1
+
+
+def test_concurrent_borrows_open_separate_connections() -> None:
+    pool = build_pool()
+
+    with pool.connection() as first, pool.connection() as second:
+        assert first.server is not second.server
+
+    assert len(StubSmtp.opened) == 2
+
+
+def test_connection_is_retired_after_max_messages() -> None:
+    pool = build_pool(max_messages=2)
+
+    for _ in range(3):
+        with pool.connection() as conn:
+            conn.sent += 1
+            conn.sent += 1
+
+    assert len(StubSmtp.opened) == 3
+    assert all(server.closed for server in StubSmtp.opened)
+
+
+# =============================================================================
+# SMTP POOL HEALTH CHECK TESTS
+# =============================================================================
+
+
+def test_recently_used_connection_skips_the_noop() -> None:
+    pool = build_pool(max_idle=60.0)
+
+    for _ in range(2):
+        with pool.connection():
+            pass
+
+    assert StubSmtp.opened[0].noops == 0
+
+
+def test_idle_connection_is_checked_with_noop() -> None:
+    pool = build_pool(max_idle=0.0)
+
+    for _ in range(2):
+        with pool.connection():
+            pass
+
+    assert len(StubSmtp.opened) == 1
+    assert StubSmtp.opened[0].noops == 1
+
+
+def test_dead_idle_connection_is_replaced() -> None:
+    pool = build_pool(max_idle=0.0)
+    with pool.connection():
+        pass
+    StubSmtp.opened[0].alive = False
+
+    with pool.connection() as conn:
+        assert conn.server is StubSmtp.opened[1]
+
+    assert StubSmtp.opened[0].closed
+
+
+# =============================================================================
+# SMTP POOL ERROR TESTS
+# =============================================================================
+
+
+def test_broken_connection_is_discarded() -> None:
+    pool = build_pool()
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        with pool.connection():
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    with pool.connection() as conn:
+        assert conn.server is StubSmtp.opened[1]
+
+    assert StubSmtp.opened[0].closed
+
+
+def test_refused_message_resets_and_keeps_the_connection() -> None:
+    pool = build_pool()
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        with pool.connection():
+            raise smtplib.SMTPRecipientsRefused({})
+
+    with pool.connection() as conn:
+        assert conn.server is StubSmtp.opened[0]
+
+    assert StubSmtp.opened[0].resets == 1
+    assert not StubSmtp.opened[0].closed
+
+
+def test_close_discards_idle_connections() -> None:
+    pool = build_pool()
+    with pool.connection():
+        pass
+
+    pool.close()
+
+    assert StubSmtp.opened[0].closed
@@ -0,0 +1,111 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from time import time
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.adapters.jwt.blacklist import JwtBlacklist
+from app.adapters.jwt.revocation import BLACKLIST_PREFIX, RevocationSnapshot
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+async def fresh_snapshot(
+    fake_redis: FakeAsyncRedis,
+) -> AsyncGenerator[RevocationSnapshot, None]:
+    snapshot = RevocationSnapshot(max_staleness=5.0, resync_interval=300.0)
+    await snapshot.start(fake_redis)
+
+    for _ in range(200):
+        if snapshot.is_fresh:
+            break
+        await asyncio.sleep(0.01)
+
+    assert snapshot.is_fresh
+    yield snapshot
+    await snapshot.stop()
+
+
+def expires_in(seconds: int) -> int:
+    return int(time()) + seconds
+
+
+# =============================================================================
+# JWT BLACKLIST TESTS
+# =============================================================================
+
+
+async def test_revoke_writes_the_key_with_its_ttl(fake_redis: FakeAsyncRedis) -> None:
+    blacklist = JwtBlacklist(fake_redis, snapshot=None)
+
+    await blacklist.revoke("jti", expires_in(60))
+
+    assert 0 < await fake_redis.ttl(f"{BLACKLIST_PREFIX}jti") <= 60
+    assert await blacklist.is_revoked("jti")
+
+
+async def test_revoke_ignores_already_expired_tokens(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    blacklist = JwtBlacklist(fake_redis, snapshot=None)
+
+    await blacklist.revoke("jti", expires_in(-60))
+
+    assert not await fake_redis.exists(f"{BLACKLIST_PREFIX}jti")
+    assert not await blacklist.is_revoked("jti")
+
+
+async def test_revoke_updates_the_local_snapshot(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    snapshot = RevocationSnapshot(max_staleness=5.0, resync_interval=300.0)
+    blacklist = JwtBlacklist(fake_redis, snapshot=snapshot)
+
+    await blacklist.revoke("jti", expires_in(60))
+
+    assert "jti" in snapshot
+
+
+async def test_is_revoked_without_snapshot_reads_redis(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    await fake_redis.set(f"{BLACKLIST_PREFIX}jti", "1", ex=60)
+    blacklist = JwtBlacklist(fake_redis, snapshot=None)
+
+    assert await blacklist.is_revoked("jti")
+    assert not await blacklist.is_revoked("other")
+
+
+async def test_is_revoked_falls_back_to_redis_when_snapshot_is_stale(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    stale = RevocationSnapshot(max_staleness=5.0, resync_interval=300.0)
+    await fake_redis.set(f"{BLACKLIST_PREFIX}jti", "1", ex=60)
+
+    assert not stale.is_fresh
+    assert await JwtBlacklist(fake_redis, snapshot=stale).is_revoked("jti")
+
+
+async def test_fresh_snapshot_is_authoritative_for_misses(
+    fake_redis: FakeAsyncRedis, fresh_snapshot: RevocationSnapshot
+) -> None:
+    # Written behind the snapshot's back: a fresh snapshot skips Redis.
+    await fake_redis.set(f"{BLACKLIST_PREFIX}unseen", "1", ex=60)
+
+    assert not await JwtBlacklist(fake_redis, fresh_snapshot).is_revoked("unseen")
+
+
+async def test_fresh_snapshot_hits_are_confirmed_in_redis(
+    fake_redis: FakeAsyncRedis, fresh_snapshot: RevocationSnapshot
+) -> None:
+    blacklist = JwtBlacklist(fake_redis, fresh_snapshot)
+    await blacklist.revoke("jti", expires_in(60))
+
+    assert await blacklist.is_revoked("jti")
+
+    await fake_redis.delete(f"{BLACKLIST_PREFIX}jti")
+    assert not await blacklist.is_revoked("jti")
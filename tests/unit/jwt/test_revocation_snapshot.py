@@ -0,0 +1,178 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from time import time
+from typing import Any
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.asyncio.client import PubSub
+
+from app.adapters.jwt.blacklist import JwtBlacklist
+from app.adapters.jwt.revocation import (
+    BLACKLIST_PREFIX,
+    REVOCATION_CHANNEL,
+    RevocationSnapshot,
+)
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+async def snapshot() -> AsyncGenerator[RevocationSnapshot, None]:
+    snapshot = RevocationSnapshot(max_staleness=5.0, resync_interval=300.0)
+    yield snapshot
+    await snapshot.stop()
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was not met in time.")
+
+
+# =============================================================================
+# REVOCATION SNAPSHOT FRESHNESS TESTS
+# =============================================================================
+
+
+async def test_snapshot_is_not_fresh_before_start(
+    snapshot: RevocationSnapshot,
+) -> None:
+    assert not snapshot.is_fresh
+
+
+async def test_snapshot_is_fresh_while_listening(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await snapshot.start(fake_redis)
+
+    await wait_until(lambda: snapshot.is_fresh)
+
+
+async def test_snapshot_is_not_fresh_after_stop(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    await snapshot.stop()
+
+    assert not snapshot.is_fresh
+
+
+async def test_snapshot_goes_stale_without_successful_polls(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    snapshot = RevocationSnapshot(max_staleness=0.05, resync_interval=300.0)
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    # A listener stuck on a dead connection stops refreshing its liveness.
+    snapshot._alive_at -= 1.0  # pyright: ignore[reportPrivateUsage]
+
+    assert not snapshot.is_fresh
+    await snapshot.stop()
+
+
+# =============================================================================
+# REVOCATION SNAPSHOT SYNC TESTS
+# =============================================================================
+
+
+async def test_snapshot_loads_the_index_on_start(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await JwtBlacklist(fake_redis, snapshot=None).revoke("jti-1", int(time()) + 60)
+
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    assert "jti-1" in snapshot
+
+
+async def test_snapshot_receives_published_revocations(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    await JwtBlacklist(fake_redis, snapshot=None).revoke("jti-2", int(time()) + 60)
+
+    await wait_until(lambda: "jti-2" in snapshot)
+
+
+async def test_snapshot_backfills_keys_written_before_the_index(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await fake_redis.set(f"{BLACKLIST_PREFIX}legacy", "1", ex=60)
+
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    assert "legacy" in snapshot
+    assert len(snapshot) == 1
+
+
+async def test_snapshot_drops_expired_entries_on_resync(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await JwtBlacklist(fake_redis, snapshot=None).revoke("jti-3", int(time()) + 60)
+    await fake_redis.zadd("blacklist:index", {"expired": int(time()) - 60})
+
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    assert "jti-3" in snapshot
+    assert "expired" not in snapshot
+
+
+async def test_snapshot_is_not_fresh_without_replies_from_redis(
+    monkeypatch: pytest.MonkeyPatch, fake_redis: FakeAsyncRedis
+) -> None:
+    async def unanswered_ping(self: PubSub, message: Any = None) -> None:
+        pass
+
+    # A half-open connection: polls come back empty and PINGs get no reply.
+    monkeypatch.setattr(PubSub, "ping", unanswered_ping)
+    snapshot = RevocationSnapshot(max_staleness=0.2, resync_interval=300.0)
+    await snapshot.start(fake_redis)
+
+    await asyncio.sleep(0.3)
+    assert not snapshot.is_fresh
+
+    await JwtBlacklist(fake_redis, snapshot=None).revoke("jti", int(time()) + 60)
+    await wait_until(lambda: snapshot.is_fresh)
+    await snapshot.stop()
+
+
+# =============================================================================
+# REVOCATION MESSAGE TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("data", [b"jti:soon", b"no-separator", b"\xff:60", "jti:"])
+def test_apply_skips_malformed_messages(
+    snapshot: RevocationSnapshot, data: str | bytes
+) -> None:
+    snapshot._apply(data)  # pyright: ignore[reportPrivateUsage]
+
+    assert len(snapshot) == 0
+
+
+async def test_snapshot_keeps_listening_after_a_malformed_message(
+    snapshot: RevocationSnapshot, fake_redis: FakeAsyncRedis
+) -> None:
+    await snapshot.start(fake_redis)
+    await wait_until(lambda: snapshot.is_fresh)
+
+    await fake_redis.publish(  # pyright: ignore[reportUnknownMemberType]
+        REVOCATION_CHANNEL, "jti:not-a-timestamp"
+    )
+    await JwtBlacklist(fake_redis, snapshot=None).revoke("jti-4", int(time()) + 60)
+
+    await wait_until(lambda: "jti-4" in snapshot)
+    assert "jti" not in snapshot
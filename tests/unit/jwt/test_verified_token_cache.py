@@ -0,0 +1,131 @@
+from datetime import timedelta
+from time import time
+from typing import Any
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.adapters.jwt.blacklist import JwtBlacklist
+from app.adapters.jwt.cache import VerifiedTokenCache
+from app.adapters.jwt.exceptions import RevokedTokenError
+from app.adapters.jwt.factory import JwtFactory
+from app.adapters.jwt.providers import get_jwt_token_manager
+from app.adapters.jwt.verifier import JwtVerifier
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+SECRET_KEY = "test-secret"
+ALGORITHM = "HS256"
+SUBJECT = "access"
+
+
+def claims(exp: int, **extra: Any) -> dict[str, Any]:
+    return {"sub": SUBJECT, "jti": "jti", "iat": int(time()), "exp": exp, **extra}
+
+
+def create_token() -> str:
+    return JwtFactory.create_token(
+        claims={"id": "user"},
+        subject=SUBJECT,
+        secret_key=SECRET_KEY,
+        algorithm=ALGORITHM,
+        expires_in=timedelta(minutes=5),
+    )
+
+
+async def verify(verifier: JwtVerifier, token: str) -> dict[str, Any]:
+    return await verifier.verify_token(
+        token=token, expected_sub=SUBJECT, secret_key=SECRET_KEY, algorithm=ALGORITHM
+    )
+
+
+# =============================================================================
+# VERIFIED TOKEN CACHE TESTS
+# =============================================================================
+
+
+def test_get_returns_a_copy_of_the_cached_claims() -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    cached = claims(int(time()) + 60)
+    cache.set("token", cached)
+
+    hit = cache.get("token")
+    assert hit is not None
+    assert hit == cached
+    hit["sub"] = "tampered"
+
+    assert cache.get("token") == cached
+    assert cache.stats().hits == 2
+
+
+def test_get_evicts_expired_entries() -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    cache.set("token", claims(int(time()) - 1))
+
+    assert cache.get("token") is None
+    assert cache.stats().size == 0
+    assert cache.stats().misses == 1
+
+
+def test_set_evicts_the_least_recently_used_entry() -> None:
+    cache = VerifiedTokenCache(max_size=2)
+    exp = int(time()) + 60
+
+    cache.set("a", claims(exp))
+    cache.set("b", claims(exp))
+    assert cache.get("a") is not None
+    cache.set("c", claims(exp))
+
+    assert cache.stats().size == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_zero_max_size_disables_the_cache() -> None:
+    cache = VerifiedTokenCache(max_size=0)
+    cache.set("token", claims(int(time()) + 60))
+
+    assert cache.get("token") is None
+
+
+# =============================================================================
+# JWT VERIFIER TESTS
+# =============================================================================
+
+
+async def test_verifier_decodes_a_token_once(fake_redis: FakeAsyncRedis) -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    verifier = JwtVerifier(JwtBlacklist(fake_redis, snapshot=None), cache)
+    token = create_token()
+
+    first = await verify(verifier, token)
+    second = await verify(verifier, token)
+
+    assert first == second
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 1
+
+
+async def test_verifier_rejects_a_cached_token_once_revoked(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    blacklist = JwtBlacklist(fake_redis, snapshot=None)
+    verifier = JwtVerifier(blacklist, cache)
+    token = create_token()
+
+    verified = await verify(verifier, token)
+    await blacklist.revoke(verified["jti"], verified["exp"])
+
+    with pytest.raises(RevokedTokenError):
+        await verify(verifier, token)
+    assert cache.stats().hits == 1
+
+
+def test_token_manager_is_built_once_per_redis_client(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    assert get_jwt_token_manager(fake_redis) is get_jwt_token_manager(fake_redis)
@@ -0,0 +1,76 @@
+from typing import Any
+
+import pytest
+
+from app.adapters.email.renderer import BaseRenderer
+from app.adapters.messaging import celery_app as celery_module
+from app.adapters.messaging.celery_app import celery_app, celery_settings
+from app.adapters.messaging.tasks import send_email_batch_task, send_email_task
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+# Celery ships no type hints for its AMQP router.
+amqp: Any = celery_app.amqp
+
+
+def routed_queue(task_name: str) -> tuple[str, str]:
+    queue = amqp.router.route({}, task_name)["queue"]
+    return queue.name, queue.routing_key
+
+
+class StubRenderer(BaseRenderer):
+    def __init__(self) -> None:
+        self.preloaded = 0
+
+    def preload(self) -> None:
+        self.preloaded += 1
+
+
+# =============================================================================
+# CELERY ROUTING TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize("task", [send_email_task, send_email_batch_task])
+def test_email_tasks_route_to_email_queue(task: object):
+    name: str = getattr(task, "name")
+    queue, routing_key = routed_queue(name)
+
+    assert queue == celery_settings.EMAIL_QUEUE
+    assert routing_key == celery_settings.EMAIL_QUEUE
+
+
+def test_other_tasks_route_to_default_queue():
+    queue, routing_key = routed_queue("app.adapters.messaging.tasks.other.task")
+
+    assert queue == celery_settings.DEFAULT_QUEUE
+    assert routing_key == celery_settings.DEFAULT_QUEUE
+
+
+def test_queues_have_distinct_routing_keys():
+    routing_keys: list[str] = [queue.routing_key for queue in amqp.queues.values()]
+
+    assert len(set(routing_keys)) == len(routing_keys)
+
+
+def test_tasks_are_registered_and_eager_mode_follows_settings():
+    assert send_email_task.name in celery_app.tasks
+    assert send_email_batch_task.name in celery_app.tasks
+    assert celery_app.conf.task_always_eager is celery_settings.TASK_ALWAYS_EAGER
+
+
+# =============================================================================
+# WORKER SIGNAL TESTS
+# =============================================================================
+
+
+def test_worker_process_init_preloads_templates(monkeypatch: pytest.MonkeyPatch):
+    renderer = StubRenderer()
+    monkeypatch.setattr(celery_module, "get_renderer", lambda: renderer)
+
+    celery_module.preload_email_templates()
+
+    assert renderer.preloaded == 1
@@ -0,0 +1,162 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from jose import jwt
+
+from app.adapters.db.session import get_async_session
+from app.adapters.rate_limit import limiter
+from app.adapters.rate_limit.gcra import RedisRateLimiter
+from app.adapters.rate_limit.identity import (
+    UNKNOWN_ADDRESS,
+    UNKNOWN_SUBJECT,
+    remote_address,
+    token_subject,
+)
+from app.adapters.rate_limit.limiter import RateLimit, enforce_rate_limit
+from app.adapters.rate_limit.tiered import TieredRateLimiter
+from app.api.dependencies import get_command_bus
+from app.api.routers.auth import router
+from app.core.exc_handlers import register_exception_handlers
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class StubCommandBus:
+    """
+    Records dispatched commands and answers with a token pair.
+    """
+
+    def __init__(self) -> None:
+        self.dispatched: list[object] = []
+
+    async def dispatch(self, actor: object, command: object, session: object) -> Any:
+        self.dispatched.append(command)
+        return {
+            "access_token": "access",
+            "refresh_token": "refresh",
+            "token_type": "bearer",
+        }
+
+
+def login_form(email: str) -> dict[str, str]:
+    return {"username": email, "password": "password"}
+
+
+def refresh_body(user_id: str) -> dict[str, str]:
+    return {"refresh_token": jwt.encode({"id": user_id}, "secret")}
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def redis_limiter(monkeypatch: pytest.MonkeyPatch, fake_redis: FakeAsyncRedis):
+    # Every check goes to Redis, so the limits are exact.
+    monkeypatch.setattr(
+        limiter,
+        "rate_limiter",
+        TieredRateLimiter(
+            RedisRateLimiter(fake_redis),
+            local_share=0,
+            sync_interval=60.0,
+            max_keys=100,
+        ),
+    )
+
+
+@pytest.fixture
+def bus() -> StubCommandBus:
+    return StubCommandBus()
+
+
+@pytest.fixture
+async def client(bus: StubCommandBus) -> AsyncGenerator[AsyncClient, None]:
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+
+    async def no_session() -> AsyncGenerator[None, None]:
+        yield None
+
+    app.dependency_overrides[get_command_bus] = lambda: bus
+    app.dependency_overrides[get_async_session] = no_session
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+# =============================================================================
+# AUTH ROUTE RATE LIMIT TESTS
+# =============================================================================
+
+
+async def test_login_is_limited_per_ip_and_email(
+    client: AsyncClient, bus: StubCommandBus
+) -> None:
+    for _ in range(5):
+        response = await client.post("/auth/login", data=login_form("a@example.com"))
+        assert response.status_code == 200
+
+    throttled = await client.post("/auth/login", data=login_form("A@example.com"))
+    other = await client.post("/auth/login", data=login_form("b@example.com"))
+
+    assert throttled.status_code == 429
+    assert "Retry-After" in throttled.headers
+    assert other.status_code == 200
+    # The throttled login never reached the handler and its hasher.
+    assert len(bus.dispatched) == 6
+
+
+async def test_refresh_is_limited_per_token_subject(client: AsyncClient) -> None:
+    for _ in range(10):
+        response = await client.post("/auth/refresh", json=refresh_body("1"))
+        assert response.status_code == 200
+
+    throttled = await client.post("/auth/refresh", json=refresh_body("1"))
+    other = await client.post("/auth/refresh", json=refresh_body("2"))
+
+    assert throttled.status_code == 429
+    assert other.status_code == 200
+
+
+async def test_ip_limit_rejects_before_the_body_is_parsed(
+    client: AsyncClient, bus: StubCommandBus
+) -> None:
+    for _ in range(30):
+        await enforce_rate_limit(RateLimit.AUTH_IP, "/auth/login:127.0.0.1")
+
+    # A malformed form would be a 422 had FastAPI parsed it.
+    response = await client.post("/auth/login", content=b"\xff")
+
+    assert response.status_code == 429
+    assert bus.dispatched == []
+
+
+# =============================================================================
+# RATE LIMIT IDENTITY TESTS
+# =============================================================================
+
+
+def test_token_subject_reads_unverified_id() -> None:
+    token = jwt.encode({"id": "42"}, "any-key")
+
+    assert token_subject(token) == "42"
+
+
+@pytest.mark.parametrize("token", ["invalid", jwt.encode({"sub": "42"}, "key")])
+def test_token_subject_falls_back_to_anonymous(token: str) -> None:
+    assert token_subject(token) == UNKNOWN_SUBJECT
+
+
+def test_remote_address_reads_the_client() -> None:
+    assert remote_address({"type": "http", "client": ("10.0.0.1", 80)}) == "10.0.0.1"
+    assert remote_address({"type": "http", "client": None}) == UNKNOWN_ADDRESS
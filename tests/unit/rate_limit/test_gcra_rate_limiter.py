@@ -0,0 +1,95 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.adapters.rate_limit.gcra import RedisRateLimiter
+from app.adapters.rate_limit.policy import parse_rate_limit
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+FIVE_PER_MINUTE = parse_rate_limit("5/minute")
+
+
+@pytest.fixture
+def limiter(fake_redis: FakeAsyncRedis) -> RedisRateLimiter:
+    return RedisRateLimiter(fake_redis)
+
+
+# =============================================================================
+# GCRA HIT TESTS
+# =============================================================================
+
+
+async def test_burst_up_to_the_limit_is_admitted(limiter: RedisRateLimiter) -> None:
+    results = [await limiter.hit(FIVE_PER_MINUTE, "ip:1") for _ in range(5)]
+
+    assert all(result.allowed for result in results)
+    assert [result.remaining for result in results] == [4, 3, 2, 1, 0]
+
+
+async def test_hit_over_the_limit_is_denied_until_one_interval_passes(
+    limiter: RedisRateLimiter,
+) -> None:
+    for _ in range(5):
+        await limiter.hit(FIVE_PER_MINUTE, "ip:1")
+
+    denied = await limiter.hit(FIVE_PER_MINUTE, "ip:1")
+
+    assert not denied.allowed
+    assert denied.remaining == 0
+    assert 11.9 <= denied.retry_after <= 12.0
+    assert 59.9 <= denied.reset_after <= 60.0
+    assert denied.headers["Retry-After"] == "12"
+
+
+async def test_denied_hit_does_not_consume_quota(limiter: RedisRateLimiter) -> None:
+    for _ in range(5):
+        await limiter.hit(FIVE_PER_MINUTE, "ip:1")
+    await limiter.hit(FIVE_PER_MINUTE, "ip:1")
+
+    peek = await limiter.peek(FIVE_PER_MINUTE, "ip:1")
+
+    assert 59.9 <= peek.reset_after <= 60.0
+
+
+async def test_identities_have_separate_buckets(limiter: RedisRateLimiter) -> None:
+    for _ in range(5):
+        await limiter.hit(FIVE_PER_MINUTE, "ip:1")
+
+    assert (await limiter.hit(FIVE_PER_MINUTE, "ip:2")).allowed
+
+
+async def test_peek_does_not_consume_quota(limiter: RedisRateLimiter) -> None:
+    for _ in range(3):
+        result = await limiter.peek(FIVE_PER_MINUTE, "ip:1")
+        assert result.allowed
+        assert result.remaining == 5
+
+
+# =============================================================================
+# GCRA CONSUME MANY TESTS
+# =============================================================================
+
+
+async def test_consume_many_reports_every_key_in_one_call(
+    limiter: RedisRateLimiter,
+) -> None:
+    results = await limiter.consume_many(
+        [(FIVE_PER_MINUTE, "ip:1", 2), (FIVE_PER_MINUTE, "ip:2", 3)]
+    )
+
+    assert [result.allowed for result in results] == [True, True]
+    assert [result.remaining for result in results] == [3, 2]
+
+
+async def test_consume_many_partially_consumes_an_oversized_cost(
+    limiter: RedisRateLimiter,
+) -> None:
+    await limiter.hit(FIVE_PER_MINUTE, "ip:1", cost=3)
+
+    [result] = await limiter.consume_many([(FIVE_PER_MINUTE, "ip:1", 4)])
+
+    assert result.allowed
+    assert result.remaining == 0
+    assert not (await limiter.hit(FIVE_PER_MINUTE, "ip:1")).allowed
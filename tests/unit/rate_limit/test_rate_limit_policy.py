@@ -0,0 +1,39 @@
+import pytest
+
+from app.adapters.rate_limit.policy import RateLimitPolicy, parse_rate_limit
+
+# =============================================================================
+# PARSE RATE LIMIT TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    ("value", "limit", "period"),
+    [
+        ("5/minute", 5, 60),
+        ("5/minutes", 5, 60),
+        ("100 per hour", 100, 3600),
+        ("10/5 minutes", 10, 300),
+        ("1/second", 1, 1),
+        ("1000/DAY", 1000, 86400),
+        ("  3 / 2 seconds  ", 3, 2),
+    ],
+)
+def test_parse_rate_limit(value: str, limit: int, period: int) -> None:
+    assert parse_rate_limit(value) == RateLimitPolicy(
+        name=value, limit=limit, period=period
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "five/minute", "5/fortnight", "0/minute", "-1/minute", "5 minute", "5/"],
+)
+def test_parse_rate_limit_rejects_invalid_values(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_rate_limit(value)
+
+
+def test_emission_interval_spreads_the_period_over_the_limit() -> None:
+    assert parse_rate_limit("5/minute").emission_interval_ms == 12_000
+    assert parse_rate_limit("5000/second").emission_interval_ms == 1
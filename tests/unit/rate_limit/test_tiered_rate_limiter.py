@@ -0,0 +1,135 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.adapters.rate_limit.gcra import RedisRateLimiter
+from app.adapters.rate_limit.policy import parse_rate_limit
+from app.adapters.rate_limit.tiered import TieredRateLimiter
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+TEN_PER_MINUTE = parse_rate_limit("10/minute")
+
+
+@pytest.fixture
+def backend(fake_redis: FakeAsyncRedis) -> RedisRateLimiter:
+    return RedisRateLimiter(fake_redis)
+
+
+def build_limiter(
+    backend: RedisRateLimiter, local_share: float = 0.5
+) -> TieredRateLimiter:
+    return TieredRateLimiter(
+        backend, local_share=local_share, sync_interval=60.0, max_keys=100
+    )
+
+
+# =============================================================================
+# TIERED RATE LIMITER LOCAL TIER TESTS
+# =============================================================================
+
+
+async def test_first_hit_is_checked_in_redis(backend: RedisRateLimiter) -> None:
+    limiter = build_limiter(backend)
+
+    result = await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    assert result.allowed
+    assert result.remaining == 9
+    assert (await backend.peek(TEN_PER_MINUTE, "ip:1")).remaining == 9
+
+
+async def test_local_hits_do_not_touch_redis(backend: RedisRateLimiter) -> None:
+    limiter = build_limiter(backend)
+    await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    for _ in range(4):
+        assert (await limiter.hit(TEN_PER_MINUTE, "ip:1")).allowed
+
+    assert (await backend.peek(TEN_PER_MINUTE, "ip:1")).remaining == 9
+
+
+async def test_local_hits_report_global_remaining_and_reset(
+    backend: RedisRateLimiter,
+) -> None:
+    limiter = build_limiter(backend)
+    await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    first = await limiter.hit(TEN_PER_MINUTE, "ip:1")
+    second = await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    # Each 10/minute hit costs 6 s of the bucket, as Redis would report.
+    assert (first.remaining, second.remaining) == (8, 7)
+    assert 11.9 <= first.reset_after <= 12.0
+    assert 17.9 <= second.reset_after <= 18.0
+
+
+async def test_exhausted_local_share_falls_back_to_redis(
+    backend: RedisRateLimiter,
+) -> None:
+    limiter = build_limiter(backend)
+    for _ in range(5):
+        await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    result = await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    assert result.allowed
+    assert (await backend.peek(TEN_PER_MINUTE, "ip:1")).remaining == 8
+
+
+async def test_zero_local_share_sends_every_hit_to_redis(
+    backend: RedisRateLimiter,
+) -> None:
+    limiter = build_limiter(backend, local_share=0.0)
+
+    for _ in range(3):
+        await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    assert (await backend.peek(TEN_PER_MINUTE, "ip:1")).remaining == 7
+
+
+async def test_rejected_key_is_blocked_locally(
+    backend: RedisRateLimiter, fake_redis: FakeAsyncRedis
+) -> None:
+    limiter = build_limiter(backend, local_share=0.0)
+    for _ in range(10):
+        await limiter.hit(TEN_PER_MINUTE, "ip:1")
+    assert not (await limiter.hit(TEN_PER_MINUTE, "ip:1")).allowed
+
+    # Even with the Redis bucket gone, the local block holds.
+    await fake_redis.delete(backend.key(TEN_PER_MINUTE, "ip:1"))
+    blocked = await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    assert not blocked.allowed
+    assert blocked.remaining == 0
+    assert 0 < blocked.retry_after <= 6.0
+
+
+# =============================================================================
+# TIERED RATE LIMITER RECONCILE TESTS
+# =============================================================================
+
+
+async def test_reconcile_reports_local_hits_to_redis(
+    backend: RedisRateLimiter,
+) -> None:
+    limiter = build_limiter(backend)
+    for _ in range(4):
+        await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    await limiter.reconcile()
+
+    assert (await backend.peek(TEN_PER_MINUTE, "ip:1")).remaining == 6
+    assert (await limiter.hit(TEN_PER_MINUTE, "ip:1")).remaining == 5
+
+
+async def test_stop_flushes_pending_hits(backend: RedisRateLimiter) -> None:
+    limiter = build_limiter(backend)
+    await limiter.start()
+    for _ in range(3):
+        await limiter.hit(TEN_PER_MINUTE, "ip:1")
+
+    await limiter.stop()
+
+    assert (await backend.peek(TEN_PER_MINUTE, "ip:1")).remaining == 7
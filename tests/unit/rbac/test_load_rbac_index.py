@@ -0,0 +1,72 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.models import Permission, Role, RolePermission
+from app.shared.enums.permission import PermissionEnum
+from app.shared.rbac.index import RbacIndex
+from app.shared.rbac.refresher import load_rbac_index
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+async def seed(session: AsyncSession) -> None:
+    read = Permission(code=PermissionEnum.USER_READ, description="Read users.")
+    list_ = Permission(code=PermissionEnum.USER_LIST, description="List users.")
+    reader = Role(name="reader", description="Reads users.")
+    empty = Role(name="empty", description="Has no permissions.")
+    session.add_all([read, list_, reader, empty])
+    await session.flush()
+
+    session.add_all(
+        [
+            RolePermission(role_id=reader.id, permission_id=read.id),
+            RolePermission(role_id=reader.id, permission_id=list_.id),
+        ]
+    )
+    await session.flush()
+
+
+# =============================================================================
+# LOAD RBAC INDEX TESTS
+# =============================================================================
+
+
+async def test_load_rbac_index_compiles_role_permissions(
+    async_session: AsyncSession,
+) -> None:
+    await seed(async_session)
+    index = RbacIndex()
+
+    await load_rbac_index(async_session, index)
+
+    assert index.version == 1
+    assert index.allows({"reader"}, PermissionEnum.USER_READ)
+    assert index.allows({"reader"}, PermissionEnum.USER_LIST)
+    assert not index.allows({"reader"}, PermissionEnum.USER_DELETE)
+
+
+async def test_load_rbac_index_keeps_roles_without_permissions(
+    async_session: AsyncSession,
+) -> None:
+    await seed(async_session)
+    index = RbacIndex()
+
+    await load_rbac_index(async_session, index)
+
+    assert index.role_mask("empty") == 0
+    assert not index.allows({"empty"}, PermissionEnum.USER_READ)
+
+
+async def test_load_rbac_index_replaces_the_previous_matrix(
+    async_session: AsyncSession,
+) -> None:
+    index = RbacIndex()
+    index.replace({"reader": [PermissionEnum.USER_DELETE]})
+    await seed(async_session)
+
+    await load_rbac_index(async_session, index)
+
+    assert index.version == 2
+    assert not index.allows({"reader"}, PermissionEnum.USER_DELETE)
+    assert index.allows({"reader"}, PermissionEnum.USER_READ)
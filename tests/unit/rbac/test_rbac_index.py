@@ -0,0 +1,84 @@
+from app.shared.enums.permission import PermissionEnum
+from app.shared.rbac.index import PERMISSION_BITS, RbacIndex
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+def build_index() -> RbacIndex:
+    index = RbacIndex()
+    index.replace(
+        {
+            "reader": [PermissionEnum.USER_READ, PermissionEnum.USER_LIST],
+            "moderator": [PermissionEnum.USER_SUSPEND],
+            "empty": [],
+        }
+    )
+    return index
+
+
+# =============================================================================
+# RBAC INDEX TESTS
+# =============================================================================
+
+
+def test_every_permission_owns_a_distinct_bit() -> None:
+    bits = list(PERMISSION_BITS.values())
+
+    assert len(bits) == len(PermissionEnum)
+    assert len(set(bits)) == len(bits)
+    assert all(bit and bit & (bit - 1) == 0 for bit in bits)
+
+
+def test_new_index_is_not_loaded() -> None:
+    index = RbacIndex()
+
+    assert not index.is_loaded
+    assert not index.allows({"reader"}, PermissionEnum.USER_READ)
+
+
+def test_role_permissions_are_allowed() -> None:
+    index = build_index()
+
+    assert index.is_loaded
+    assert index.allows({"reader"}, PermissionEnum.USER_READ)
+    assert index.allows({"reader"}, PermissionEnum.USER_LIST)
+    assert not index.allows({"reader"}, PermissionEnum.USER_DELETE)
+
+
+def test_permissions_of_all_roles_are_combined() -> None:
+    index = build_index()
+
+    assert index.allows({"reader", "moderator"}, PermissionEnum.USER_SUSPEND)
+    assert index.allows({"reader", "moderator"}, PermissionEnum.USER_READ)
+    assert not index.allows({"moderator"}, PermissionEnum.USER_READ)
+
+
+def test_unknown_and_empty_roles_allow_nothing() -> None:
+    index = build_index()
+
+    assert index.role_mask("empty") == 0
+    assert index.role_mask("unknown") == 0
+    assert not index.allows({"unknown", "empty"}, PermissionEnum.USER_READ)
+    assert not index.allows(set(), PermissionEnum.USER_READ)
+
+
+def test_mask_for_is_independent_of_role_order() -> None:
+    index = build_index()
+
+    assert index.mask_for(["reader", "moderator"]) == index.mask_for(
+        ["moderator", "reader"]
+    )
+
+
+def test_replace_bumps_the_version_and_drops_memoised_masks() -> None:
+    index = build_index()
+    assert index.allows({"reader"}, PermissionEnum.USER_READ)
+
+    index.replace({"reader": [PermissionEnum.USER_DELETE]})
+
+    assert index.version == 2
+    assert not index.allows({"reader"}, PermissionEnum.USER_READ)
+    assert index.allows({"reader"}, PermissionEnum.USER_DELETE)
+    assert not index.allows({"moderator"}, PermissionEnum.USER_SUSPEND)
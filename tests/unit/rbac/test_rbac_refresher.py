@@ -0,0 +1,116 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import ConnectionError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.shared.rbac.index import RbacIndex
+from app.shared.rbac.refresher import RBAC_VERSION_KEY, RbacIndexRefresher
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+class FlakyRedis:
+    """
+    Stand-in for the Redis client whose `GET` fails while `down` is set.
+    """
+
+    def __init__(self, redis: FakeAsyncRedis) -> None:
+        self.redis = redis
+        self.down = True
+        self.calls = 0
+
+    async def get(self, key: str) -> bytes | None:
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("Redis is down.")
+        return await self.redis.get(key)
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was not met in time.")
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+def session_factory(async_engine: AsyncEngine) -> Callable[[], AsyncSession]:
+    return async_sessionmaker(bind=async_engine, class_=AsyncSession)
+
+
+@pytest.fixture
+async def refresher() -> AsyncGenerator[RbacIndexRefresher, None]:
+    refresher = RbacIndexRefresher(poll_interval=0.01, index=RbacIndex())
+    yield refresher
+    await refresher.stop()
+
+
+# =============================================================================
+# RBAC REFRESHER FAILURE TESTS
+# =============================================================================
+
+
+async def test_start_survives_redis_being_down(
+    refresher: RbacIndexRefresher,
+    fake_redis: FakeAsyncRedis,
+    session_factory: Callable[[], AsyncSession],
+) -> None:
+    redis = FlakyRedis(fake_redis)
+
+    await refresher.start(redis, session_factory)  # type: ignore[arg-type]
+
+    assert not refresher.index.is_loaded
+    assert refresher._task is not None  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_failing_refreshes_back_off_instead_of_spinning(
+    refresher: RbacIndexRefresher,
+    fake_redis: FakeAsyncRedis,
+    session_factory: Callable[[], AsyncSession],
+) -> None:
+    redis = FlakyRedis(fake_redis)
+    await refresher.start(redis, session_factory)  # type: ignore[arg-type]
+
+    refresher.mark_stale()
+    await asyncio.sleep(0.3)
+
+    # 0.01s doubling: at most ~5 retries in 0.3s, a spin would be thousands.
+    assert 2 <= redis.calls <= 8
+    task = refresher._task  # pyright: ignore[reportPrivateUsage]
+    assert task is not None and not task.done()
+
+
+async def test_refresh_recovers_after_an_unexpected_error(
+    refresher: RbacIndexRefresher,
+    fake_redis: FakeAsyncRedis,
+    session_factory: Callable[[], AsyncSession],
+) -> None:
+    failures: list[Exception] = []
+
+    def flaky_session_factory() -> AsyncSession:
+        if failures:
+            raise failures.pop()
+        return session_factory()
+
+    redis = FlakyRedis(fake_redis)
+    redis.down = False
+    await refresher.start(redis, flaky_session_factory)  # type: ignore[arg-type]
+    assert refresher.index.version == 1
+
+    failures.append(RuntimeError("Unexpected."))
+    await fake_redis.set(RBAC_VERSION_KEY, "1")
+
+    await wait_until(lambda: refresher.index.version == 2)
+    assert not failures
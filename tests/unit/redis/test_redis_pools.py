@@ -0,0 +1,71 @@
+import pytest
+import redis
+import redis.asyncio as aioredis
+from fakeredis.aioredis import FakeAsyncRedisConnection
+
+from app.adapters.rate_limit.limiter import redis_rate_limiter
+from app.adapters.redis import client
+from app.adapters.redis.client import (
+    async_pool,
+    async_redis,
+    get_async_redis,
+    get_redis_pool_stats,
+    sync_pool,
+    sync_redis,
+)
+from app.core.config import get_settings
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+redis_settings = get_settings().redis
+
+
+# =============================================================================
+# SHARED POOL TESTS
+# =============================================================================
+
+
+def test_clients_use_the_shared_blocking_pools() -> None:
+    assert isinstance(async_pool, aioredis.BlockingConnectionPool)
+    assert isinstance(sync_pool, redis.BlockingConnectionPool)
+    assert async_redis.connection_pool is async_pool
+    assert sync_redis.connection_pool is sync_pool
+
+
+def test_pools_are_sized_from_settings() -> None:
+    assert async_pool.max_connections == redis_settings.MAX_CONNECTIONS
+    assert sync_pool.max_connections == redis_settings.SYNC_MAX_CONNECTIONS
+    assert async_pool.timeout == redis_settings.POOL_TIMEOUT
+
+
+async def test_async_consumers_share_one_client() -> None:
+    dependency = get_async_redis()
+
+    assert await anext(dependency) is async_redis
+    assert redis_rate_limiter.redis is async_redis
+    await dependency.aclose()
+
+
+# =============================================================================
+# POOL STATS TESTS
+# =============================================================================
+
+
+async def test_pool_stats_count_connections_in_use_and_idle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = aioredis.BlockingConnectionPool(
+        connection_class=FakeAsyncRedisConnection, max_connections=3, timeout=0.1
+    )
+    monkeypatch.setattr(client, "async_pool", pool)
+
+    connection = await pool.get_connection()  # pyright: ignore[reportUnknownMemberType]
+    in_use = get_redis_pool_stats()
+    await pool.release(connection)
+    idle = get_redis_pool_stats()
+    await pool.disconnect()
+
+    assert (in_use.max_connections, in_use.created, in_use.in_use) == (3, 1, 1)
+    assert (idle.created, idle.in_use, idle.idle) == (1, 0, 1)
@@ -0,0 +1,120 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from threading import Event
+
+import pytest
+
+from app.adapters.security.async_hashing import AsyncHasher
+from app.adapters.security.exceptions import HasherSaturatedError
+
+# =============================================================================
+# Blocking Stub Hasher.
+# =============================================================================
+
+
+class GatedHasher:
+    """
+    Hasher whose calls block until the test opens the gate.
+    """
+
+    def __init__(self) -> None:
+        self.gate = Event()
+
+    def hash(self, value: str) -> str:
+        self.gate.wait(timeout=5)
+        return f"hashed:{value}"
+
+    def verify(self, value: str, hashed: str) -> bool:
+        self.gate.wait(timeout=5)
+        return hashed == f"hashed:{value}"
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+def hasher() -> GatedHasher:
+    return GatedHasher()
+
+
+@pytest.fixture
+async def async_hasher(hasher: GatedHasher) -> AsyncGenerator[AsyncHasher, None]:
+    async_hasher = AsyncHasher(hasher, max_workers=1, max_pending=2)
+    yield async_hasher
+    hasher.gate.set()
+    async_hasher.shutdown()
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was not met in time.")
+
+
+# =============================================================================
+# ASYNC HASHER TESTS
+# =============================================================================
+
+
+async def test_hash_and_verify_run_on_the_pool(
+    hasher: GatedHasher, async_hasher: AsyncHasher
+) -> None:
+    hasher.gate.set()
+
+    hashed = await async_hasher.hash("secret")
+
+    assert hashed == "hashed:secret"
+    assert await async_hasher.verify("secret", hashed)
+    assert async_hasher.stats().completed == 2
+
+
+async def test_admission_is_rejected_when_the_pool_is_full(
+    hasher: GatedHasher, async_hasher: AsyncHasher
+) -> None:
+    running = asyncio.create_task(async_hasher.hash("a"))
+    queued = asyncio.create_task(async_hasher.hash("b"))
+    await wait_until(lambda: async_hasher.stats().running == 1)
+
+    with pytest.raises(HasherSaturatedError):
+        await async_hasher.hash("c")
+
+    stats = async_hasher.stats()
+    assert stats.running == 1
+    assert stats.queued == 1
+    assert stats.rejected == 1
+
+    hasher.gate.set()
+    assert await asyncio.gather(running, queued) == ["hashed:a", "hashed:b"]
+
+
+async def test_stats_counters_move_as_calls_complete(
+    hasher: GatedHasher, async_hasher: AsyncHasher
+) -> None:
+    assert async_hasher.stats().completed == 0
+
+    hasher.gate.set()
+    await asyncio.gather(*(async_hasher.hash(str(i)) for i in range(2)))
+    await wait_until(lambda: async_hasher.stats().queued == 0)
+
+    stats = async_hasher.stats()
+    assert stats.workers == 1
+    assert stats.max_pending == 2
+    assert stats.completed == 2
+    assert stats.running == 0
+    assert stats.rejected == 0
+    assert stats.avg_run_ms >= 0.0
+    assert stats.max_run_ms >= stats.avg_run_ms
+
+
+async def test_a_slot_is_freed_once_a_call_finishes(
+    hasher: GatedHasher, async_hasher: AsyncHasher
+) -> None:
+    hasher.gate.set()
+    await asyncio.gather(async_hasher.hash("a"), async_hasher.hash("b"))
+    await wait_until(lambda: async_hasher.stats().queued == 0)
+
+    assert await async_hasher.hash("c") == "hashed:c"
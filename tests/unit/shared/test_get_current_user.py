@@ -0,0 +1,78 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.models import User
+from app.adapters.db.session import get_async_session, get_read_session
+from app.adapters.jwt.manager import TokenTypeEnum
+from app.adapters.jwt.providers import get_jwt_token_manager
+from app.adapters.redis.client import get_async_redis
+from app.shared.dependencies.get_current_user import get_current_user
+from app.shared.principal.schemas import Principal
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture
+async def client(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> AsyncGenerator[AsyncClient, None]:
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(  # pyright: ignore[reportUnusedFunction]
+        principal: Principal = Depends(get_current_user),
+    ) -> dict[str, Any]:
+        return {"id": str(principal.id)}
+
+    async def primary_session() -> AsyncGenerator[AsyncSession, None]:
+        yield async_session
+
+    async def replica_session() -> AsyncGenerator[AsyncSession, None]:
+        raise AssertionError("get_current_user must not read from a replica.")
+        yield async_session
+
+    async def test_redis() -> AsyncGenerator[FakeAsyncRedis, None]:
+        yield fake_redis
+
+    app.dependency_overrides[get_async_session] = primary_session
+    app.dependency_overrides[get_read_session] = replica_session
+    app.dependency_overrides[get_async_redis] = test_redis
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+# =============================================================================
+# GET CURRENT USER TESTS
+# =============================================================================
+
+
+async def test_principal_is_loaded_from_the_primary(
+    client: AsyncClient, async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    user = User(email="current@example.com", password_hash="hashed")
+    async_session.add(user)
+    await async_session.flush()
+    token = get_jwt_token_manager(fake_redis).create_token(
+        TokenTypeEnum.ACCESS, {"id": str(user.id)}
+    )
+
+    response = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.json() == {"id": str(user.id)}
+
+
+async def test_invalid_token_is_rejected(client: AsyncClient) -> None:
+    response = await client.get("/me", headers={"Authorization": "Bearer invalid"})
+
+    assert response.status_code == 401
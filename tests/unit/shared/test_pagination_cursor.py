@@ -0,0 +1,71 @@
+import json
+from base64 import urlsafe_b64encode
+from datetime import datetime, timezone
+
+import pytest
+from uuid6 import uuid7
+
+from app.shared.pagination.cursor import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+def encode_raw(value: object) -> str:
+    return urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+
+# =============================================================================
+# CURSOR ROUND TRIP TESTS
+# =============================================================================
+
+
+def test_decode_returns_the_encoded_position() -> None:
+    created_at = datetime(2026, 10, 18, 10, 12, 31, 204118, tzinfo=timezone.utc)
+    user_id = uuid7()
+
+    assert decode_cursor(encode_cursor(created_at, user_id)) == (created_at, user_id)
+
+
+def test_cursor_is_url_safe_without_padding() -> None:
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid7())
+
+    assert "=" not in cursor
+    assert set(cursor) <= set(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    )
+
+
+# =============================================================================
+# CURSOR VALIDATION TESTS
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        "!!!!",
+        encode_raw({"created_at": "2026-10-18T10:12:31", "id": "x"}),
+        encode_raw(["2026-10-18T10:12:31"]),
+        encode_raw(["yesterday", str(uuid7())]),
+        encode_raw(["2026-10-18T10:12:31", "not-a-uuid"]),
+        encode_raw([None, None]),
+    ],
+)
+def test_malformed_cursors_are_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_truncated_cursor_is_rejected() -> None:
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid7())
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor[:-5])
@@ -0,0 +1,185 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.models import User
+from app.shared.enums.user import UserStatusEnum
+from app.shared.principal import invalidation
+from app.shared.principal.cache import get_principal_cache, role_tag
+from app.shared.principal.invalidation import (
+    SESSION_INFO_KEY,
+    PendingInvalidation,
+    invalidate_principals,
+)
+from app.shared.principal.schemas import Principal
+from app.shared.rbac.refresher import RBAC_VERSION_KEY
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+def principal(*role_ids: UUID) -> Principal:
+    return Principal(
+        id=uuid4(),
+        status=UserStatusEnum.ACTIVE,
+        role_ids=set(role_ids),
+        role_names=set(),
+        permission_codes=set(),
+    )
+
+
+def pending(**changes: object) -> PendingInvalidation:
+    record = PendingInvalidation()
+    for name, value in changes.items():
+        setattr(record, name, value)
+    return record
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def use_fake_redis(monkeypatch: pytest.MonkeyPatch, fake_redis: FakeAsyncRedis) -> None:
+    monkeypatch.setattr(invalidation, "async_redis", fake_redis)
+
+
+# =============================================================================
+# PRINCIPAL CACHE TESTS
+# =============================================================================
+
+
+def test_principal_cache_is_built_once_per_redis_client(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    assert get_principal_cache(fake_redis) is get_principal_cache(fake_redis)
+
+
+async def test_principal_cache_loads_each_principal_once(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    cache = get_principal_cache(fake_redis)
+    cached = principal(uuid4())
+    loads: list[Principal] = []
+
+    async def load() -> Principal:
+        loads.append(cached)
+        return cached
+
+    assert await cache.get_or_set(str(cached.id), load) == cached
+    assert await cache.get_or_set(str(cached.id), load) == cached
+    assert len(loads) == 1
+
+
+def test_principals_are_tagged_with_their_roles(fake_redis: FakeAsyncRedis) -> None:
+    role_id = uuid4()
+
+    tags = get_principal_cache(fake_redis).tags_for(principal(role_id))
+
+    assert list(tags) == [f"role:{role_id}"]
+
+
+# =============================================================================
+# PRINCIPAL INVALIDATION TESTS
+# =============================================================================
+
+
+async def test_role_change_invalidates_principals_holding_the_role(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    cache = get_principal_cache(fake_redis)
+    role_id = uuid4()
+    member, other = principal(role_id), principal(uuid4())
+    await cache.set_many({str(member.id): member, str(other.id): other})
+
+    await invalidate_principals(pending(role_ids={role_id}, rbac_changed=True))
+
+    assert await cache.get(str(member.id)) is None
+    assert await cache.get(str(other.id)) == other
+    assert not await fake_redis.exists(
+        cache._tag_key(role_tag(role_id))  # pyright: ignore[reportPrivateUsage]
+    )
+
+
+async def test_permission_change_bumps_the_cache_generation(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    cache = get_principal_cache(fake_redis)
+    cached = principal(uuid4())
+    await cache.set(str(cached.id), cached)
+
+    await invalidate_principals(pending(permissions_changed=True, rbac_changed=True))
+
+    generation_key = cache._generation_key()  # pyright: ignore[reportPrivateUsage]
+    assert await fake_redis.get(generation_key) == b"1"
+    assert await fake_redis.get(RBAC_VERSION_KEY) == b"1"
+    assert await cache.get(str(cached.id)) is None
+
+
+async def test_user_change_invalidates_only_that_user(
+    fake_redis: FakeAsyncRedis,
+) -> None:
+    cache = get_principal_cache(fake_redis)
+    changed, other = principal(), principal()
+    await cache.set_many({str(changed.id): changed, str(other.id): other})
+
+    await invalidate_principals(pending(user_ids={changed.id}))
+
+    assert await cache.get(str(changed.id)) is None
+    assert await cache.get(str(other.id)) == other
+
+
+# =============================================================================
+# SESSION LISTENER TESTS
+# =============================================================================
+
+
+@pytest.fixture
+def scheduled(monkeypatch: pytest.MonkeyPatch) -> list[PendingInvalidation]:
+    calls: list[PendingInvalidation] = []
+
+    async def record(pending: PendingInvalidation) -> None:
+        calls.append(pending)
+
+    monkeypatch.setattr(invalidation, "invalidate_principals", record)
+    return calls
+
+
+def new_user() -> User:
+    return User(email=f"{uuid4().hex}@example.com", password_hash="hash")
+
+
+async def test_flushed_user_changes_are_scheduled_after_commit(
+    async_session: AsyncSession, scheduled: list[PendingInvalidation]
+) -> None:
+    user = new_user()
+    async_session.add(user)
+    await async_session.flush()
+
+    # What `after_commit` runs, without committing the shared test database.
+    invalidation._dispatch(  # pyright: ignore[reportPrivateUsage]
+        async_session.sync_session
+    )
+    tasks = invalidation._background_tasks  # pyright: ignore[reportPrivateUsage]
+    await asyncio.gather(*tasks)
+
+    assert [pending.user_ids for pending in scheduled] == [{user.id}]
+
+
+async def test_rollback_schedules_nothing(
+    async_session: AsyncSession, scheduled: list[PendingInvalidation]
+) -> None:
+    async_session.add(new_user())
+    await async_session.flush()
+    assert SESSION_INFO_KEY in async_session.info
+
+    await async_session.rollback()
+
+    assert SESSION_INFO_KEY not in async_session.info
+    assert not invalidation._background_tasks  # pyright: ignore[reportPrivateUsage]
+    assert scheduled == []
@@ -0,0 +1,112 @@
+import csv
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.models.user import User
+from app.modules.user.handlers import export
+from app.modules.user.handlers.export import ExportUserHandler
+from app.modules.user.queries.export import ExportFormatEnum, ExportUserQuery
+from app.shared.datetime.utc_now import get_utc_now
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+HEADER = ["id", "email", "status", "created_at", "updated_at"]
+
+
+async def seed_users(session: AsyncSession, count: int) -> list[User]:
+    start = get_utc_now()
+    users = [
+        User(
+            email=f"user{i}@example.com",
+            password_hash="hashed",
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+async def export_chunks(
+    session: AsyncSession, redis: FakeAsyncRedis, format: ExportFormatEnum
+) -> list[str]:
+    handler = ExportUserHandler(redis)
+    chunks = await handler(ExportUserQuery(format=format), session)
+    return [chunk async for chunk in chunks]
+
+
+# =============================================================================
+# Fixtures.
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+
+
+# =============================================================================
+# NDJSON EXPORT TESTS
+# =============================================================================
+
+
+async def test_ndjson_export_emits_one_chunk_per_batch(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    users = await seed_users(async_session, 5)
+
+    chunks = await export_chunks(async_session, fake_redis, ExportFormatEnum.NDJSON)
+
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert [row["id"] for row in rows] == [str(user.id) for user in users]
+    assert rows[0] == {
+        "id": str(users[0].id),
+        "email": "user0@example.com",
+        "status": users[0].status.value,
+        "created_at": rows[0]["created_at"],
+        "updated_at": rows[0]["updated_at"],
+    }
+
+
+async def test_ndjson_export_of_an_empty_table_is_empty(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    chunks = await export_chunks(async_session, fake_redis, ExportFormatEnum.NDJSON)
+
+    assert "".join(chunks) == ""
+
+
+# =============================================================================
+# CSV EXPORT TESTS
+# =============================================================================
+
+
+async def test_csv_export_starts_with_the_header_row(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    chunks = await export_chunks(async_session, fake_redis, ExportFormatEnum.CSV)
+
+    assert chunks == [",".join(HEADER) + "\r\n"]
+
+
+async def test_csv_export_emits_one_chunk_per_batch(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    users = await seed_users(async_session, 5)
+
+    chunks = await export_chunks(async_session, fake_redis, ExportFormatEnum.CSV)
+
+    assert [chunk.count("\r\n") for chunk in chunks] == [1, 2, 2, 1]
+    rows = list(csv.reader(StringIO("".join(chunks))))
+    assert rows[0] == HEADER
+    assert [row[0] for row in rows[1:]] == [str(user.id) for user in users]
+    assert rows[1][1:3] == ["user0@example.com", users[0].status.value]
@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.adapters.db.loading import relationship_options
+from app.adapters.db.models.user import User
+from app.modules.user.handlers.list import ListUserHandler
+from app.modules.user.queries.list import ListUserQuery
+from app.shared.datetime.utc_now import get_utc_now
+
+# =============================================================================
+# Helpers.
+# =============================================================================
+
+
+async def seed_users(session: AsyncSession, count: int) -> list[User]:
+    start = get_utc_now()
+    users = [
+        User(
+            email=f"user{i}@example.com",
+            password_hash="hashed",
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+    session.add_all(users)
+    await session.flush()
+    return users
+
+
+# =============================================================================
+# LIST USER PROJECTION TESTS
+# =============================================================================
+
+
+async def test_default_listing_selects_only_the_listed_columns(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    users = await seed_users(async_session, 3)
+    handler = ListUserHandler(fake_redis)
+
+    page = await handler(ListUserQuery(limit=2), async_session)
+
+    assert [row["id"] for row in page.items] == [user.id for user in users[:2]]
+    assert set(page.items[0]) == {"id", "email", "status", "created_at", "updated_at"}
+    assert page.next_cursor is not None
+
+
+async def test_listing_follows_the_cursor_of_the_projection(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    users = await seed_users(async_session, 3)
+    handler = ListUserHandler(fake_redis)
+
+    first = await handler(ListUserQuery(limit=2), async_session)
+    second = await handler(
+        ListUserQuery(limit=2, after=first.next_cursor), async_session
+    )
+
+    assert [row["id"] for row in second.items] == [users[2].id]
+    assert second.next_cursor is None
+
+
+async def test_included_relationships_are_loaded_on_entities(
+    async_session: AsyncSession, fake_redis: FakeAsyncRedis
+) -> None:
+    await seed_users(async_session, 1)
+    async_session.expunge_all()
+    handler = ListUserHandler(fake_redis)
+
+    page = await handler(
+        ListUserQuery(limit=10, include=("user_roles",)), async_session
+    )
+
+    assert isinstance(page.items[0], User)
+    assert page.items[0].user_roles == []
+
+
+# =============================================================================
+# RELATIONSHIP OPTIONS TESTS
+# =============================================================================
+
+
+async def test_relationships_left_out_raise_instead_of_loading(
+    async_session: AsyncSession,
+) -> None:
+    await seed_users(async_session, 1)
+    async_session.expunge_all()
+
+    stmt = select(User).options(*relationship_options(User))
+    user = (await async_session.exec(stmt)).one()
+
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        _ = user.user_roles